@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Reading columns from text logs and columnar files
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import tempfile
+import timeit
+
+# Local app modules
+from applogging.entry import parse_many
+from applogging.columnar import ColumnarFile, export_columnar
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+LINES = 200000
+REPEAT = 3
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+COLUMNS = [ "severity", "timestamp" ]
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# text
+#
+def text(filename: str) -> int:
+    '''
+    Decode the columns from the log file
+
+    Args:
+        filename (str): The log file
+
+    Returns:
+        int: The number of entries read
+
+    Raises:
+        None
+    '''
+    with open(filename, "r") as f:
+        return len(parse_many(f, columns=COLUMNS)["severity"])
+
+
+#
+# columnar
+#
+def columnar(filename: str) -> int:
+    '''
+    Read the columns from the columnar file
+
+    Args:
+        filename (str): The columnar file
+
+    Returns:
+        int: The number of entries read
+
+    Raises:
+        None
+    '''
+    with ColumnarFile(filename) as _file:
+        return len(_file.read(columns=COLUMNS)["severity"])
+
+
+#
+# columnar_encoded
+#
+def columnar_encoded(filename: str) -> int:
+    '''
+    Read the columns from the columnar file, leaving the severity encoded
+
+    Args:
+        filename (str): The columnar file
+
+    Returns:
+        int: The number of entries read
+
+    Raises:
+        None
+    '''
+    with ColumnarFile(filename) as _file:
+        return len(_file.read(columns=COLUMNS, encode=True)["severity"])
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    with tempfile.TemporaryDirectory() as _dir:
+        _filename = os.path.join(_dir, "bench.log")
+        with open(_filename, "w") as f:
+            for _count in range(LINES):
+                f.write(
+                    f"2025-01-01 10:{_count // 60 % 60:02d}:"
+                    f"{_count % 60:02d},000: [AppLogging] "
+                    f"[{SEVERITIES[_count % len(SEVERITIES)]}] "
+                    f"Message number {_count}\n"
+                )
+
+        _output = os.path.join(_dir, "bench.col")
+        _time = min(timeit.repeat(
+            lambda: export_columnar(_filename, _output), number=1, repeat=1
+        ))
+        print(f"{'export':>16}: {LINES / _time:>12,.0f} lines/sec")
+
+        for _func, _source in [
+            ( text, _filename ),
+            ( columnar, _output ),
+            ( columnar_encoded, _output )
+        ]:
+            _time = min(timeit.repeat(
+                lambda: _func(_source), number=1, repeat=REPEAT
+            ))
+            print(f"{_func.__name__:>16}: {LINES / _time:>12,.0f} lines/sec")
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
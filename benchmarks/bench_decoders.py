@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Decoding log strings with the generated decoder
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import json
+import timeit
+
+# Local app modules
+from applogging.entry import LogEntry, LogFormat
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+NUMBER = 100000
+REPEAT = 5
+LOG_LINES = {
+    "short": (
+        "2025-01-01 10:00:00,000: [AppLogging] [ERROR] The default log string"
+    ),
+    "long": (
+        "2025-01-01 10:00:00,000: [AppLogging] [ERROR] " + "item [x] " * 200
+    )
+}
+
+# The same entries as JSON lines (as written by JsonFormatter)
+JSON_LINES = {
+    _name: json.dumps({
+        "time": "2025-01-01 10:00:00,000",
+        "logger_name": "AppLogging",
+        "severity": "ERROR",
+        "source": "",
+        "process_id": 0,
+        "process_name": "",
+        "thread_id": 0,
+        "thread_name": "",
+        "message": _line.split("] ", 2)[2],
+        "timestamp": 1735725600.0
+    })
+    for _name, _line in LOG_LINES.items()
+}
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# regex
+#
+def regex(log_format: LogFormat, line: str) -> tuple:
+    '''
+    Decode the log string using the regular expression
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The log string
+
+    Returns:
+        tuple: The decoded values
+
+    Raises:
+        None
+    '''
+    return log_format.decode(line, match=log_format.pattern.match(line))
+
+
+#
+# tokenized
+#
+def tokenized(log_format: LogFormat, line: str) -> tuple:
+    '''
+    Decode the log string by splitting it on the delimiters
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The log string
+
+    Returns:
+        tuple: The decoded values
+
+    Raises:
+        None
+    '''
+    return log_format.decode(line, match=log_format.match(line))
+
+
+#
+# generated
+#
+def generated(log_format: LogFormat, line: str) -> tuple:
+    '''
+    Decode the log string using the generated decoder
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The log string
+
+    Returns:
+        tuple: The decoded values
+
+    Raises:
+        None
+    '''
+    return log_format.decoder(line)
+
+
+#
+# json_loads
+#
+def json_loads(log_format: LogFormat, line: str) -> tuple:
+    '''
+    Decode the JSON line using json.loads
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The JSON line
+
+    Returns:
+        tuple: The decoded values
+
+    Raises:
+        None
+    '''
+    _object = json.loads(line)
+
+    return tuple(_object.values())[:-1]
+
+
+#
+# json_lines
+#
+def json_lines(log_format: LogFormat, line: str) -> tuple:
+    '''
+    Decode the JSON line by splitting it on the keys
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The JSON line
+
+    Returns:
+        tuple: The decoded values
+
+    Raises:
+        None
+    '''
+    return log_format.decode(line)
+
+
+#
+# eager_one
+#
+def eager_one(log_format: LogFormat, line: str) -> str:
+    '''
+    Create a log entry, and read a single attribute
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The log string
+
+    Returns:
+        str: The severity
+
+    Raises:
+        None
+    '''
+    return LogEntry(msg=line, log_format=log_format).severity
+
+
+#
+# lazy_one
+#
+def lazy_one(log_format: LogFormat, line: str) -> str:
+    '''
+    Create a lazy log entry, and read a single attribute (only that
+    attribute is decoded)
+
+    Args:
+        log_format (LogFormat): The compiled log format
+        line (str): The log string
+
+    Returns:
+        str: The severity
+
+    Raises:
+        None
+    '''
+    return LogEntry(msg=line, log_format=log_format, lazy=True).severity
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    _log_format = LogFormat()
+
+    _cases = [
+        ( LOG_LINES, [ regex, tokenized, generated ] ),
+        ( LOG_LINES, [ eager_one, lazy_one ] ),
+        ( JSON_LINES, [ json_loads, json_lines ] )
+    ]
+
+    for _lines, _funcs in _cases:
+        for _name, _line in _lines.items():
+            for _func in _funcs:
+                _time = min(timeit.repeat(
+                    lambda: _func(_log_format, _line),
+                    number=NUMBER,
+                    repeat=REPEAT
+                ))
+                print(
+                    f"{_name:>6} {_func.__name__:>10}: "
+                    f"{_time / NUMBER * 1e6:>8.2f} us/line"
+                )
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
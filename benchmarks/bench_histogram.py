@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Time series histograms of log entries
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import timeit
+
+# Local app modules
+from applogging.entry import parse_many
+from applogging.analytics import Aggregator, histogram
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+LINES = 1000000
+REPEAT = 3
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# per_entry
+#
+def per_entry(columns: dict) -> int:
+    '''
+    Count the entries a row at a time with an Aggregator
+
+    Args:
+        columns (dict): The severity and timestamp columns
+
+    Returns:
+        int: The number of groups
+
+    Raises:
+        None
+    '''
+    _agg = Aggregator(group_by=[ "severity" ], bucket_width=60)
+
+    return len(_agg.update_columns(columns).groups)
+
+
+#
+# python
+#
+def python(columns: dict) -> int:
+    '''
+    Count the entries with histogram, without NumPy
+
+    Args:
+        columns (dict): The severity and timestamp columns
+
+    Returns:
+        int: The number of groups
+
+    Raises:
+        None
+    '''
+    return len(histogram(columns, bin_width=60, numpy=False)[1])
+
+
+#
+# vectorised
+#
+def vectorised(columns: dict) -> int:
+    '''
+    Count the entries with histogram, using NumPy
+
+    Args:
+        columns (dict): The severity and timestamp columns
+
+    Returns:
+        int: The number of groups
+
+    Raises:
+        None
+    '''
+    return len(histogram(columns, bin_width=60, numpy=True)[1])
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    _columns = parse_many(
+        (
+            f"2025-01-{_count // 86400 + 1:02d} "
+            f"{_count // 3600 % 24:02d}:{_count // 60 % 60:02d}:"
+            f"{_count % 60:02d},000: [AppLogging] "
+            f"[{SEVERITIES[_count % len(SEVERITIES)]}] Message"
+            for _count in range(LINES)
+        ),
+        columns=[ "severity", "timestamp" ],
+        encode=True
+    )
+
+    _funcs = [ per_entry, python ]
+    try:
+        import numpy
+        _funcs.append(vectorised)
+    except ImportError:
+        print("NumPy is not installed - Skipping vectorised")
+
+    for _func in _funcs:
+        _time = min(timeit.repeat(
+            lambda: _func(_columns), number=1, repeat=REPEAT
+        ))
+        print(f"{_func.__name__:>12}: {LINES / _time:>14,.0f} entries/sec")
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Streaming log files with iter_entries
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import tempfile
+import timeit
+
+# Local app modules
+from applogging.entry import LogEntry, iter_entries
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+LINES = 200000
+REPEAT = 3
+LOG_LINE = (
+    "2025-01-01 10:00:00,000: [AppLogging] [ERROR] The default log string\n"
+)
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# naive_loop
+#
+def naive_loop(filename: str) -> int:
+    '''
+    Decode the file one line at a time
+
+    Args:
+        filename (str): The log file to read
+
+    Returns:
+        int: The number of entries decoded
+
+    Raises:
+        None
+    '''
+    _count = 0
+    with open(filename, "r") as f:
+        for _line in f:
+            _entry = LogEntry(msg=_line)
+            if _entry.severity and _entry.message: _count += 1
+
+    return _count
+
+
+#
+# streaming
+#
+def streaming(filename: str) -> int:
+    '''
+    Decode the file using iter_entries
+
+    Args:
+        filename (str): The log file to read
+
+    Returns:
+        int: The number of entries decoded
+
+    Raises:
+        None
+    '''
+    _count = 0
+    for _entry in iter_entries(filename):
+        if _entry.severity and _entry.message: _count += 1
+
+    return _count
+
+
+#
+# post_filter
+#
+def post_filter(filename: str) -> int:
+    '''
+    Decode every entry, then check the severity
+
+    Args:
+        filename (str): The log file to read
+
+    Returns:
+        int: The number of entries accepted
+
+    Raises:
+        None
+    '''
+    _count = 0
+    for _entry in iter_entries(filename):
+        if _entry.severity == "CRITICAL": _count += 1
+
+    return _count
+
+
+#
+# prefilter
+#
+def prefilter(filename: str) -> int:
+    '''
+    Check the severity on the raw bytes before decoding
+
+    Args:
+        filename (str): The log file to read
+
+    Returns:
+        int: The number of entries accepted
+
+    Raises:
+        None
+    '''
+    _count = 0
+    for _ in iter_entries(filename, severities=[ "CRITICAL" ]):
+        _count += 1
+
+    return _count
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    with tempfile.TemporaryDirectory() as _dir:
+        _filename = os.path.join(_dir, "bench.log")
+        with open(_filename, "w") as f:
+            f.write(LOG_LINE * LINES)
+
+        for _func in [ naive_loop, streaming, post_filter, prefilter ]:
+            _time = min(timeit.repeat(
+                lambda: _func(_filename), number=1, repeat=REPEAT
+            ))
+            print(f"{_func.__name__:>12}: {LINES / _time:>12,.0f} lines/sec")
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Memory used by each LogEntry
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import copy
+import gc
+import tracemalloc
+
+# Local app modules
+from applogging.entry import (
+    DEFAULT_TOKEN_MAP,
+    LogEntry,
+    get_log_format,
+    parse_many
+)
+
+# Imports for python variable type hints
+from typing import Callable
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+ENTRIES = 100000
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+
+
+###########################################################################
+#
+# The entry layout prior to using __slots__
+#
+###########################################################################
+class DictLogEntry():
+    '''
+    An entry with a __dict__ and its own copy of the token map
+
+    Attributes:
+        None
+    '''
+    def __init__(self, msg: str = ""):
+        '''
+        Initialises the instance.
+
+        Args:
+            msg: (str): The log message to be decoded
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self._time = ""
+        self._logger_name = ""
+        self._severity = ""
+        self._source = ""
+        self._process_id = 0
+        self._process_name = ""
+        self._thread_id = 0
+        self._thread_name = ""
+        self._message = ""
+        self._token_map = copy.deepcopy(DEFAULT_TOKEN_MAP)
+
+        (
+            self._time,
+            self._logger_name,
+            self._severity,
+            self._source,
+            self._process_id,
+            self._process_name,
+            self._thread_id,
+            self._thread_name,
+            self._message
+        ) = get_log_format().decode(msg=msg)
+
+        # Entries decoded without interning have their own copies
+        self._severity = "".join(self._severity)
+        self._logger_name = "".join(self._logger_name)
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# log_lines
+#
+def log_lines() -> list:
+    '''
+    Create the log strings to decode
+
+    Args:
+        None
+
+    Returns:
+        list: The log strings
+
+    Raises:
+        None
+    '''
+    return [
+        f"2025-01-01 10:00:{_count % 60:02d},000: [AppLogging] "
+        f"[{SEVERITIES[_count % len(SEVERITIES)]}] Message number {_count}"
+        for _count in range(ENTRIES)
+    ]
+
+
+#
+# bytes_per_row
+#
+def bytes_per_row(encode: bool = False) -> float:
+    '''
+    Measure the memory used by the severity and logger_name columns
+
+    Args:
+        encode (bool): If True, dictionary encode the columns
+
+    Returns:
+        float: The number of bytes allocated per row
+
+    Raises:
+        None
+    '''
+    _lines = log_lines()
+
+    gc.collect()
+    tracemalloc.start()
+    _columns = parse_many(
+        _lines,
+        columns=[ "severity", "logger_name" ],
+        encode=encode
+    )
+    _size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(_columns["severity"]) == ENTRIES
+
+    return _size / ENTRIES
+
+
+#
+# bytes_per_entry
+#
+def bytes_per_entry(factory: Callable) -> float:
+    '''
+    Measure the memory allocated for each entry
+
+    Args:
+        factory (Callable): Function creating an entry from a log string
+
+    Returns:
+        float: The number of bytes allocated per entry
+
+    Raises:
+        None
+    '''
+    _lines = log_lines()
+
+    gc.collect()
+    tracemalloc.start()
+    _entries = [ factory(_line) for _line in _lines ]
+    _size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(_entries) == ENTRIES
+
+    return _size / ENTRIES
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    _log_format = get_log_format()
+
+    _before = bytes_per_entry(lambda _line: DictLogEntry(msg=_line))
+    _after = bytes_per_entry(
+        lambda _line: LogEntry(msg=_line, log_format=_log_format)
+    )
+
+    print(f"  before: {_before:>10,.0f} bytes/entry")
+    print(f"   after: {_after:>10,.0f} bytes/entry")
+
+    print(f" columns: {bytes_per_row():>10,.0f} bytes/row")
+    print(f" encoded: {bytes_per_row(encode=True):>10,.0f} bytes/row")
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+'''
+Benchmark - Counting messages by template
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+
+# System Modules
+import random
+import timeit
+import collections
+
+# Local app modules
+from applogging.templates import TemplateMiner
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Constants
+#
+MESSAGES = 200000
+TEMPLATES = 200
+REPEAT = 3
+WORDS = [ "request", "user", "cache", "job", "disk", "queue", "session" ]
+
+
+###########################################################################
+#
+# Benchmarks
+#
+###########################################################################
+#
+# raw_strings
+#
+def raw_strings(messages: list) -> int:
+    '''
+    Count the messages by the raw string
+
+    Args:
+        messages (list): The messages
+
+    Returns:
+        int: The number of distinct keys
+
+    Raises:
+        None
+    '''
+    return len(collections.Counter(messages))
+
+
+#
+# templates
+#
+def templates(messages: list) -> int:
+    '''
+    Count the messages by template with a TemplateMiner
+
+    Args:
+        messages (list): The messages
+
+    Returns:
+        int: The number of distinct keys
+
+    Raises:
+        None
+    '''
+    _miner = TemplateMiner()
+    _add = _miner.add
+    for _message in messages: _add(_message)
+
+    return len(_miner)
+
+
+#
+# main
+#
+def main():
+    '''
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    _random = random.Random(0)
+
+    # Each template is a few words with numeric parameters between them
+    _formats = [
+        " ".join(
+            f"{_random.choice(WORDS)}_{chr(97 + _number % 26)}"
+            if _position % 2 == 0 else "{}"
+            for _position in range(_random.randint(3, 12))
+        )
+        for _number in range(TEMPLATES)
+    ]
+    _messages = [
+        _format.format(*(
+            _random.randint(0, 100000) for _ in range(_format.count("{}"))
+        ))
+        for _format in (
+            _random.choice(_formats) for _ in range(MESSAGES)
+        )
+    ]
+
+    for _func in [ raw_strings, templates ]:
+        _keys = _func(_messages)
+        _time = min(timeit.repeat(
+            lambda: _func(_messages), number=1, repeat=REPEAT
+        ))
+        print(
+            f"{_func.__name__:>12}: {MESSAGES / _time:>12,.0f} messages/sec"
+            f"  {_keys:>8,} keys"
+        )
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    main()
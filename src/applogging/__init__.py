@@ -31,7 +31,33 @@ __all__ = [
     "handler_to_console",
     "handler_to_file",
     "handler_to_timed_rotating_file",
-    "LogEntry"
+    "handler_to_json_file",
+    "JsonFormatter",
+    "LogEntry",
+    "LogFormat",
+    "LogFilter",
+    "get_log_format",
+    "iter_entries",
+    "scan_entries",
+    "parse_many",
+    "EncodedColumn",
+    "split_file",
+    "iter_chunks_parallel",
+    "reduce_parallel",
+    "find_time_offset",
+    "iter_entries_between",
+    "rotation_files",
+    "merge_entries",
+    "AsctimeDecoder",
+    "LogIndex",
+    "follow_entries",
+    "Aggregator",
+    "aggregate_parallel",
+    "histogram",
+    "export_columnar",
+    "ColumnarFile",
+    "TemplateMiner",
+    "iter_templates"
 ]
 
 # What to import as part of the the module (import module)
@@ -44,6 +70,32 @@ from applogging.logging import (
     set_log_level,
     handler_to_console,
     handler_to_file,
-    handler_to_timed_rotating_file
+    handler_to_timed_rotating_file,
+    handler_to_json_file,
+    JsonFormatter
 )
-from applogging.entry import LogEntry
+from applogging.entry import (
+    LogEntry,
+    LogFormat,
+    LogFilter,
+    get_log_format,
+    iter_entries,
+    scan_entries,
+    parse_many,
+    EncodedColumn
+)
+from applogging.reader import (
+    split_file,
+    iter_chunks_parallel,
+    reduce_parallel,
+    find_time_offset,
+    iter_entries_between,
+    rotation_files,
+    merge_entries
+)
+from applogging.timestamp import AsctimeDecoder
+from applogging.index import LogIndex
+from applogging.follow import follow_entries
+from applogging.analytics import Aggregator, aggregate_parallel, histogram
+from applogging.columnar import export_columnar, ColumnarFile
+from applogging.templates import TemplateMiner, iter_templates
@@ -0,0 +1,746 @@
+#!/usr/bin/env python3
+'''
+Analytics - Aggregation of log entries
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import math
+import functools
+import itertools
+import collections
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.entry import (
+    ENTRY_FIELDS,
+    EncodedColumn,
+    LogEntry,
+    LogFormat,
+    get_log_format,
+    _import_numpy,
+    _iter_records
+)
+from applogging.reader import DEFAULT_CHUNK_SIZE, reduce_parallel
+
+# Imports for python variable type hints
+from typing import Any, Iterable
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+DEFAULT_GROUP_BY = ( "severity", )
+
+# The position of the time in ENTRY_FIELDS
+TIME_INDEX = ENTRY_FIELDS.index("time")
+
+# The default width of each histogram bin (in seconds)
+DEFAULT_BIN_WIDTH = 60
+
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Aggregator Class Definition
+#
+###########################################################################
+class Aggregator():
+    '''
+    Class to count log entries by group in a single pass
+
+    Entries are grouped by the values of one or more attributes, and
+    optionally by time bucket.  For each group, the number of entries and
+    the first and last timestamps are kept, so memory use depends on the
+    number of groups rather than the number of entries.
+
+    Aggregators for different parts of a log (eg from parallel workers) can
+    be combined with merge().
+
+    Attributes:
+        group_by (tuple) [ReadOnly]: The attributes used to group entries
+        bucket_width (float | None) [ReadOnly]: The width of each time
+            bucket (in seconds), or None if not grouped by time
+        groups (dict) [ReadOnly]: For each group, a tuple of (count, first
+            timestamp, last timestamp)
+        count (int) [ReadOnly]: The number of entries counted
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            group_by: Iterable[str] = DEFAULT_GROUP_BY,
+            bucket_width: float | None = None
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            group_by (Iterable[str]): The attributes (from ENTRY_FIELDS)
+                used to group entries
+            bucket_width (float | None): The width of each time bucket (in
+                seconds).  If None, entries are not grouped by time
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when group_by is a string
+                when bucket_width is not None or a positive number
+            ValueError:
+                when group_by contains an invalid attribute
+        '''
+        assert not isinstance(group_by, str), (
+            "group_by must be a collection of strings"
+        )
+        assert bucket_width is None or (
+            isinstance(bucket_width, (int, float)) and bucket_width > 0
+        ), "bucket_width must be None or a positive number"
+
+        group_by = tuple(group_by)
+        for _field in group_by:
+            if _field not in ENTRY_FIELDS:
+                raise ValueError(f"'{_field}' is not a valid attribute")
+
+        # Private Attributes
+        self._group_by = group_by
+        self._bucket_width = bucket_width
+        self._indexes = tuple(ENTRY_FIELDS.index(_f) for _f in group_by)
+
+        # For each group - [ count, first timestamp, last timestamp ]
+        self._groups = {}
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # group_by
+    #
+    @property
+    def group_by(self) -> tuple:
+        ''' The attributes used to group entries '''
+        return self._group_by
+
+
+    #
+    # bucket_width
+    #
+    @property
+    def bucket_width(self) -> float | None:
+        ''' The width of each time bucket '''
+        return self._bucket_width
+
+
+    #
+    # groups
+    #
+    @property
+    def groups(self) -> dict:
+        ''' The count, first and last timestamp of each group '''
+        return {
+            _key: tuple(_value) for _key, _value in self._groups.items()
+        }
+
+
+    #
+    # count
+    #
+    @property
+    def count(self) -> int:
+        ''' The number of entries counted '''
+        return sum(_value[0] for _value in self._groups.values())
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _add
+    #
+    def _add(self, values: tuple = (), timestamp: float | None = None):
+        '''
+        Count an entry
+
+        Args:
+            values (tuple): The values of the group_by attributes
+            timestamp (float | None): The timestamp of the entry
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if self._bucket_width is not None:
+            _bucket = None
+            if timestamp is not None:
+                _bucket = (
+                    math.floor(timestamp / self._bucket_width) *
+                    self._bucket_width
+                )
+
+            values = values + (_bucket,)
+
+        _group = self._groups.get(values)
+        if _group is None:
+            self._groups[values] = [ 1, timestamp, timestamp ]
+            return
+
+        _group[0] += 1
+        if timestamp is None: return
+
+        if _group[1] is None or timestamp < _group[1]: _group[1] = timestamp
+        if _group[2] is None or timestamp > _group[2]: _group[2] = timestamp
+
+
+    #
+    # update
+    #
+    def update(self, entry: LogEntry) -> Aggregator:
+        '''
+        Count a log entry
+
+        Args:
+            entry (LogEntry): The log entry
+
+        Returns:
+            Aggregator: This instance
+
+        Raises:
+            None
+        '''
+        self._add(
+            tuple(getattr(entry, _field) for _field in self._group_by),
+            entry.timestamp
+        )
+
+        return self
+
+
+    #
+    # update_entries
+    #
+    def update_entries(self, entries: Iterable[LogEntry] = ()) -> Aggregator:
+        '''
+        Count a number of log entries (eg from iter_entries)
+
+        Args:
+            entries (Iterable[LogEntry]): The log entries
+
+        Returns:
+            Aggregator: This instance
+
+        Raises:
+            None
+        '''
+        for _entry in entries: self.update(_entry)
+
+        return self
+
+
+    #
+    # update_lines
+    #
+    def update_lines(
+            self,
+            lines: Iterable[str] = (),
+            format: str = DEFAULT_LOG_FORMAT,
+            token_map: dict = {},
+            log_format: LogFormat | None = None,
+            multiline: bool = True
+    ) -> Aggregator:
+        '''
+        Count the entries in a number of log strings
+
+        Each record is decoded once, and no LogEntry is created.
+
+        Args:
+            lines (Iterable[str]): The log strings
+            format (str): The format used to create the log entries
+            token_map (dict): Modifications to the default mapping dict
+                used to extract the tokens
+            log_format (LogFormat | None): A compiled log format to use
+                instead of format and token_map
+            multiline (bool): If True, join continuation lines to the
+                preceding entry
+
+        Returns:
+            Aggregator: This instance
+
+        Raises:
+            AssertionError:
+                when mapping is not valid
+        '''
+        if log_format is None:
+            log_format = get_log_format(format=format, token_map=token_map)
+
+        _decode = log_format.decode
+        _decode_timestamp = log_format.timestamp_decoder.decode
+        _indexes = self._indexes
+
+        for _msg, _match in _iter_records(
+                lines=lines,
+                log_format=log_format,
+                multiline=multiline
+        ):
+            # Each record is decoded once, for the keys and the time
+            _values = _decode(msg=_msg, match=_match)
+            self._add(
+                tuple(_values[_i] for _i in _indexes),
+                _decode_timestamp(_values[TIME_INDEX])
+            )
+
+        return self
+
+
+    #
+    # update_columns
+    #
+    def update_columns(self, columns: dict = {}) -> Aggregator:
+        '''
+        Count the entries in a set of columns (eg from parse_many)
+
+        Args:
+            columns (dict): The columns, including the group_by attributes
+                and "timestamp"
+
+        Returns:
+            Aggregator: This instance
+
+        Raises:
+            KeyError:
+                when a column is missing
+        '''
+        _keys = zip(*[ columns[_field] for _field in self._group_by ])
+        for _values, _timestamp in zip(_keys, columns["timestamp"]):
+            # NumPy arrays use NaN for missing timestamps
+            if _timestamp is not None and _timestamp != _timestamp:
+                _timestamp = None
+
+            self._add(tuple(_values), _timestamp)
+
+        return self
+
+
+    #
+    # merge
+    #
+    def merge(self, other: Aggregator) -> Aggregator:
+        '''
+        Add the counts from another aggregator
+
+        Args:
+            other (Aggregator): The aggregator to merge into this one
+
+        Returns:
+            Aggregator: This instance
+
+        Raises:
+            AssertionError:
+                when other is not an Aggregator
+            ValueError:
+                when the aggregators are not grouped the same way
+        '''
+        assert isinstance(other, Aggregator), "other must be an Aggregator"
+
+        if (
+            other._group_by != self._group_by or
+            other._bucket_width != self._bucket_width
+        ):
+            raise ValueError("Aggregators must be grouped the same way")
+
+        for _key, (_count, _first, _last) in other._groups.items():
+            _group = self._groups.get(_key)
+            if _group is None:
+                self._groups[_key] = [ _count, _first, _last ]
+                continue
+
+            _group[0] += _count
+            if _first is not None:
+                if _group[1] is None or _first < _group[1]: _group[1] = _first
+            if _last is not None:
+                if _group[2] is None or _last > _group[2]: _group[2] = _last
+
+        return self
+
+
+###########################################################################
+#
+# Parallel Aggregation
+#
+###########################################################################
+#
+# _aggregate_columns
+#
+def _aggregate_columns(
+        columns: dict,
+        group_by: tuple = DEFAULT_GROUP_BY,
+        bucket_width: float | None = None
+) -> Aggregator:
+    '''
+    Count the entries in a set of columns (run in a worker process)
+
+    Args:
+        columns (dict): The decoded columns
+        group_by (tuple): The attributes used to group entries
+        bucket_width (float | None): The width of each time bucket
+
+    Returns:
+        Aggregator: The counts for the columns
+
+    Raises:
+        None
+    '''
+    return Aggregator(
+        group_by=group_by,
+        bucket_width=bucket_width
+    ).update_columns(columns)
+
+
+#
+# _merge_aggregators
+#
+def _merge_aggregators(total: Aggregator, other: Aggregator) -> Aggregator:
+    '''
+    Merge the counts from a worker
+
+    Args:
+        total (Aggregator): The accumulated counts
+        other (Aggregator): The counts from a worker
+
+    Returns:
+        Aggregator: The accumulated counts
+
+    Raises:
+        None
+    '''
+    return total.merge(other)
+
+
+#
+# aggregate_parallel
+#
+def aggregate_parallel(
+        filename: str = "",
+        group_by: Iterable[str] = DEFAULT_GROUP_BY,
+        bucket_width: float | None = None,
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+        multiline: bool = True
+) -> Aggregator:
+    '''
+    Count the entries in a log file by group, using a pool of workers
+
+    Each worker counts the entries in a range of the file, and the results
+    are merged as they complete.
+
+    Args:
+        filename (str): The name of the log file
+        group_by (Iterable[str]): The attributes used to group entries
+        bucket_width (float | None): The width of each time bucket (in
+            seconds).  If None, entries are not grouped by time
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        workers (int | None): The number of worker processes (defaults to
+            the number of CPUs)
+        chunk_size (int): The approximate size of each byte range
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+
+    Returns:
+        Aggregator: The counts for the file
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when mapping is not valid
+            when bucket_width is not None or a positive number
+        ValueError:
+            when group_by contains an invalid attribute
+    '''
+    _total = Aggregator(group_by=group_by, bucket_width=bucket_width)
+
+    return reduce_parallel(
+        filename=filename,
+        map_func=functools.partial(
+            _aggregate_columns,
+            group_by=_total.group_by,
+            bucket_width=bucket_width
+        ),
+        reduce_func=_merge_aggregators,
+        initial=_total,
+        format=format,
+        token_map=token_map,
+        columns=_total.group_by + ( "timestamp", ),
+        workers=workers,
+        chunk_size=chunk_size,
+        encoding=encoding,
+        multiline=multiline
+    )
+
+
+###########################################################################
+#
+# Histograms
+#
+###########################################################################
+#
+# _histogram_numpy
+#
+def _histogram_numpy(
+        np: Any,
+        timestamps: Any,
+        groups: Any,
+        bin_width: int
+) -> tuple:
+    '''
+    Count the entries in each bin using NumPy
+
+    Args:
+        np (Any): The numpy module
+        timestamps (Any): The timestamp of each entry
+        groups (Any): The group of each entry (or None)
+        bin_width (int): The width of each bin (in seconds)
+
+    Returns:
+        tuple: The start time of the first bin, the number of bins, and for
+            each group the number of entries in each bin
+
+    Raises:
+        None
+    '''
+    # Entries without a timestamp are not counted
+    _timestamps = np.asarray(timestamps, dtype=float)
+    _valid = ~np.isnan(_timestamps)
+    if not _valid.any(): return 0, 0, {}
+
+    # Convert the timestamps once to an integer epoch column
+    _epoch = np.floor(_timestamps[_valid]).astype(np.int64)
+    _first = int(_epoch.min()) // bin_width * bin_width
+    _bins = (_epoch - _first) // bin_width
+    _count = int(_bins.max()) + 1
+
+    if groups is None:
+        return _first, _count, {
+            None: np.bincount(_bins, minlength=_count).tolist()
+        }
+
+    if isinstance(groups, EncodedColumn):
+        _values = groups.values
+        _codes = np.asarray(groups.codes, dtype=np.int64)[_valid]
+    else:
+        _values, _codes = np.unique(
+            np.asarray(list(groups), dtype=object)[_valid],
+            return_inverse=True
+        )
+
+    # Count each (group, bin) pair in a single pass
+    _counts = np.bincount(
+        _codes * _count + _bins,
+        minlength=len(_values) * _count
+    ).reshape(len(_values), _count)
+
+    return _first, _count, {
+        _value: _counts[_code].tolist()
+        for _code, _value in enumerate(_values)
+        if _counts[_code].any()
+    }
+
+
+#
+# _histogram_python
+#
+def _histogram_python(
+        timestamps: Iterable,
+        groups: Iterable | None,
+        bin_width: int
+) -> tuple:
+    '''
+    Count the entries in each bin without NumPy
+
+    Args:
+        timestamps (Iterable): The timestamp of each entry
+        groups (Iterable | None): The group of each entry (or None)
+        bin_width (int): The width of each bin (in seconds)
+
+    Returns:
+        tuple: The start time of the first bin, the number of bins, and for
+            each group the number of entries in each bin
+
+    Raises:
+        None
+    '''
+    if groups is None:
+        groups = itertools.repeat(None)
+    elif isinstance(groups, EncodedColumn):
+        # Count the codes, and look up the values for the groups found
+        _values = groups.values
+        _first, _count, _counts = _histogram_python(
+            timestamps=timestamps,
+            groups=groups.codes,
+            bin_width=bin_width
+        )
+        return _first, _count, {
+            _values[_code]: _bins for _code, _bins in _counts.items()
+        }
+
+    # Convert the timestamps once to an integer epoch column (entries
+    # without a timestamp are not counted)
+    _epoch = [
+        None if _ts is None or _ts != _ts else math.floor(_ts) // bin_width
+        for _ts in timestamps
+    ]
+
+    # Count each (group, bin) pair in a single pass
+    _pairs = collections.Counter(zip(groups, _epoch))
+    _keys = [ _key for _key in _pairs if _key[1] is not None ]
+    if not _keys: return 0, 0, {}
+
+    _low = min(_bin for _, _bin in _keys)
+    _high = max(_bin for _, _bin in _keys)
+    _count = _high - _low + 1
+
+    _counts = {}
+    for _group, _bin in _keys:
+        _bins = _counts.get(_group)
+        if _bins is None: _bins = _counts[_group] = [ 0 ] * _count
+        _bins[_bin - _low] = _pairs[( _group, _bin )]
+
+    return _low * bin_width, _count, _counts
+
+
+#
+# histogram
+#
+def histogram(
+        columns: dict = {},
+        bin_width: int = DEFAULT_BIN_WIDTH,
+        group_by: str | None = "severity",
+        numpy: bool | None = None
+) -> tuple:
+    '''
+    Count the entries in each time bin, by group (eg entries per minute
+    for each severity)
+
+    The timestamps are converted once to an integer epoch column, and the
+    counts are made in a single pass, using NumPy if it is available.
+
+    Args:
+        columns (dict): The columns (eg from parse_many or
+            ColumnarFile.read), including "timestamp" and group_by
+        bin_width (int): The width of each bin (in seconds).  Bins are
+            aligned to a multiple of the width
+        group_by (str | None): The attribute used to group entries.  If
+            None, all entries are counted together (with the group None)
+        numpy (bool | None): If True, use NumPy.  If False, don't use
+            NumPy.  If None, use NumPy if it is installed
+
+    Returns:
+        tuple: The start time of each bin (a list of epoch seconds,
+            including empty bins), and for each group a list of the number
+            of entries in each bin
+
+    Raises:
+        AssertionError:
+            when bin_width is not a positive integer
+        KeyError:
+            when a column is missing
+        ImportError:
+            when numpy is True but NumPy is not installed
+    '''
+    assert isinstance(bin_width, int) and bin_width > 0, (
+        "bin_width must be a positive integer"
+    )
+
+    _timestamps = columns["timestamp"]
+    _groups = None if group_by is None else columns[group_by]
+
+    _np = None
+    if numpy:
+        _np = _import_numpy()
+    elif numpy is None:
+        try:
+            _np = _import_numpy()
+        except ImportError:
+            pass
+
+    if _np is not None:
+        _first, _count, _counts = _histogram_numpy(
+            _np,
+            timestamps=_timestamps,
+            groups=_groups,
+            bin_width=bin_width
+        )
+    else:
+        _first, _count, _counts = _histogram_python(
+            timestamps=_timestamps,
+            groups=_groups,
+            bin_width=bin_width
+        )
+
+    _bins = list(range(_first, _first + _count * bin_width, bin_width))
+
+    return _bins, _counts
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
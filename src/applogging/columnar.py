@@ -0,0 +1,820 @@
+#!/usr/bin/env python3
+'''
+Columnar - Binary columnar export of decoded log files
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import sys
+import json
+import math
+import mmap
+import array
+import struct
+import itertools
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.entry import (
+    COLUMN_FIELDS,
+    ENCODED_TYPECODES,
+    INTERNED_FIELDS,
+    EncodedColumn,
+    LogFormat,
+    get_log_format,
+    _decode_columns,
+    _iter_lines,
+    _iter_records,
+    _open_log_file
+)
+from applogging.reader import TimeValue, _to_timestamp
+
+# Imports for python variable type hints
+from typing import Any, Iterable, Iterator
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# Identifies a columnar file (at the start and end of the file)
+COLUMNAR_MAGIC = b"APPLOGC\x00"
+
+# The version of the columnar file layout
+COLUMNAR_VERSION = 1
+
+# The default number of entries in each block
+DEFAULT_BLOCK_ROWS = 65536
+
+# Each column is aligned to this number of bytes in the file
+COLUMN_ALIGNMENT = 8
+
+# The length of the metadata, stored before the magic at the end of the file
+FOOTER = struct.Struct("<Q")
+
+# The array type code for each kind of numeric column
+NUMERIC_TYPECODES = { "int": "q", "float": "d" }
+
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Export
+#
+###########################################################################
+#
+# _write_data
+#
+def _write_data(fileobj: Any, data: bytes = b"") -> list:
+    '''
+    Write a column to the file, aligned to COLUMN_ALIGNMENT
+
+    Args:
+        fileobj (Any): The file being written
+        data (bytes): The contents of the column
+
+    Returns:
+        list: The offset and length of the data in the file
+
+    Raises:
+        None
+    '''
+    _padding = -fileobj.tell() % COLUMN_ALIGNMENT
+    if _padding: fileobj.write(b"\x00" * _padding)
+
+    _offset = fileobj.tell()
+    fileobj.write(data)
+
+    return [ _offset, len(data) ]
+
+
+#
+# _write_column
+#
+def _write_column(
+        fileobj: Any,
+        column: str,
+        values: list,
+        dictionary: dict | None
+) -> dict:
+    '''
+    Write the values of a column for a block
+
+    Columns with few distinct values are dictionary encoded (using the
+    dictionary for the whole file), numbers are written as arrays, and
+    anything else as UTF-8 text with the offset of each value.
+
+    Args:
+        fileobj (Any): The file being written
+        column (str): The name of the column
+        values (list): The values for each entry in the block
+        dictionary (dict | None): The code for each value of a dictionary
+            encoded column in the file so far (updated with any new values)
+
+    Returns:
+        dict: The description of the column in the block index
+
+    Raises:
+        None
+    '''
+    if column in INTERNED_FIELDS:
+        _codes = [
+            dictionary.setdefault(_value, len(dictionary))
+            for _value in values
+        ]
+        _typecode = next(
+            _type for _size, _type in ENCODED_TYPECODES
+            if len(dictionary) <= _size
+        )
+
+        return {
+            "kind": "dict",
+            "typecode": _typecode,
+            "data": _write_data(
+                fileobj,
+                array.array(_typecode, _codes).tobytes()
+            )
+        }
+
+    if column == "timestamp":
+        # Missing timestamps are stored as NaN
+        values = [
+            math.nan if _value is None else _value for _value in values
+        ]
+
+    _types = set(map(type, values))
+    _kind = None
+    if _types <= { int }: _kind = "int"
+    elif _types <= { int, float }: _kind = "float"
+
+    if _kind:
+        try:
+            _array = array.array(NUMERIC_TYPECODES[_kind], values)
+            return {
+                "kind": _kind,
+                "typecode": _array.typecode,
+                "data": _write_data(fileobj, _array.tobytes())
+            }
+
+        except OverflowError:
+            # Too large for the array - Written as text
+            pass
+
+    # The offsets are in characters, so the values can be sliced from the
+    # decoded text
+    values = [
+        _value if type(_value) is str else str(_value) for _value in values
+    ]
+    _offsets = array.array("Q", [ 0 ])
+    _offsets.extend(itertools.accumulate(map(len, values)))
+
+    return {
+        "kind": "str",
+        "typecode": _offsets.typecode,
+        "offsets": _write_data(fileobj, _offsets.tobytes()),
+        "data": _write_data(fileobj, "".join(values).encode("utf-8"))
+    }
+
+
+#
+# _iter_blocks
+#
+def _iter_blocks(
+        filenames: Iterable[str],
+        log_format: LogFormat,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+        encoding: str = "utf-8",
+        multiline: bool = True
+) -> Iterator[dict]:
+    '''
+    Decode log files into blocks of columns
+
+    Args:
+        filenames (Iterable[str]): The log files, in order
+        log_format (LogFormat): The compiled log format
+        block_rows (int): The maximum number of entries in each block
+        encoding (str): The encoding of the log files
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+
+    Returns:
+        Iterator[dict]: The columns for each block
+
+    Raises:
+        None
+    '''
+    for _filename in filenames:
+        with _open_log_file(_filename) as f:
+            _records = _iter_records(
+                lines=_iter_lines(f, encoding=encoding),
+                log_format=log_format,
+                multiline=multiline
+            )
+
+            while True:
+                _block = list(itertools.islice(_records, block_rows))
+                if not _block: break
+
+                yield _decode_columns(
+                    records=_block,
+                    log_format=log_format,
+                    columns=COLUMN_FIELDS
+                )
+
+
+#
+# export_columnar
+#
+def export_columnar(
+        filenames: str | Iterable[str] = "",
+        output: str = "",
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+        encoding: str = "utf-8",
+        multiline: bool = True
+) -> int:
+    '''
+    Decode log files into a binary columnar file
+
+    The entries are written in blocks.  Each block holds the values of each
+    column, and the index of the blocks (with the time range of each) is
+    written at the end of the file.  The file can be read with
+    ColumnarFile, without decoding the log strings again.
+
+    Args:
+        filenames (str | Iterable[str]): The log file, or the log files in
+            order (eg a rotation set from rotation_files).  Log files
+            compressed with gzip are decompressed
+        output (str): The name of the columnar file
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        block_rows (int): The maximum number of entries in each block
+        encoding (str): The encoding of the log files
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+
+    Returns:
+        int: The number of entries written
+
+    Raises:
+        AssertionError:
+            when output is not a non-empty string
+            when block_rows is not a positive integer
+            when mapping is not valid
+    '''
+    assert output, "Empty output filename supplied."
+    assert isinstance(output, str), "Output filename must be a string."
+    assert isinstance(block_rows, int) and block_rows > 0, (
+        "block_rows must be a positive integer"
+    )
+
+    if isinstance(filenames, (str, os.PathLike)): filenames = [ filenames ]
+
+    _log_format = get_log_format(format=format, token_map=token_map)
+
+    _dictionaries = { _column: {} for _column in INTERNED_FIELDS }
+    _blocks = []
+    _rows = 0
+
+    # Write to a temporary file and replace, so the file is never partial
+    _tmp_filename = f"{output}.tmp"
+    try:
+        with open(_tmp_filename, "wb") as f:
+            f.write(COLUMNAR_MAGIC)
+
+            for _columns in _iter_blocks(
+                    filenames=filenames,
+                    log_format=_log_format,
+                    block_rows=block_rows,
+                    encoding=encoding,
+                    multiline=multiline
+            ):
+                _timestamps = [
+                    _ts for _ts in _columns["timestamp"] if _ts is not None
+                ]
+                _count = len(_columns["time"])
+
+                _blocks.append({
+                    "rows": _count,
+                    "first": min(_timestamps, default=None),
+                    "last": max(_timestamps, default=None),
+                    "columns": {
+                        _column: _write_column(
+                            f,
+                            column=_column,
+                            values=_values,
+                            dictionary=_dictionaries.get(_column)
+                        )
+                        for _column, _values in _columns.items()
+                    }
+                })
+                _rows += _count
+
+            _metadata = json.dumps({
+                "version": COLUMNAR_VERSION,
+                "byteorder": sys.byteorder,
+                "format": format,
+                "token_map": token_map,
+                "rows": _rows,
+                "dictionaries": {
+                    _column: list(_dictionary)
+                    for _column, _dictionary in _dictionaries.items()
+                },
+                "blocks": _blocks
+            }, separators=(",", ":")).encode("utf-8")
+
+            f.write(_metadata)
+            f.write(FOOTER.pack(len(_metadata)))
+            f.write(COLUMNAR_MAGIC)
+
+        os.replace(_tmp_filename, output)
+
+    finally:
+        if os.path.exists(_tmp_filename): os.remove(_tmp_filename)
+
+    return _rows
+
+
+###########################################################################
+#
+# ColumnarFile Class Definition
+#
+###########################################################################
+class ColumnarFile():
+    '''
+    Class for reading a binary columnar file (from export_columnar)
+
+    The file is memory mapped, so only the columns (and blocks) requested
+    are read from disk.  Numeric columns are returned as arrays (with NaN
+    for missing timestamps), and text columns as lists.  The numeric columns
+    from iter_blocks are memoryviews of the mapped file, so are not copied.
+
+    Attributes:
+        filename (str) [ReadOnly]: The name of the columnar file
+        format (str) [ReadOnly]: The format of the log files
+        rows (int) [ReadOnly]: The number of entries in the file
+        blocks (list) [ReadOnly]: For each block - (number of entries,
+            first timestamp, last timestamp)
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(self, filename: str = ""):
+        '''
+        Initialises the instance.
+
+        Args:
+            filename (str): The name of the columnar file
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when filename is not a non-empty string
+            ValueError:
+                when the file is not a valid columnar file
+        '''
+        assert filename, "Empty filename supplied."
+        assert isinstance(filename, str), "Filename must be a string."
+
+        # Private Attributes
+        self._filename = filename
+        self._file = open(filename, "rb")
+        self._map = None
+
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            )
+            self._metadata = self._load()
+
+        except (ValueError, KeyError, TypeError, struct.error):
+            self.close()
+            raise ValueError(f"'{filename}' is not a valid columnar file")
+
+        self._log_format = get_log_format(
+            format=self._metadata["format"],
+            token_map=self._metadata["token_map"]
+        )
+
+        # Arrays written on a machine with a different byte order are swapped
+        self._swap = self._metadata["byteorder"] != sys.byteorder
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # filename
+    #
+    @property
+    def filename(self) -> str:
+        ''' The name of the columnar file '''
+        return self._filename
+
+
+    #
+    # format
+    #
+    @property
+    def format(self) -> str:
+        ''' The format of the log files '''
+        return self._metadata["format"]
+
+
+    #
+    # rows
+    #
+    @property
+    def rows(self) -> int:
+        ''' The number of entries in the file '''
+        return self._metadata["rows"]
+
+
+    #
+    # blocks
+    #
+    @property
+    def blocks(self) -> list:
+        ''' The number of entries and time range of each block '''
+        return [
+            ( _block["rows"], _block["first"], _block["last"] )
+            for _block in self._metadata["blocks"]
+        ]
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # __enter__
+    #
+    def __enter__(self) -> ColumnarFile:
+        ''' Use the file as a context manager '''
+        return self
+
+
+    #
+    # __exit__
+    #
+    def __exit__(self, *args):
+        ''' Close the file when leaving the context '''
+        self.close()
+
+
+    #
+    # close
+    #
+    def close(self):
+        '''
+        Close the file
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Columns from iter_blocks still refer to the mapped file -
+                # It is unmapped once they are released
+                pass
+
+        self._map = None
+        self._file.close()
+
+
+    #
+    # _load
+    #
+    def _load(self) -> dict:
+        '''
+        Read the metadata at the end of the file
+
+        Args:
+            None
+
+        Returns:
+            dict: The metadata
+
+        Raises:
+            ValueError:
+                when the file is not a valid columnar file
+        '''
+        _map = self._map
+        _magic = len(COLUMNAR_MAGIC)
+        _end = len(_map) - _magic - FOOTER.size
+
+        if (
+            _end < _magic or
+            _map[:_magic] != COLUMNAR_MAGIC or
+            _map[-_magic:] != COLUMNAR_MAGIC
+        ):
+            raise ValueError("Invalid columnar file")
+
+        ( _size, ) = FOOTER.unpack(_map[_end:_end + FOOTER.size])
+        if _size > _end - _magic: raise ValueError("Invalid columnar file")
+
+        _metadata = json.loads(_map[_end - _size:_end].decode("utf-8"))
+        if _metadata.get("version") != COLUMNAR_VERSION:
+            raise ValueError("Unsupported columnar file version")
+
+        return _metadata
+
+
+    #
+    # _read_array
+    #
+    def _read_array(self, typecode: str, location: list) -> memoryview:
+        '''
+        Read an array from the file
+
+        The array is a view of the mapped file (rather than a copy), unless
+        it was written with a different byte order.
+
+        Args:
+            typecode (str): The array type code
+            location (list): The offset and length of the array
+
+        Returns:
+            memoryview: The values of the array (the format is typecode)
+
+        Raises:
+            None
+        '''
+        _offset, _length = location
+        _view = memoryview(self._map)[_offset:_offset + _length]
+
+        if not self._swap: return _view.cast(typecode)
+
+        _array = array.array(typecode)
+        _array.frombytes(_view)
+        _array.byteswap()
+        _view.release()
+
+        return memoryview(_array)
+
+
+    #
+    # _read_column
+    #
+    def _read_column(self, column: dict) -> memoryview | list:
+        '''
+        Read the values of a column in a block
+
+        Args:
+            column (dict): The description of the column in the block index
+
+        Returns:
+            memoryview | list: The values (the codes for a dictionary
+                encoded column)
+
+        Raises:
+            None
+        '''
+        if column["kind"] != "str":
+            return self._read_array(column["typecode"], column["data"])
+
+        _offsets = self._read_array(column["typecode"], column["offsets"])
+        _offset, _length = column["data"]
+        _text = self._map[_offset:_offset + _length].decode("utf-8")
+
+        return [
+            _text[_start:_end]
+            for _start, _end in zip(_offsets, _offsets[1:])
+        ]
+
+
+    #
+    # iter_blocks
+    #
+    def iter_blocks(
+            self,
+            columns: Iterable[str] | None = None,
+            start: TimeValue | None = None,
+            end: TimeValue | None = None,
+            encode: bool = False
+    ) -> Iterator[dict]:
+        '''
+        Read the columns a block at a time
+
+        Args:
+            columns (Iterable[str] | None): The columns to read (from
+                COLUMN_FIELDS).  All columns are read if None
+            start (TimeValue | None): Only read entries from this time
+                (inclusive)
+            end (TimeValue | None): Only read entries before this time
+                (exclusive)
+            encode (bool): If True, the columns with few distinct values are
+                returned as an EncodedColumn
+
+        Returns:
+            Iterator[dict]: The values of each column in the block, keyed
+                by name
+
+        Raises:
+            AssertionError:
+                when a column is not valid
+            ValueError:
+                when start or end is a string that cannot be decoded
+        '''
+        if columns is None: columns = COLUMN_FIELDS
+        columns = tuple(columns)
+
+        for _column in columns:
+            assert _column in COLUMN_FIELDS, f"Invalid column: {_column}"
+
+        start = _to_timestamp(start, log_format=self._log_format)
+        end = _to_timestamp(end, log_format=self._log_format)
+        _dictionaries = self._metadata["dictionaries"]
+
+        for _block in self._metadata["blocks"]:
+            # Skip blocks outside the time range using the block index
+            if start is not None and (
+                _block["last"] is None or _block["last"] < start
+            ):
+                continue
+
+            if end is not None and (
+                _block["first"] is None or _block["first"] >= end
+            ):
+                continue
+
+            _rows = None
+            if start is not None or end is not None:
+                # NaN (no timestamp) is never in the range
+                _rows = [
+                    _row for _row, _ts in enumerate(
+                        self._read_column(_block["columns"]["timestamp"])
+                    )
+                    if (start is None or _ts >= start) and
+                    (end is None or _ts < end)
+                ]
+                if not _rows: continue
+                if len(_rows) == _block["rows"]: _rows = None
+
+            _result = {}
+            for _column in columns:
+                _description = _block["columns"][_column]
+                _values = self._read_column(_description)
+
+                if _rows is not None:
+                    _selected = [ _values[_row] for _row in _rows ]
+                    if isinstance(_values, memoryview):
+                        _selected = memoryview(
+                            array.array(_values.format, _selected)
+                        )
+
+                    _values = _selected
+
+                if _description["kind"] == "dict":
+                    _values = EncodedColumn.from_codes(
+                        _values,
+                        _dictionaries[_column]
+                    )
+                    if not encode: _values = _values.decode()
+
+                _result[_column] = _values
+
+            yield _result
+
+
+    #
+    # read
+    #
+    def read(
+            self,
+            columns: Iterable[str] | None = None,
+            start: TimeValue | None = None,
+            end: TimeValue | None = None,
+            encode: bool = False
+    ) -> dict:
+        '''
+        Read columns from the file
+
+        Args:
+            columns (Iterable[str] | None): The columns to read (from
+                COLUMN_FIELDS).  All columns are read if None
+            start (TimeValue | None): Only read entries from this time
+                (inclusive)
+            end (TimeValue | None): Only read entries before this time
+                (exclusive)
+            encode (bool): If True, the columns with few distinct values are
+                returned as an EncodedColumn
+
+        Returns:
+            dict: The values of each column, keyed by name
+
+        Raises:
+            AssertionError:
+                when a column is not valid
+            ValueError:
+                when start or end is a string that cannot be decoded
+        '''
+        if columns is None: columns = COLUMN_FIELDS
+        columns = tuple(columns)
+
+        _parts = { _column: [] for _column in columns }
+        for _block in self.iter_blocks(
+                columns=columns,
+                start=start,
+                end=end,
+                encode=encode
+        ):
+            for _column, _values in _block.items():
+                _parts[_column].append(_values)
+
+        _dictionaries = self._metadata["dictionaries"]
+        _result = {}
+        for _column, _values in _parts.items():
+            if encode and _column in INTERNED_FIELDS:
+                # The codes are the same in every block
+                _result[_column] = EncodedColumn.from_codes(
+                    itertools.chain.from_iterable(
+                        _part.codes for _part in _values
+                    ),
+                    _dictionaries[_column]
+                )
+                continue
+
+            _typecodes = {
+                getattr(_part, "format", None) for _part in _values
+            }
+            if len(_typecodes) == 1 and None not in _typecodes:
+                # Copy the views of the file into a single array
+                _joined = array.array(_typecodes.pop())
+                for _part in _values: _joined.frombytes(_part.cast("B"))
+
+            else:
+                _joined = list(itertools.chain.from_iterable(_values))
+
+            _result[_column] = _joined
+
+        return _result
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
@@ -29,12 +29,22 @@ from __future__ import annotations
 # Shared variables, constants, etc
 
 # System Modules
+import os
+import io
 import re
+import sys
+import mmap
+import gzip
+import json
+import array
+import functools
 
 # Local app modules
 from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.timestamp import AsctimeDecoder
 
 # Imports for python variable type hints
+from typing import IO, Any, Callable, Iterable, Iterator, Union
 
 
 ###########################################################################
@@ -45,6 +55,7 @@ from applogging.constants import DEFAULT_LOG_FORMAT
 #
 # Types
 #
+LogSource = Union[str, os.PathLike, IO]
 
 
 #
@@ -98,84 +109,2962 @@ TOKEN_TYPING = {
 
 DELIMITERS_TO_ESCAPE = [ "[", "]", "(", ")" ]
 
+# Characters with a special meaning in a regular expression
+REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# The attributes of a decoded entry, in the order returned by LogFormat.decode
+ENTRY_FIELDS = (
+    "time",
+    "logger_name",
+    "severity",
+    "source",
+    "process_id",
+    "process_name",
+    "thread_id",
+    "thread_name",
+    "message"
+)
+
+# The value of each attribute when it is not found in the log entry
+ENTRY_DEFAULTS = ( "", "", "", "", 0, "", 0, "", "" )
+
+# The position of the message in ENTRY_FIELDS
+MESSAGE_INDEX = ENTRY_FIELDS.index("message")
+
+# The columns available in column mode (the timestamp is decoded from time)
+COLUMN_FIELDS = ENTRY_FIELDS + ( "timestamp", )
+
+# Attributes with few distinct values - These are interned when decoded
+INTERNED_FIELDS = ( "logger_name", "severity", "process_name", "thread_name" )
+
+# JSON lines (see JsonFormatter) have a key for each column, always in this
+# order, so a log string starting with the first key is decoded as JSON
+JSON_FIELDS = COLUMN_FIELDS
+JSON_PREFIX = '{"time": '
+_JSON_PREFIX_BYTES = JSON_PREFIX.encode("utf-8")
+
+# The array type codes used for dictionary encoded columns, by the number
+# of distinct values they can hold
+ENCODED_TYPECODES = ( ( 1 << 8, "B" ), ( 1 << 16, "H" ), ( 1 << 32, "L" ) )
+
+# The number of compiled log formats kept by get_log_format
+LOG_FORMAT_CACHE_SIZE = 64
+
+# The size of the blocks read from log files
+DEFAULT_READ_BUFFER_SIZE = 1024 * 1024
+
+# The first bytes of a gzip file
+GZIP_MAGIC = b"\x1f\x8b"
+
+#
+# Global Variables
+#
+
+# Marks an attribute of a lazy entry which has not been decoded yet
+_UNDECODED = object()
+
+# The match of a lazy entry which has not been split yet - The first
+# attribute accessed is decoded from the log string on its own, and the
+# log string is split if another attribute is needed
+_DEFERRED = object()
+_SPLIT = object()
+
+
+###########################################################################
+#
+# Token Map Handling
+#
+###########################################################################
+#
+# _merge_token_map
+#
+def _merge_token_map(token_map: dict = {}, into: dict | None = None) -> dict:
+    '''
+    Merge changes to the token map into a token map
+
+    Args:
+        token_map (dict): Dict containing updates to the token map
+        into (dict | None): The token map to update (a new dict is created
+            if None)
+
+    Returns:
+        dict: The updated token map
+
+    Raises:
+        AssertionError:
+            when token_map is not a dict
+            when an entry in the token map is not valid
+    '''
+    assert isinstance(token_map, dict), "map must be a dict"
+
+    if into is None: into = {}
+
+    # Go through token_map and merge in any items
+    for _key, _val in token_map.items():
+        # Make sure the entry contains a sub-dict
+        assert isinstance(_val, dict), (
+            f"Invalid token mapping entry: {_key}"
+        )
+
+        # Create a new entry
+        _entry = {}
+
+        # Go through the list of attributes to process
+        for _attr in [ "mapto", "delimiters" ]:
+            if _attr in _val:
+                # The map contains the attribute - Just set it
+                _entry[_attr] = _val[_attr]
+
+            else:
+                # See if there is a default for the attribute
+                _default_entry = DEFAULT_TOKEN_MAP.get(_key, {})
+
+                if _attr in _default_entry:
+                    # There is an entry in the default map
+                    _entry[_attr] = _default_entry[_attr]
+
+                else:
+                    # Create an entry based on some sensible defaults
+                    if _attr in [ "mapto", ]:
+                        _entry[_attr] = ""
+                    elif _attr in [ "delimiters", ]:
+                        _entry[_attr] = [ "[", "]" ]
+
+        # Ensure mapto is a string
+        assert isinstance(_entry["mapto"], str), (
+            f"mapto must be a string: {_key}"
+        )
+
+        # Make sure delimiters is a list
+        assert isinstance(_entry["delimiters"], list), (
+            f"delimiters must be a list: {_key}"
+        )
+
+        # Add the entry
+        into[_key] = _entry
+
+    return into
+
+
+#
+# _freeze_token_map
+#
+def _freeze_token_map(token_map: dict = {}) -> tuple:
+    '''
+    Convert changes to the token map into a hashable form for caching
+
+    Args:
+        token_map (dict): Dict containing updates to the token map
+
+    Returns:
+        tuple: A hashable representation of the token map
+
+    Raises:
+        AssertionError:
+            when token_map is not a dict
+            when an entry in the token map is not valid
+    '''
+    assert isinstance(token_map, dict), "map must be a dict"
+
+    _frozen = []
+    for _key, _val in token_map.items():
+        assert isinstance(_val, dict), (
+            f"Invalid token mapping entry: {_key}"
+        )
+
+        _mapto = _val.get("mapto", None)
+        assert _mapto is None or isinstance(_mapto, str), (
+            f"mapto must be a string: {_key}"
+        )
+
+        _delimiters = _val.get("delimiters", None)
+        assert _delimiters is None or isinstance(_delimiters, list), (
+            f"delimiters must be a list: {_key}"
+        )
+
+        _frozen.append((
+            _key,
+            ("mapto" in _val, _mapto),
+            (
+                "delimiters" in _val,
+                tuple(_delimiters) if _delimiters is not None else None
+            )
+        ))
+
+    return tuple(_frozen)
+
+
+#
+# _thaw_token_map
+#
+def _thaw_token_map(frozen: tuple = ()) -> dict:
+    '''
+    Convert a frozen token map back into a dict
+
+    Args:
+        frozen (tuple): The token map as returned by _freeze_token_map
+
+    Returns:
+        dict: The changes to the token map
+
+    Raises:
+        None
+    '''
+    _token_map = {}
+    for _key, (_has_mapto, _mapto), (_has_delims, _delims) in frozen:
+        _entry = {}
+        if _has_mapto: _entry["mapto"] = _mapto
+        if _has_delims: _entry["delimiters"] = list(_delims)
+        _token_map[_key] = _entry
+
+    return _token_map
+
+
+###########################################################################
+#
+# Value Conversion
+#
+###########################################################################
+#
+# _to_int
+#
+def _to_int(value: str) -> int | str:
+    '''
+    Convert a value to an integer
+
+    Args:
+        value (str): The value from the log string
+
+    Returns:
+        int | str: The integer, or the value unchanged if it is not a
+            number
+
+    Raises:
+        None
+    '''
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+#
+# _to_float
+#
+def _to_float(value: str) -> float | str:
+    '''
+    Convert a value to a float
+
+    Args:
+        value (str): The value from the log string
+
+    Returns:
+        float | str: The float, or the value unchanged if it is not a
+            number
+
+    Raises:
+        None
+    '''
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+#
+# _value_converter
+#
+def _value_converter(token: str = "", field: str = "") -> Callable | None:
+    '''
+    Get the function used to convert a decoded value
+
+    Numeric tokens (from TOKEN_TYPING) are converted to numbers, and
+    attributes with few distinct values are interned.
+
+    Args:
+        token (str): The name of the token in the format string
+        field (str): The attribute the token is mapped to
+
+    Returns:
+        Callable | None: The function, or None if the value is kept as is
+
+    Raises:
+        None
+    '''
+    _type = TOKEN_TYPING.get(token, "s")
+    if _type == "d": return _to_int
+    if _type == "f": return _to_float
+    if field in INTERNED_FIELDS: return sys.intern
+
+    return None
+
+
+#
+# _convert_column
+#
+def _convert_column(
+        values: Iterable = (),
+        converter: Callable = _to_int
+) -> list:
+    '''
+    Convert a column of values in a single pass
+
+    Args:
+        values (Iterable): The values from the log strings
+        converter (Callable): The function used to convert a single value
+
+    Returns:
+        list: The converted values
+
+    Raises:
+        None
+    '''
+    _type = int if converter is _to_int else float
+    try:
+        return list(map(_type, values))
+    except ValueError:
+        # Keep the values which are not numbers
+        return [ converter(_value) for _value in values ]
+
+
+###########################################################################
+#
+# Generated Decoders
+#
+###########################################################################
+#
+# _generate_decoder
+#
+@functools.lru_cache(maxsize=LOG_FORMAT_CACHE_SIZE)
+def _generate_decoder(
+        prefix: str,
+        terminators: tuple,
+        literal: str,
+        groups: tuple,
+        index: int | None = None
+) -> Callable:
+    '''
+    Generate a function decoding log strings with a given layout
+
+    The function is specialised for the layout - The delimiters are
+    constants and each value is found with a single str.find, with no loops
+    or regular expressions.  Functions are cached by layout.
+
+    A function decoding a single attribute (eg for a lazy entry) still
+    finds every delimiter, so it accepts the same log strings, but only the
+    value of that attribute is taken from the log string.
+
+    Args:
+        prefix (str): The text at the start of the log string
+        terminators (tuple): The text ending each group (empty if the group
+            runs to the end of the line)
+        literal (str): The literal text between the tokens
+        groups (tuple): For each group, the position of the attribute in
+            ENTRY_FIELDS (-1 if not used) and the function used to convert
+            the value (or None)
+        index (int | None): The position in ENTRY_FIELDS of the only
+            attribute to decode (all attributes if None).  Can't be the
+            message
+
+    Returns:
+        Callable: The decoder.  Called with the log string, it returns the
+            value for each attribute in ENTRY_FIELDS (or the value of the
+            attribute at index), or None if the log string does not match
+            the layout
+
+    Raises:
+        None
+    '''
+    _lines = [
+        "def _decode(msg):",
+        f"    if not msg.startswith({prefix!r}): return None",
+        "    _eol = msg.find('\\n')",
+        "    if _eol < 0: _eol = len(msg)",
+        f"    _pos = {len(prefix)}"
+    ]
+
+    # If several groups map to the same attribute, the last one is used
+    _values = [ repr(_default) for _default in ENTRY_DEFAULTS ]
+
+    _namespace = {}
+    for _number, (_terminator, (_index, _convert)) in enumerate(
+            zip(terminators, groups)):
+        if _terminator:
+            _lines += [
+                f"    _end = msg.find({_terminator!r}, _pos, _eol)",
+                "    if _end < 0: return None"
+            ]
+        else:
+            _lines.append("    _end = _eol")
+
+        _value = "msg[_pos:_end]"
+        if _convert is not None:
+            _namespace[f"_convert{_number}"] = _convert
+            _value = f"_convert{_number}({_value})"
+
+        if _index >= 0 and index in ( None, _index ):
+            _lines.append(f"    _value{_number} = {_value}")
+            _values[_index] = f"_value{_number}"
+
+        _lines.append(f"    _pos = _end + {len(_terminator)}")
+
+    if index is not None:
+        _lines.append(f"    return {_values[index]}")
+
+    else:
+        # Unless the message is one of the groups, everything up to the end
+        # of the match is values or literal text
+        if MESSAGE_INDEX not in [ _index for _index, _ in groups ]:
+            _message = "msg[_pos:].strip()"
+            if literal.strip():
+                _message = f"({literal!r} + msg[_pos:]).strip()"
+
+            _values[MESSAGE_INDEX] = _message
+
+        _lines.append(f"    return ({', '.join(_values)},)")
+
+    _code = compile("\n".join(_lines), "<applogging decoder>", "exec")
+    exec(_code, _namespace)
+
+    return _namespace["_decode"]
+
+
+###########################################################################
+#
+# JSON Lines
+#
+###########################################################################
+#
+# _json_decoder
+#
+@functools.lru_cache(maxsize=None)
+def _json_decoder() -> Callable:
+    '''
+    Generate the decoder for JSON lines without escaped characters
+
+    Without a backslash in the line, no value can contain a quote, so the
+    keys (and the punctuation around them) are delimiters like any other
+    layout.
+
+    Args:
+        None
+
+    Returns:
+        Callable: The decoder (see _generate_decoder)
+
+    Raises:
+        None
+    '''
+    _quotes = []
+    _groups = []
+    for _field in JSON_FIELDS:
+        # The timestamp is not decoded
+        _index = ENTRY_FIELDS.index(_field) if _field in ENTRY_FIELDS else -1
+        _default = ENTRY_DEFAULTS[_index] if _index >= 0 else 0.0
+
+        _convert = None
+        if isinstance(_default, int): _convert = _to_int
+        if _field in INTERNED_FIELDS: _convert = sys.intern
+
+        # Strings are quoted
+        _quotes.append("\"" if isinstance(_default, str) else "")
+        _groups.append(( _index, _convert ))
+
+    _terminators = [
+        f"{_quote}, \"{_next}\": {_next_quote}"
+        for _quote, _next, _next_quote in zip(
+            _quotes, JSON_FIELDS[1:], _quotes[1:])
+    ]
+    _terminators.append(f"{_quotes[-1]}}}")
+
+    return _generate_decoder(
+        f"{JSON_PREFIX}{_quotes[0]}",
+        tuple(_terminators),
+        "",
+        tuple(_groups)
+    )
+
+
+#
+# _decode_json
+#
+def _decode_json(msg: str = "") -> tuple | None:
+    '''
+    Decode a JSON line into the entry attributes
+
+    Lines written by JsonFormatter are split on the keys, and json.loads is
+    only used for lines with escaped characters (or other layouts).
+
+    Args:
+        msg (str): The JSON line
+
+    Returns:
+        tuple | None: The value for each attribute in ENTRY_FIELDS, or None
+            if msg is not a JSON object
+
+    Raises:
+        None
+    '''
+    if "\\" not in msg:
+        _values = _json_decoder()(msg)
+        if _values is not None: return _values
+
+    try:
+        _object = json.loads(msg)
+    except ValueError:
+        return None
+
+    if not isinstance(_object, dict): return None
+
+    _values = []
+    for _field, _default in zip(ENTRY_FIELDS, ENTRY_DEFAULTS):
+        _value = _object.get(_field)
+        if _value is None:
+            _value = _default
+        elif _field in INTERNED_FIELDS and isinstance(_value, str):
+            _value = sys.intern(_value)
+
+        _values.append(_value)
+
+    return tuple(_values)
+
+
+###########################################################################
+#
+# TokenMatch Class Definition
+#
+###########################################################################
+class _TokenMatch():
+    '''
+    The result of tokenizing a log string (used in place of re.Match)
+
+    Only the parts of the re.Match interface used to decode entries are
+    provided.
+
+    Attributes:
+        None
+    '''
+    __slots__ = ( "_string", "_spans", "_values" )
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            string: str = "",
+            spans: tuple = (),
+            values: tuple = ()
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            string (str): The log string
+            spans (tuple): The (start, end) of the whole match, followed by
+                the (start, end) of each group
+            values (tuple): The value of each group
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._string = string
+        self._spans = spans
+        self._values = values
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # group
+    #
+    def group(self, group: int = 0) -> str:
+        ''' The value of a group (or the whole match) '''
+        if group: return self._values[group - 1]
+
+        return self._string[self._spans[0][0]:self._spans[0][1]]
+
+
+    #
+    # groups
+    #
+    def groups(self) -> tuple:
+        ''' The value of each group '''
+        return self._values
+
+
+    #
+    # start
+    #
+    def start(self, group: int = 0) -> int:
+        ''' The start of a group (or the whole match) '''
+        return self._spans[group][0]
+
+
+    #
+    # end
+    #
+    def end(self, group: int = 0) -> int:
+        ''' The end of a group (or the whole match) '''
+        return self._spans[group][1]
+
+
+    #
+    # span
+    #
+    def span(self, group: int = 0) -> tuple:
+        ''' The (start, end) of a group (or the whole match) '''
+        return self._spans[group]
+
+
+###########################################################################
+#
+# JsonMatch Class Definition
+#
+###########################################################################
+class _JsonMatch():
+    '''
+    The result of decoding a JSON line (used in place of re.Match)
+
+    JSON lines are decoded when they are matched, so the values are kept
+    for decoding the entry.
+
+    Attributes:
+        None
+    '''
+    __slots__ = ( "_values", )
+
+    #
+    # __init__
+    #
+    def __init__(self, values: tuple = ()):
+        '''
+        Initialises the instance.
+
+        Args:
+            values (tuple): The value for each attribute in ENTRY_FIELDS
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._values = values
+
+
+###########################################################################
+#
+# DecodedMatch Class Definition
+#
+###########################################################################
+class _DecodedMatch():
+    '''
+    The values decoded from the first line of an entry (used in place of
+    re.Match)
+
+    The generated decoder finds where each entry starts, so its result is
+    kept rather than splitting the line again to decode the entry.
+
+    Attributes:
+        None
+    '''
+    __slots__ = ( "_values", "_length" )
+
+    #
+    # __init__
+    #
+    def __init__(self, values: tuple = (), length: int = 0):
+        '''
+        Initialises the instance.
+
+        Args:
+            values (tuple): The value for each attribute in ENTRY_FIELDS
+                (numbers left as strings)
+            length (int): The length of the line decoded
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._values = values
+        self._length = length
+
+
+###########################################################################
+#
+# LogFormat Class Definition
+#
+###########################################################################
+class LogFormat():
+    '''
+    Class holding a compiled log format, used to decode log strings
+
+    The token map is merged and the regular expression compiled once, so
+    decoding a log string only costs a single match.
+
+    When the format is only tokens separated by literal text (as the default
+    format is), log strings are split using the delimiters instead of the
+    regular expression.  The line is scanned once, left to right, so there
+    is no backtracking on long messages.
+
+    Log strings written as JSON lines (see JsonFormatter) are decoded
+    whatever the format.
+
+    Attributes:
+        format (str) [ReadOnly]: The format used to create the log entries
+        token_map (dict) [ReadOnly]: The merged token map
+        pattern (re.Pattern) [ReadOnly]: The compiled regular expression
+        tokenized (bool) [ReadOnly]: True if log strings are split using
+            the delimiters rather than the regular expression
+        decoder (Callable | None) [ReadOnly]: A function generated to decode
+            log strings in the format, returning the value for each
+            attribute in ENTRY_FIELDS (or None if the log string does not
+            match).  None if the format is not tokenized
+        bytes_pattern (re.Pattern) [ReadOnly]: The compiled regular
+            expression, for matching UTF-8 encoded bytes (also matching the
+            start of JSON lines)
+        timestamp_decoder (AsctimeDecoder) [ReadOnly]: The decoder used to
+            convert the time into a timestamp
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            format: str = DEFAULT_LOG_FORMAT,
+            token_map: dict = {}
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            format (str): The format used to create the log entries
+            token_map (dict): Modifications to the default mapping dict used
+                to extract the tokens
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when format is empty or not a string
+                when mapping is not valid
+        '''
+        assert format, "Format is empty"
+        assert isinstance(format, str), "Format is not a string"
+
+        # Private Attributes
+        self._format = format
+
+        # Merge the default token map and any changes to it
+        self._token_map = _merge_token_map(token_map=DEFAULT_TOKEN_MAP)
+        _merge_token_map(token_map=token_map, into=self._token_map)
+
+        # For each group in the pattern:
+        #   (field index, start delim, end delim, convert function or None)
+        self._groups = ()
+
+        # For each field, the number of the group it is set from (0 if none)
+        self._field_groups = ()
+
+        # Compile the regular expression
+        self._pattern = self._compile()
+
+        # The layout used to split log strings on the delimiters - The text
+        # at the start, the text ending each group and the literal text
+        # (None if the format can't be split this way)
+        self._layout = self._compile_layout()
+
+        # Decoders generated for the layout (None if there is no layout) -
+        # The raw decoder leaves numbers as strings, to convert by column
+        self._decoder = None
+        self._raw_decoder = None
+        if self._layout is not None:
+            self._decoder = _generate_decoder(
+                *self._layout,
+                tuple(( _group[0], _group[3] ) for _group in self._groups)
+            )
+            self._raw_decoder = _generate_decoder(
+                *self._layout,
+                tuple(
+                    ( _group[0], self._raw_converter(_group[3]) )
+                    for _group in self._groups
+                )
+            )
+
+        # The numeric conversions the raw decoder leaves out (the convert
+        # function, keyed by the position of the attribute in ENTRY_FIELDS)
+        self._numeric = {
+            _group[0]: _group[3] for _group in self._groups
+            if _group[0] >= 0 and self._raw_converter(_group[3]) is None
+            and _group[3] is not None
+        }
+
+        # Decoders for a single attribute (for lazy entries), generated when
+        # first used - Keyed by the position of the attribute in ENTRY_FIELDS
+        self._field_decoders = {}
+
+        # The bytes version of the pattern is compiled when first used
+        self._bytes_pattern = None
+
+        # Decoder for converting the time to a timestamp
+        self._timestamp_decoder = AsctimeDecoder()
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # format
+    #
+    @property
+    def format(self) -> str:
+        ''' The format used to create the log entries '''
+        return self._format
+
+
+    #
+    # token_map
+    #
+    @property
+    def token_map(self) -> dict:
+        ''' The merged token map '''
+        return self._token_map
+
+
+    #
+    # pattern
+    #
+    @property
+    def pattern(self) -> re.Pattern:
+        ''' The compiled regular expression '''
+        return self._pattern
+
+
+    #
+    # tokenized
+    #
+    @property
+    def tokenized(self) -> bool:
+        ''' True if log strings are split using the delimiters '''
+        return self._layout is not None
+
+
+    #
+    # decoder
+    #
+    @property
+    def decoder(self) -> Callable | None:
+        ''' The decoder generated for the format '''
+        return self._decoder
+
+
+    #
+    # bytes_pattern
+    #
+    @property
+    def bytes_pattern(self) -> re.Pattern:
+        ''' The compiled regular expression, for UTF-8 encoded bytes '''
+        if self._bytes_pattern is None:
+            # Multiline, so '^' matches at the start of any line - The
+            # format is the first alternative, so the group numbers are kept
+            self._bytes_pattern = re.compile(
+                b"(?:" + self._pattern.pattern.encode("utf-8") + b")|^" +
+                re.escape(JSON_PREFIX.encode("utf-8")),
+                re.MULTILINE
+            )
+
+        return self._bytes_pattern
+
+
+    #
+    # timestamp_decoder
+    #
+    @property
+    def timestamp_decoder(self) -> AsctimeDecoder:
+        ''' The decoder used to convert the time into a timestamp '''
+        return self._timestamp_decoder
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _compile
+    #
+    def _compile(self) -> re.Pattern:
+        '''
+        Build the regular expression for the format and compile it
+            
+        Args:
+            None
+        
+        Returns:
+            re.Pattern: The compiled regular expression
+
+        Raises:
+            AssertionError:
+                when mapping is not valid
+        '''
+        # Go through the token map to find any tokens in the format string
+        _re_format = self._format
+        for _attr, _val in self._token_map.items():
+            assert isinstance(_val, dict), "Token map is invalid"
+
+            # The token to look for is the attr surrounded by delimiters
+            _delimiters = _val.get("delimiters", [])
+            assert isinstance(_delimiters, list) and len(_delimiters) > 1, (
+                "Token map delimiters are invalid"
+            )
+
+            _start_delimiter = _delimiters[0]
+            _end_delimiter = _delimiters[1]
+
+            _attr_type = TOKEN_TYPING.get(_attr, "s")
+            _format_token = (
+                f"{_start_delimiter}"
+                f"%({_attr}){_attr_type}"
+                f"{str(_end_delimiter)}"
+            )
+
+            # Replace the token in the format with a regular expression
+            if _start_delimiter in DELIMITERS_TO_ESCAPE:
+                _start_delimiter = f"\\{_start_delimiter}"
+
+            if _end_delimiter in DELIMITERS_TO_ESCAPE:
+                _end_delimiter = f"\\{_end_delimiter}"
+
+            _regexp = (
+                f"{_start_delimiter}"
+                f"(?P<{_attr}>.*)"
+                f"{_end_delimiter}"
+            )
+
+            _re_format = _re_format.replace(_format_token, _regexp)
+
+        # Remove the 'message' attribute
+        # The message attribute is set from everything left over
+        _re_format = _re_format.replace("%(message)s", "")
+
+        _pattern = re.compile(fr"^{_re_format}")
+
+        # Work out where each group in the pattern is stored
+        _groups = []
+        for _key in sorted(_pattern.groupindex, key=_pattern.groupindex.get):
+            _token = self._token_map[_key]
+            _mapto = _token["mapto"]
+
+            # The message is always set from whatever is left over
+            if _mapto in ENTRY_FIELDS and _mapto != "message":
+                _index = ENTRY_FIELDS.index(_mapto)
+            else:
+                _index = -1
+
+            _delims = _token["delimiters"]
+            _groups.append((
+                _index,
+                f"{_delims[0]}",
+                f"{_delims[1]}",
+                _value_converter(token=_key, field=_mapto)
+            ))
+
+        self._groups = tuple(_groups)
+
+        # If several groups map to the same field, the last one is used
+        _field_groups = [ 0 ] * len(ENTRY_FIELDS)
+        for _group, (_index, _, _, _) in enumerate(_groups, start=1):
+            if _index >= 0: _field_groups[_index] = _group
+
+        self._field_groups = tuple(_field_groups)
+
+        return _pattern
+
+
+    #
+    # _compile_layout
+    #
+    def _compile_layout(self) -> tuple | None:
+        '''
+        Work out how to split log strings on the delimiters
+
+        This is only possible when the format is tokens separated by literal
+        text, with the message (if any) at the end.  The layout is checked
+        by building the regular expression from it, which must be the same
+        as the compiled pattern.
+
+        Args:
+            None
+
+        Returns:
+            tuple | None: The text at the start of the log string, the text
+                ending each group (empty if the group runs to the end of the
+                line), and the literal text between the tokens.  None if the
+                format can't be split this way
+
+        Raises:
+            None
+        '''
+        # The tokens which can be found in the format string
+        _tokens = {}
+        for _attr, _val in self._token_map.items():
+            _start, _end = ( str(_d) for _d in _val["delimiters"][:2] )
+            _type = TOKEN_TYPING.get(_attr, "s")
+            _tokens[f"{_start}%({_attr}){_type}{_end}"] = (
+                _attr, _start, _end
+            )
+
+        # Split the format into literal text and tokens
+        _format = self._format
+        _parts = []
+        _literal = ""
+        _pos = 0
+        while _pos < len(_format):
+            if _format.startswith("%(message)s", _pos):
+                # Everything after the message would need to be found
+                # at the end of the message
+                if _pos + len("%(message)s") < len(_format): return None
+                break
+
+            _found = [ _t for _t in _tokens if _format.startswith(_t, _pos) ]
+            if not _found:
+                _literal += _format[_pos]
+                _pos += 1
+                continue
+
+            _token = max(_found, key=len)
+            _parts.append(_literal)
+            _parts.append(_tokens[_token])
+            _literal = ""
+            _pos += len(_token)
+
+        _parts.append(_literal)
+
+        if len(_parts) < 3: return None
+
+        # The literal text must not contain anything special to a regular
+        # expression (or the pattern would not match it literally)
+        def _escape(delimiter: str) -> str:
+            if delimiter in DELIMITERS_TO_ESCAPE: return f"\\{delimiter}"
+            return delimiter
+
+        _re_format = ""
+        for _part in _parts:
+            if isinstance(_part, str):
+                if REGEX_SPECIAL_CHARACTERS.intersection(_part): return None
+                _re_format += _part
+                continue
+
+            _attr, _start, _end = _part
+            for _delimiter in ( _start, _end ):
+                if _escape(_delimiter) != _delimiter: continue
+                if REGEX_SPECIAL_CHARACTERS.intersection(_delimiter):
+                    return None
+
+            _re_format += f"{_escape(_start)}(?P<{_attr}>.*){_escape(_end)}"
+
+        if f"^{_re_format}" != self._pattern.pattern: return None
+
+        # The text at the start, and the text ending each group (the end
+        # delimiter, literal text and the next start delimiter)
+        _prefix = _parts[0] + _parts[1][1]
+        _terminators = []
+        for _index in range(1, len(_parts), 2):
+            _terminator = _parts[_index][2] + _parts[_index + 1]
+            if _index + 2 < len(_parts):
+                _terminator += _parts[_index + 2][1]
+
+                # Can't tell where a group ends without a delimiter
+                if not _terminator: return None
+
+            _terminators.append(_terminator)
+
+        # The literal text left in the message when the values (and their
+        # delimiters) are removed
+        _literal = "".join(_parts[0::2])
+
+        return _prefix, tuple(_terminators), _literal
+
+
+    #
+    # match
+    #
+    def match(
+            self,
+            msg: str = ""
+    ) -> re.Match | _TokenMatch | _JsonMatch | None:
+        '''
+        Match the format against a log string (or its first line)
+
+        Args:
+            msg: (str): The log string
+
+        Returns:
+            re.Match | _TokenMatch | _JsonMatch | None: The result of the
+                match, or None if the log string does not match the format
+
+        Raises:
+            None
+        '''
+        if msg.startswith(JSON_PREFIX):
+            _values = _decode_json(msg)
+            if _values is not None: return _JsonMatch(_values)
+
+        if self._layout is None: return self._pattern.match(msg)
+
+        _prefix, _terminators, _ = self._layout
+        if not msg.startswith(_prefix): return None
+
+        # Only the first line is matched
+        _eol = msg.find("\n")
+        if _eol < 0: _eol = len(msg)
+
+        _pos = len(_prefix)
+        _spans = [ None ]
+        _values = []
+        for _terminator in _terminators:
+            if _terminator:
+                _end = msg.find(_terminator, _pos, _eol)
+                if _end < 0: return None
+            else:
+                _end = _eol
+
+            _spans.append(( _pos, _end ))
+            _values.append(msg[_pos:_end])
+            _pos = _end + len(_terminator)
+
+        _spans[0] = ( 0, _pos )
+
+        return _TokenMatch(msg, tuple(_spans), tuple(_values))
+
+
+    #
+    # _match_line
+    #
+    def _match_line(
+            self,
+            line: str = ""
+    ) -> re.Match | _DecodedMatch | _JsonMatch | None:
+        '''
+        Check whether a line starts an entry (used by the readers)
+
+        For a tokenized format, the line is decoded by the generated decoder
+        (which returns None as soon as a delimiter is not found), and the
+        values are kept so the entry is not split again when decoded.
+
+        Args:
+            line (str): The line
+
+        Returns:
+            re.Match | _DecodedMatch | _JsonMatch | None: The result of the
+                match, or None if the line does not start an entry
+
+        Raises:
+            None
+        '''
+        if line.startswith(JSON_PREFIX):
+            _values = _decode_json(line)
+            if _values is not None: return _JsonMatch(_values)
+
+        if self._raw_decoder is None: return self._pattern.match(line)
+
+        _values = self._raw_decoder(line)
+        if _values is None: return None
+
+        return _DecodedMatch(_values, len(line))
+
+
+    #
+    # decode
+    #
+    def decode(
+            self,
+            msg: str = "",
+            match: re.Match | None = None,
+            convert: bool = True
+    ) -> tuple:
+        '''
+        Decode the message into the entry attributes
+            
+        Args:
+            msg: (str): The log message to be decoded
+            match (re.Match | None): The result of matching the pattern
+                against msg (or its first line), if already known
+            convert (bool): If True, convert numeric values (eg process_id)
+                to numbers, otherwise leave them as strings (eg to convert
+                a column at a time with convert_column)
+        
+        Returns:
+            tuple: The value for each attribute in ENTRY_FIELDS
+
+        Raises:
+            None
+        '''
+        if type(match) is _JsonMatch: return match._values
+
+        if type(match) is _DecodedMatch:
+            if len(msg) != match._length:
+                # Continuation lines are part of the message - Decode the
+                # whole entry
+                match = None
+
+            elif not convert or not self._numeric:
+                return match._values
+
+            else:
+                _values = list(match._values)
+                for _index, _convert in self._numeric.items():
+                    _values[_index] = _convert(_values[_index])
+
+                return tuple(_values)
+
+        if match is None and msg.startswith(JSON_PREFIX):
+            _decoded = _decode_json(msg)
+            if _decoded is not None: return _decoded
+
+        _decoder = self._decoder if convert else self._raw_decoder
+        if _decoder is not None and type(match) is not re.Match:
+            # Decoding again is quicker than using the match
+            _decoded = _decoder(msg)
+            if _decoded is not None: return _decoded
+
+        _values = list(ENTRY_DEFAULTS)
+
+        if match is None: match = self.match(msg)
+        if match:
+            # Process the matched entries
+            for (_index, _, _, _convert), _val in zip(
+                    self._groups, match.groups()):
+                if _index < 0: continue
+
+                if not convert: _convert = self._raw_converter(_convert)
+                _values[_index] = _convert(_val) if _convert else _val
+
+        _values[MESSAGE_INDEX] = self.decode_message(msg=msg, match=match)
+
+        return tuple(_values)
+
+
+    #
+    # decode_message
+    #
+    def decode_message(
+            self,
+            msg: str = "",
+            match: re.Match | None = None
+    ) -> str:
+        '''
+        Decode the message component (whatever is left over) from a message
+            
+        Args:
+            msg: (str): The log message to be decoded
+            match (re.Match | None): The result of matching the pattern
+                against msg (or its first line)
+        
+        Returns:
+            str: The message component
+
+        Raises:
+            None
+        '''
+        if not match: return msg.strip()
+
+        if type(match) is _JsonMatch: return match._values[MESSAGE_INDEX]
+
+        if type(match) is _DecodedMatch or match is _DEFERRED:
+            return self.decode_field(msg=msg, match=match)
+
+        if type(match) is _TokenMatch:
+            # Everything up to the end of the match is values or literal text
+            return (self._layout[2] + msg[match._spans[0][1]:]).strip()
+
+        # Remove each value (and its delimiters) from the entry string - Only
+        # where it was matched, so the same text in the message is kept
+        _pieces = []
+        _pos = 0
+        for _group, (_, _start, _end, _) in enumerate(self._groups, start=1):
+            _pieces.append(msg[_pos:match.start(_group) - len(_start)])
+            _pos = match.end(_group) + len(_end)
+
+        _pieces.append(msg[_pos:])
+
+        # Whatever is left in the message can be used as the message component
+        return "".join(_pieces).strip()
+
+
+    #
+    # _field_decoder
+    #
+    def _field_decoder(self, index: int = 0) -> Callable | None:
+        '''
+        Get the generated decoder for a single attribute (for lazy entries)
+
+        Args:
+            index (int): The position of the attribute in ENTRY_FIELDS
+
+        Returns:
+            Callable | None: The decoder (see _generate_decoder), or None if
+                the format can't be split on the delimiters
+
+        Raises:
+            None
+        '''
+        if self._layout is None: return None
+
+        _decoder = _generate_decoder(
+            *self._layout,
+            tuple(( _group[0], _group[3] ) for _group in self._groups),
+            index
+        )
+        self._field_decoders[index] = _decoder
+
+        return _decoder
+
+
+    #
+    # decode_field
+    #
+    def decode_field(
+            self,
+            msg: str = "",
+            match: re.Match | None = None,
+            index: int = MESSAGE_INDEX
+    ) -> Any:
+        '''
+        Decode a single attribute from a message
+            
+        Args:
+            msg: (str): The log message to be decoded
+            match (re.Match | None): The result of matching the pattern
+                against msg (or its first line)
+            index (int): The position of the attribute in ENTRY_FIELDS
+        
+        Returns:
+            Any: The value of the attribute
+
+        Raises:
+            None
+        '''
+        if match is _DEFERRED:
+            _decoder = None
+            if index != MESSAGE_INDEX:
+                _decoder = self._field_decoders.get(index)
+                if _decoder is None: _decoder = self._field_decoder(index)
+
+            _value = _decoder(msg) if _decoder else None
+            if _value is not None: return _value
+
+            # The message (or a log string not matching the layout)
+            return self.decode(msg=msg)[index]
+
+        if type(match) is _JsonMatch: return match._values[index]
+
+        if type(match) is _DecodedMatch:
+            if index == MESSAGE_INDEX and len(msg) != match._length:
+                # Continuation lines are part of the message
+                return self.decode(msg=msg, match=match)[MESSAGE_INDEX]
+
+            # Only this attribute is converted
+            _value = match._values[index]
+            _convert = self._numeric.get(index)
+
+            return _convert(_value) if _convert else _value
+
+        if index == MESSAGE_INDEX:
+            return self.decode_message(msg=msg, match=match)
+
+        _group = self._field_groups[index]
+        if not match or not _group: return ENTRY_DEFAULTS[index]
+
+        _val = match.group(_group)
+        _convert = self._groups[_group - 1][3]
+
+        return _convert(_val) if _convert else _val
+
+
+    #
+    # convert_column
+    #
+    def convert_column(self, index: int = 0, values: Iterable = ()) -> list:
+        '''
+        Convert the values of an attribute decoded with convert=False
+
+        Each column is converted in a single pass, rather than a value at a
+        time as each log string is decoded.
+
+        Args:
+            index (int): The position of the attribute in ENTRY_FIELDS
+            values (Iterable): The values decoded from the log strings
+
+        Returns:
+            list: The converted values
+
+        Raises:
+            None
+        '''
+        _group = self._field_groups[index]
+        _convert = self._groups[_group - 1][3] if _group else None
+        if _convert is _to_int or _convert is _to_float:
+            return _convert_column(values=values, converter=_convert)
+
+        return list(values)
+
+
+    #
+    # _raw_converter
+    #
+    @staticmethod
+    def _raw_converter(convert: Callable | None) -> Callable | None:
+        '''
+        Get the conversion used when numbers are left as strings
+
+        Args:
+            convert (Callable | None): The function used to convert a value
+
+        Returns:
+            Callable | None: The function (None for numeric conversions)
+
+        Raises:
+            None
+        '''
+        if convert is _to_int or convert is _to_float: return None
+
+        return convert
+
+
+    #
+    # field_delimiters
+    #
+    def field_delimiters(self, field: str = "") -> tuple | None:
+        '''
+        Get the delimiters surrounding an attribute in the log string
+            
+        Args:
+            field (str): The name of the attribute (from ENTRY_FIELDS)
+        
+        Returns:
+            tuple | None: The start and end delimiters, or None if the
+                attribute is not decoded from the format
+
+        Raises:
+            None
+        '''
+        if field not in ENTRY_FIELDS: return None
+
+        _group = self._field_groups[ENTRY_FIELDS.index(field)]
+        if not _group: return None
+
+        _, _start, _end, _ = self._groups[_group - 1]
+
+        return _start, _end
+
+
+###########################################################################
+#
+# LogFormat Cache
+#
+###########################################################################
+#
+# _get_cached_log_format
+#
+@functools.lru_cache(maxsize=LOG_FORMAT_CACHE_SIZE)
+def _get_cached_log_format(format: str, frozen_token_map: tuple) -> LogFormat:
+    '''
+    Create a LogFormat, caching the result
+
+    Args:
+        format (str): The format used to create the log entries
+        frozen_token_map (tuple): The frozen modifications to the token map
+
+    Returns:
+        LogFormat: The compiled log format
+
+    Raises:
+        AssertionError:
+            when format is empty or not a string
+            when mapping is not valid
+    '''
+    return LogFormat(
+        format=format,
+        token_map=_thaw_token_map(frozen=frozen_token_map)
+    )
+
+
+#
+# get_log_format
+#
+def get_log_format(
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {}
+) -> LogFormat:
+    '''
+    Get a compiled log format, re-using a cached one if possible
+
+    Args:
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+
+    Returns:
+        LogFormat: The compiled log format
+
+    Raises:
+        AssertionError:
+            when format is empty or not a string
+            when mapping is not valid
+    '''
+    assert format, "Format is empty"
+    assert isinstance(format, str), "Format is not a string"
+
+    return _get_cached_log_format(format, _freeze_token_map(token_map))
+
+
+###########################################################################
+#
+# LogEntry Class Definition
+#
+###########################################################################
+class LogEntry():
+    '''
+    Class for processing a log string and decoding it
+
+    Attributes:
+        time (str) [ReadOnly]: The time the entry was logged
+        logger_name (str) [ReadOnly]: The name of the logger used
+        severity (str) [ReadOnly]: The severity of the log message
+        source (str) [ReadOnly]: The source of the log message
+        process_id (int) [ReadOnly]: The process ID that logged the message
+        process_name (str) [ReadOnly]: The process Name that logged the message
+        thread_id (int) [ReadOnly]: The thread ID that logged the message
+        thread_name (str) [ReadOnly]: The thread Name that logged the message
+        message (str) [ReadOnly]: The message
+        timestamp (float | None) [ReadOnly]: The time as an epoch timestamp
+        log_format (LogFormat) [ReadOnly]: The log format used to decode
+            the entry
+    '''
+    # Entries are often held in large numbers, so avoid a __dict__
+    __slots__ = (
+        "_log_format",
+        "_raw",
+        "_match",
+        "_time",
+        "_logger_name",
+        "_severity",
+        "_source",
+        "_process_id",
+        "_process_name",
+        "_thread_id",
+        "_thread_name",
+        "_message"
+    )
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            msg: str = "",
+            format: str = DEFAULT_LOG_FORMAT,
+            token_map: dict = {},
+            log_format: LogFormat | None = None,
+            lazy: bool = False
+    ):
+        '''
+        Initialises the instance.
+
+        A number of tokens can be extracted.  The extraction and order of
+        tokens is described by the format
+
+        If lazy, each attribute is decoded when it is first accessed.  The
+        first attribute is decoded on its own, and the message is only
+        split against the format when another attribute is needed.
+
+        Args:
+            msg: (str): The log message to be decoded
+            format (str): The format used to create the log entry
+            token_map (dict): Modifications to the default mapping dict used
+                to extract the tokens
+            log_format (LogFormat | None): A compiled log format to use
+                instead of format and token_map
+            lazy (bool): If True, decode attributes when first accessed
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when mapping is not valid
+                when log_format is not a LogFormat instance
+        '''
+        if log_format is None:
+            log_format = get_log_format(format=format, token_map=token_map)
+
+        assert isinstance(log_format, LogFormat), (
+            "log_format must be a LogFormat instance"
+        )
+
+        # The log format (and token map) is shared by all entries using it
+        self._log_format = log_format
+
+        if lazy:
+            # For a tokenized format, the log string is not split until an
+            # attribute is accessed
+            _match = _DEFERRED
+            if log_format._decoder is None:
+                _match = log_format._match_line(msg)
+
+            self._set_match(msg=msg, match=_match)
+            return
+
+        # Private Attributes - Decode the entry
+        (
+            self._time,
+            self._logger_name,
+            self._severity,
+            self._source,
+            self._process_id,
+            self._process_name,
+            self._thread_id,
+            self._thread_name,
+            self._message
+        ) = log_format.decode(msg=msg)
+
+
+    #
+    # from_values
+    #
+    @classmethod
+    def from_values(
+            cls,
+            values: tuple = ENTRY_DEFAULTS,
+            log_format: LogFormat | None = None
+    ) -> LogEntry:
+        '''
+        Create an entry from values which have already been decoded
+
+        Args:
+            values (tuple): The value for each attribute in ENTRY_FIELDS
+            log_format (LogFormat | None): The log format used to decode the
+                values (the default log format if None)
+
+        Returns:
+            LogEntry: The log entry
+
+        Raises:
+            None
+        '''
+        _entry = cls.__new__(cls)
+        _entry._log_format = log_format or get_log_format()
+
+        (
+            _entry._time,
+            _entry._logger_name,
+            _entry._severity,
+            _entry._source,
+            _entry._process_id,
+            _entry._process_name,
+            _entry._thread_id,
+            _entry._thread_name,
+            _entry._message
+        ) = values
+
+        return _entry
+
+
+    #
+    # from_match
+    #
+    @classmethod
+    def from_match(
+            cls,
+            msg: str = "",
+            match: re.Match | None = None,
+            log_format: LogFormat | None = None
+    ) -> LogEntry:
+        '''
+        Create a lazy entry from a message already matched against the format
+
+        Args:
+            msg: (str): The log message to be decoded
+            match (re.Match | None): The result of matching the pattern
+                against msg (or its first line)
+            log_format (LogFormat | None): The log format used to match the
+                message (the default log format if None)
+
+        Returns:
+            LogEntry: The log entry
+
+        Raises:
+            None
+        '''
+        _entry = cls.__new__(cls)
+        _entry._log_format = log_format or get_log_format()
+        _entry._set_match(msg=msg, match=match)
+
+        return _entry
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # time
+    #
+    @property
+    def time(self) -> str:
+        ''' The time string found in the log entry '''
+        if self._time is _UNDECODED:
+            self._time = self._decode_field("time")
+
+        return self._time
+
+
+    #
+    # logger_name
+    #
+    @property
+    def logger_name(self) -> str:
+        ''' The name of the logger used '''
+        if self._logger_name is _UNDECODED:
+            self._logger_name = self._decode_field("logger_name")
+
+        return self._logger_name
+
+
+    #
+    # severity
+    #
+    @property
+    def severity(self) -> str:
+        ''' The severity of the log message '''
+        if self._severity is _UNDECODED:
+            self._severity = self._decode_field("severity")
+
+        return self._severity
+
+
+    #
+    # source
+    #
+    @property
+    def source(self) -> str:
+        ''' The source of the log message '''
+        if self._source is _UNDECODED:
+            self._source = self._decode_field("source")
+
+        return self._source
+
+
+    #
+    # process_id
+    #
+    @property
+    def process_id(self) -> int:
+        ''' The process ID that logged the message '''
+        if self._process_id is _UNDECODED:
+            self._process_id = self._decode_field("process_id")
+
+        return self._process_id
+
+
+    #
+    # process_name
+    #
+    @property
+    def process_name(self) -> str:
+        ''' The process name that logged the message '''
+        if self._process_name is _UNDECODED:
+            self._process_name = self._decode_field("process_name")
+
+        return self._process_name
+
+
+    #
+    # thread_id
+    #
+    @property
+    def thread_id(self) -> int:
+        ''' The thread ID that logged the message '''
+        if self._thread_id is _UNDECODED:
+            self._thread_id = self._decode_field("thread_id")
+
+        return self._thread_id
+
+
+    #
+    # thread_name
+    #
+    @property
+    def thread_name(self) -> str:
+        ''' The thread name that logged the message '''
+        if self._thread_name is _UNDECODED:
+            self._thread_name = self._decode_field("thread_name")
+
+        return self._thread_name
+
+
+    #
+    # message
+    #
+    @property
+    def message(self) -> str:
+        ''' The  message '''
+        if self._message is _UNDECODED:
+            self._message = self._decode_field("message")
+
+        return self._message
+
+
+    #
+    # timestamp
+    #
+    @property
+    def timestamp(self) -> float | None:
+        ''' The time as an epoch timestamp (None if it can't be decoded) '''
+        return self._log_format.timestamp_decoder.decode(self.time)
+
+
+    #
+    # log_format
+    #
+    @property
+    def log_format(self) -> LogFormat:
+        ''' The log format used to decode the entry '''
+        return self._log_format
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _set_match
+    #
+    def _set_match(self, msg: str = "", match: re.Match | None = None):
+        '''
+        Keep the message and match, so attributes can be decoded when needed
+
+        Args:
+            msg: (str): The log message to be decoded
+            match (re.Match | None): The result of matching the pattern
+                against msg (or its first line)
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if not match:
+            # Nothing to decode - Everything is the message
+            (
+                self._time,
+                self._logger_name,
+                self._severity,
+                self._source,
+                self._process_id,
+                self._process_name,
+                self._thread_id,
+                self._thread_name
+            ) = ENTRY_DEFAULTS[:MESSAGE_INDEX]
+            self._message = msg.strip()
+            return
+
+        self._raw = msg
+        self._match = match
+
+        self._time = _UNDECODED
+        self._logger_name = _UNDECODED
+        self._severity = _UNDECODED
+        self._source = _UNDECODED
+        self._process_id = _UNDECODED
+        self._process_name = _UNDECODED
+        self._thread_id = _UNDECODED
+        self._thread_name = _UNDECODED
+        self._message = _UNDECODED
+
+
+    #
+    # _decode_field
+    #
+    def _decode_field(self, field: str = "") -> Any:
+        '''
+        Decode an attribute of a lazy entry
+
+        Args:
+            field (str): The name of the attribute (from ENTRY_FIELDS)
+
+        Returns:
+            Any: The value of the attribute
+
+        Raises:
+            None
+        '''
+        _index = ENTRY_FIELDS.index(field)
+        _match = self._match
+
+        if _match is _DEFERRED and _index != MESSAGE_INDEX:
+            # The first attribute is decoded on its own
+            self._match = _SPLIT
+            _decoder = self._log_format._field_decoders.get(_index)
+            if _decoder is not None:
+                _value = _decoder(self._raw)
+                if _value is not None: return _value
+
+            return self._log_format.decode_field(
+                msg=self._raw,
+                match=_DEFERRED,
+                index=_index
+            )
+
+        if _match is _DEFERRED or _match is _SPLIT:
+            # More is needed - Split the log string once for the rest
+            _match = self._match = self._log_format._match_line(self._raw)
+
+        return self._log_format.decode_field(
+            msg=self._raw,
+            match=_match,
+            index=_index
+        )
+
+
+
+###########################################################################
+#
+# LogFilter Class Definition
+#
+###########################################################################
+class LogFilter():
+    '''
+    Class for filtering log entries, with cheap checks on the raw bytes of
+    a log string before it is decoded
+
+    For the default format, filtering on the severity 'ERROR' checks the
+    bytes contain b'[ERROR]' (the severity in its delimiters).  Lines which
+    fail the checks can be rejected without a regular expression match or
+    being decoded.
+
+    Attributes:
+        severities (frozenset | None) [ReadOnly]: The severities to accept
+        logger_names (frozenset | None) [ReadOnly]: The logger names to accept
+        contains (str | None) [ReadOnly]: A string the entry must contain
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            severities: Iterable[str] | None = None,
+            logger_names: Iterable[str] | None = None,
+            contains: str | None = None,
+            log_format: LogFormat | None = None,
+            encoding: str = "utf-8"
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            severities (Iterable[str] | None): The severities to accept (any
+                severity if None)
+            logger_names (Iterable[str] | None): The logger names to accept
+                (any logger if None)
+            contains (str | None): A string the entry (including any
+                continuation lines) must contain
+            log_format (LogFormat | None): The log format of the entries
+                (the default log format if None)
+            encoding (str): The encoding of the log strings
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when severities or logger_names is a string
+                when contains is not a string or None
+        '''
+        assert not isinstance(severities, str), (
+            "severities must be a collection of strings"
+        )
+        assert not isinstance(logger_names, str), (
+            "logger_names must be a collection of strings"
+        )
+        assert contains is None or isinstance(contains, str), (
+            "contains must be a string or None"
+        )
+
+        if log_format is None: log_format = get_log_format()
+
+        # Private Attributes
+        self._severities = None
+        if severities is not None: self._severities = frozenset(severities)
+
+        self._logger_names = None
+        if logger_names is not None:
+            self._logger_names = frozenset(logger_names)
+
+        self._contains = contains or None
+        self._contains_bytes = None
+        if self._contains: self._contains_bytes = contains.encode(encoding)
+
+        # The string as written in a JSON line (quotes, etc are escaped)
+        self._contains_json = None
+        self._contains_json_bytes = None
+        if self._contains:
+            _quoted = json.dumps(contains, ensure_ascii=False)
+            self._contains_json = _quoted[1:-1]
+            self._contains_json_bytes = self._contains_json.encode(encoding)
+
+        # For each attribute filtered, the byte strings to look for in the
+        # first line of an entry (one of them must be found) - As written by
+        # the format, or in a JSON line
+        _needles = []
+        for _field, _values in [
+                ("severity", self._severities),
+                ("logger_name", self._logger_names)
+        ]:
+            if _values is None: continue
+
+            _start, _end = log_format.field_delimiters(_field) or ( "", "" )
+            _needles.append(tuple(
+                f"{_start}{_value}{_end}".encode(encoding)
+                for _value in _values
+            ) + tuple(
+                f"\"{_field}\": {json.dumps(_value, ensure_ascii=False)}"
+                .encode(encoding)
+                for _value in _values
+            ))
+
+        self._needles = tuple(_needles)
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # severities
+    #
+    @property
+    def severities(self) -> frozenset | None:
+        ''' The severities to accept '''
+        return self._severities
+
+
+    #
+    # logger_names
+    #
+    @property
+    def logger_names(self) -> frozenset | None:
+        ''' The logger names to accept '''
+        return self._logger_names
+
+
+    #
+    # contains
+    #
+    @property
+    def contains(self) -> str | None:
+        ''' A string the entry must contain '''
+        return self._contains
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # accept_line
+    #
+    def accept_line(self, line: bytes = b"") -> bool:
+        '''
+        Check the first line of an entry, before it is decoded
+
+        This is a quick check - An entry passing the check may still be
+        rejected once it is decoded.
+
+        Args:
+            line (bytes): The first line of the entry
+
+        Returns:
+            bool: False if the entry can't match the filter
+
+        Raises:
+            None
+        '''
+        for _needles in self._needles:
+            for _needle in _needles:
+                if _needle in line: break
+            else:
+                return False
+
+        return True
+
+
+    #
+    # accept_bytes
+    #
+    def accept_bytes(self, data: bytes = b"") -> bool:
+        '''
+        Check an entry (including any continuation lines) contains the
+        string, before it is decoded
+
+        Args:
+            data (bytes): The entry
+
+        Returns:
+            bool: False if the entry does not match the filter
+
+        Raises:
+            None
+        '''
+        if self._contains_bytes is None: return True
+
+        if data.startswith(_JSON_PREFIX_BYTES):
+            return self._contains_json_bytes in data
+
+        return self._contains_bytes in data
+
+
+    #
+    # accept_text
+    #
+    def accept_text(self, msg: str = "") -> bool:
+        '''
+        Check an entry (including any continuation lines) contains the string
+
+        Args:
+            msg (str): The entry
+
+        Returns:
+            bool: False if the entry does not match the filter
+
+        Raises:
+            None
+        '''
+        if self._contains is None: return True
+
+        if msg.startswith(JSON_PREFIX): return self._contains_json in msg
+
+        return self._contains in msg
+
+
+    #
+    # accept
+    #
+    def accept(self, entry: LogEntry) -> bool:
+        '''
+        Check the attributes of a decoded entry
+
+        Args:
+            entry (LogEntry): The decoded entry
+
+        Returns:
+            bool: True if the entry matches the filter
+
+        Raises:
+            None
+        '''
+        if (
+            self._severities is not None and
+            entry.severity not in self._severities
+        ):
+            return False
+
+        if (
+            self._logger_names is not None and
+            entry.logger_name not in self._logger_names
+        ):
+            return False
+
+        return True
+
+
+###########################################################################
+#
+# Readers
+#
+###########################################################################
+#
+# _is_gzip_file
+#
+def _is_gzip_file(filename: str | os.PathLike = "") -> bool:
+    '''
+    Check if a file is compressed with gzip (eg a rotated log file)
+
+    Args:
+        filename (str | os.PathLike): The name of the file
+
+    Returns:
+        bool: True if the file is compressed
+
+    Raises:
+        None
+    '''
+    with open(filename, "rb") as f:
+        return f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+#
+# _open_log_file
+#
+def _open_log_file(filename: str | os.PathLike = "") -> IO:
+    '''
+    Open a log file for reading (binary), decompressing it if compressed
+    with gzip
+
+    Args:
+        filename (str | os.PathLike): The name of the file
+
+    Returns:
+        IO: The file object
+
+    Raises:
+        None
+    '''
+    if _is_gzip_file(filename): return gzip.open(filename, "rb")
+
+    return open(filename, "rb")
+
+
+#
+# _iter_lines
+#
+def _iter_lines(
+        fileobj: IO,
+        buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+        encoding: str = "utf-8"
+) -> Iterator[str]:
+    '''
+    Read a file in large blocks and split it into lines
+
+    Args:
+        fileobj (IO): The file object to read (text or binary)
+        buffer_size (int): The size of the blocks to read
+        encoding (str): The encoding used when the file is binary
+
+    Returns:
+        Iterator[str]: Each line in the file (without the line ending)
+
+    Raises:
+        None
+    '''
+    _remainder = None
+
+    while True:
+        _block = fileobj.read(buffer_size)
+        if not _block: break
+
+        if _remainder: _block = _remainder + _block
+
+        # Only process up to the last complete line in the block
+        if isinstance(_block, bytes):
+            _end = _block.rfind(b"\n")
+            if _end < 0:
+                _remainder = _block
+                continue
+
+            _remainder = _block[_end + 1:]
+            _lines = _block[:_end].decode(encoding, errors="replace")
+
+        else:
+            _end = _block.rfind("\n")
+            if _end < 0:
+                _remainder = _block
+                continue
+
+            _remainder = _block[_end + 1:]
+            _lines = _block[:_end]
+
+        yield from _lines.split("\n")
+
+    # Anything left over is the last line (without a line ending)
+    if _remainder:
+        if isinstance(_remainder, bytes):
+            _remainder = _remainder.decode(encoding, errors="replace")
+
+        yield _remainder
+
+
+#
+# _iter_raw_lines
+#
+def _iter_raw_lines(
+        fileobj: IO,
+        buffer_size: int = DEFAULT_READ_BUFFER_SIZE
+) -> Iterator[bytes]:
+    '''
+    Read a binary file in large blocks and split it into lines
+
+    Args:
+        fileobj (IO): The file object to read (binary)
+        buffer_size (int): The size of the blocks to read
+
+    Returns:
+        Iterator[bytes]: Each line in the file (without the line ending)
+
+    Raises:
+        None
+    '''
+    _remainder = b""
+
+    while True:
+        _block = fileobj.read(buffer_size)
+        if not _block: break
+
+        _lines = (_remainder + _block).split(b"\n")
+        _remainder = _lines.pop()
+
+        yield from _lines
+
+    # Anything left over is the last line (without a line ending)
+    if _remainder: yield _remainder
+
+
+#
+# _join_lines
+#
+def _join_lines(lines: list) -> str:
+    '''
+    Join the lines making up an entry
+
+    Args:
+        lines (list): The lines (which may include line endings)
+
+    Returns:
+        str: The lines joined by newlines
+
+    Raises:
+        None
+    '''
+    if len(lines) == 1: return lines[0]
+
+    return "\n".join([ _line.rstrip("\r\n") for _line in lines ])
+
+
+#
+# _iter_records
+#
+def _iter_records(
+        lines: Iterable[str],
+        log_format: LogFormat,
+        multiline: bool = True
+) -> Iterator[tuple]:
+    '''
+    Match log strings, joining continuation lines to the preceding entry
+
+    A continuation line is any line not matching the format (eg the lines
+    of a traceback).  Blank lines are skipped unless they are part of an
+    entry.  Lines before the first entry are returned on their own.
+
+    Args:
+        lines (Iterable[str]): The log strings to be decoded
+        log_format (LogFormat): The compiled log format
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise return each line on its own
+
+    Returns:
+        Iterator[tuple]: The message for each entry, and the result of
+            matching the format against it (None if it did not match)
+
+    Raises:
+        None
+    '''
+    _match_line = log_format._match_line
+
+    if not multiline:
+        for _line in lines:
+            if _line and not _line.isspace(): yield _line, _match_line(_line)
+
+        return
+
+    # The entry being built - (match, lines)
+    _match = None
+    _lines = []
+
+    for _line in lines:
+        _line_match = _match_line(_line)
+        if _line_match:
+            if _lines: yield _join_lines(_lines), _match
+
+            _match = _line_match
+            _lines = [ _line ]
+
+        elif _lines:
+            # A continuation of the current entry
+            _lines.append(_line)
+
+        elif _line and not _line.isspace():
+            # Not part of an entry
+            yield _line, None
+
+    if _lines: yield _join_lines(_lines), _match
+
+
+#
+# _iter_decoded
+#
+def _iter_decoded(
+        lines: Iterable[str],
+        log_format: LogFormat,
+        multiline: bool = True
+) -> Iterator[tuple]:
+    '''
+    Decode log strings for a tokenized format, joining continuation lines
+    to the preceding entry (as _iter_records, then LogFormat.decode)
+
+    Each line is decoded once by the generated decoder, straight to the
+    values, so no match is kept and a single line entry is not joined or
+    decoded again.
+
+    Args:
+        lines (Iterable[str]): The log strings to be decoded
+        log_format (LogFormat): The compiled log format (with a decoder)
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise decode each line on its own
+
+    Returns:
+        Iterator[tuple]: The value for each attribute in ENTRY_FIELDS, for
+            each entry
+
+    Raises:
+        None
+    '''
+    _decode = log_format.decode
+    _decoder = log_format._decoder
+
+    if not multiline:
+        for _line in lines:
+            if _line and not _line.isspace(): yield _decode(_line)
+
+        return
+
+    # The entry being built - Its values, first line and any continuation
+    # lines (None if there are none, or the entry is a JSON line)
+    _values = None
+    _first = ""
+    _more = None
+    _json = False
+
+    for _line in lines:
+        _line_values = None
+        if _line.startswith(JSON_PREFIX):
+            _line_values = _decode_json(_line)
+
+        _line_json = _line_values is not None
+        if not _line_json: _line_values = _decoder(_line)
+
+        if _line_values is not None:
+            if _more: yield _decode(_join_lines(_more))
+            elif _values is not None: yield _values
+
+            _values = _line_values
+            _first = _line
+            _more = None
+            _json = _line_json
+
+        elif _values is not None:
+            # A continuation of the current entry (the values of a JSON
+            # line are complete)
+            if _json: continue
+
+            if _more is None: _more = [ _first ]
+            _more.append(_line)
+
+        elif _line and not _line.isspace():
+            # Not part of an entry
+            yield _decode(_line)
+
+    if _more: yield _decode(_join_lines(_more))
+    elif _values is not None: yield _values
+
+
 #
-# Global Variables
+# _iter_filtered_records
+#
+def _iter_filtered_records(
+        lines: Iterable[bytes],
+        log_format: LogFormat,
+        log_filter: LogFilter,
+        multiline: bool = True,
+        encoding: str = "utf-8"
+) -> Iterator[tuple]:
+    '''
+    Match log strings, rejecting entries using cheap checks on the bytes
+    before they are decoded
+
+    Lines are only matched against the format when they pass the checks,
+    or follow an entry which passed (to find the end of the entry).  Lines
+    not part of an entry are skipped.
+
+    Args:
+        lines (Iterable[bytes]): The log strings to be decoded
+        log_format (LogFormat): The compiled log format
+        log_filter (LogFilter): The filter to apply
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise return each line on its own
+        encoding (str): The encoding of the log strings
+
+    Returns:
+        Iterator[tuple]: The message for each entry, and the result of
+            matching the format against it (None if it did not match)
+
+    Raises:
+        None
+    '''
+    _match_line = log_format._match_line
+    _accept_line = log_filter.accept_line
+    _accept_bytes = log_filter.accept_bytes
+
+    if not multiline:
+        for _raw in lines:
+            if not _raw or _raw.isspace(): continue
+            if not (_accept_line(_raw) and _accept_bytes(_raw)): continue
+
+            _line = _raw.decode(encoding, errors="replace")
+            yield _line, _match_line(_line)
+
+        return
+
+    # The entry being built - (match, lines)
+    _match = None
+    _lines = []
+
+    for _raw in lines:
+        if not _lines:
+            # Nothing to finish - Only look at lines passing the checks
+            if not _accept_line(_raw): continue
+
+            _line = _raw.decode(encoding, errors="replace")
+            _match = _match_line(_line)
+            if _match: _lines = [ _raw ]
+            continue
+
+        _line = _raw.decode(encoding, errors="replace")
+        _line_match = _match_line(_line)
+        if not _line_match:
+            # A continuation of the current entry
+            _lines.append(_raw)
+            continue
+
+        # The current entry is complete
+        _data = b"\n".join([ _l.rstrip(b"\r") for _l in _lines ])
+        if _accept_bytes(_data):
+            yield _data.decode(encoding, errors="replace"), _match
+
+        _match = _line_match
+        _lines = [ _raw ] if _accept_line(_raw) else []
+
+    if _lines:
+        _data = b"\n".join([ _l.rstrip(b"\r") for _l in _lines ])
+        if _accept_bytes(_data):
+            yield _data.decode(encoding, errors="replace"), _match
+
+
+#
+# iter_entries
+#
+def iter_entries(
+        source: LogSource = "",
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        lazy: bool = False,
+        severities: Iterable[str] | None = None,
+        logger_names: Iterable[str] | None = None,
+        contains: str | None = None
+) -> Iterator[LogEntry]:
+    '''
+    Lazily decode each log entry in a log file
+
+    The file is read in large blocks and split into lines, so memory use
+    does not depend on the size of the file.  Blank lines are skipped.  Log
+    files compressed with gzip are decompressed as they are read.
+
+    Lines not matching the format (eg a traceback) are joined to the
+    preceding entry, in a single pass.
+
+    When filtering a binary file, entries are rejected using cheap checks on
+    the raw bytes (see LogFilter) before being matched or decoded.
+
+    Args:
+        source (LogSource): The path of the log file, or a file object
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        log_format (LogFormat | None): A compiled log format to use
+            instead of format and token_map
+        buffer_size (int): The size of the blocks to read
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise decode each line on its own
+        lazy (bool): If True, the attributes of each entry are decoded when
+            first accessed
+        severities (Iterable[str] | None): Only return entries with one of
+            these severities (any severity if None)
+        logger_names (Iterable[str] | None): Only return entries from one of
+            these loggers (any logger if None)
+        contains (str | None): Only return entries (including any
+            continuation lines) containing this string
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        AssertionError:
+            when source is empty
+            when mapping is not valid
+            when buffer_size is not a positive integer
+            when the filter is not valid
+    '''
+    assert source, "Empty source supplied."
+    assert isinstance(buffer_size, int) and buffer_size > 0, (
+        "buffer_size must be a positive integer"
+    )
+
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
+
+    _filter = None
+    if severities is not None or logger_names is not None or contains:
+        _filter = LogFilter(
+            severities=severities,
+            logger_names=logger_names,
+            contains=contains,
+            log_format=log_format,
+            encoding=encoding
+        )
+
+    # The file is opened here, rather than in a nested call, to avoid an
+    # extra generator frame for every entry
+    _file = None
+    if isinstance(source, (str, os.PathLike)):
+        _file = source = _open_log_file(source)
+
+    try:
+        if _filter is None and not lazy and log_format._decoder is not None:
+            # Nothing to check - Decode each line straight to the values
+            _from_values = LogEntry.from_values
+            for _values in _iter_decoded(
+                    lines=_iter_lines(
+                        fileobj=source,
+                        buffer_size=buffer_size,
+                        encoding=encoding
+                    ),
+                    log_format=log_format,
+                    multiline=multiline
+            ):
+                yield _from_values(_values, log_format)
+
+            return
+
+        if _filter and not isinstance(source, io.TextIOBase):
+            # Check the bytes before decoding
+            _records = _iter_filtered_records(
+                lines=_iter_raw_lines(fileobj=source, buffer_size=buffer_size),
+                log_format=log_format,
+                log_filter=_filter,
+                multiline=multiline,
+                encoding=encoding
+            )
+
+        else:
+            _records = _iter_records(
+                lines=_iter_lines(
+                    fileobj=source,
+                    buffer_size=buffer_size,
+                    encoding=encoding
+                ),
+                log_format=log_format,
+                multiline=multiline
+            )
+
+            if _filter:
+                _records = (
+                    _record for _record in _records
+                    if _filter.accept_text(_record[0])
+                )
+
+        if lazy:
+            _from_match = LogEntry.from_match
+            for _msg, _match in _records:
+                _entry = _from_match(
+                    msg=_msg,
+                    match=_match,
+                    log_format=log_format
+                )
+
+                if _filter and not _filter.accept(_entry): continue
+
+                yield _entry
+
+        else:
+            _decode = log_format.decode
+            _from_values = LogEntry.from_values
+            for _msg, _match in _records:
+                _entry = _from_values(_decode(_msg, _match), log_format)
+
+                if _filter and not _filter.accept(_entry): continue
+
+                yield _entry
+
+    finally:
+        if _file is not None: _file.close()
+
+
+#
+# _scan_buffer
+#
+def _scan_buffer(
+        buffer: bytes | mmap.mmap = b"",
+        search: re.Pattern | None = None,
+        predicate: Callable[[bytes], bool] | None = None,
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8"
+) -> Iterator[LogEntry]:
+    '''
+    Search a buffer of log lines, only decoding the matching entries
+
+    Args:
+        buffer (bytes | mmap.mmap): The log lines
+        search (re.Pattern | None): A bytes regular expression to search
+            for in each line.  If None, every line matching the format is
+            returned
+        predicate (Callable[[bytes], bool] | None): Called with the raw
+            bytes of each line found (without the line ending), only lines
+            for which it returns True are decoded
+        log_format (LogFormat): The compiled log format
+        encoding (str): The encoding of the log lines
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        None
+    '''
+    _format_match = log_format.bytes_pattern.match
+    _size = len(buffer)
+
+    _pos = 0
+    while _pos < _size:
+        if search:
+            # Find the next match, and the start of its line
+            _match = search.search(buffer, _pos)
+            if not _match: break
+
+            _start = buffer.rfind(b"\n", _pos, _match.start()) + 1
+            if _start <= 0: _start = _pos
+
+        else:
+            _start = _pos
+
+        _end = buffer.find(b"\n", _start)
+        if _end < 0: _end = _size
+
+        if _format_match(buffer, _start, _end):
+            _line = buffer[_start:_end]
+            if predicate is None or predicate(_line):
+                yield LogEntry(
+                    msg=_line.decode(encoding, errors="replace"),
+                    log_format=log_format
+                )
+
+        _pos = _end + 1
+
+
+#
+# scan_entries
 #
+def scan_entries(
+        filename: str = "",
+        search: str | bytes | re.Pattern | None = None,
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8",
+        predicate: Callable[[bytes], bool] | None = None
+) -> Iterator[LogEntry]:
+    '''
+    Search a memory mapped log file, only decoding the matching entries
+
+    The search and the format regular expression are run directly over the
+    bytes of the file.  Only lines containing a match for search, which
+    match the format and which are accepted by predicate, are decoded into
+    a LogEntry.  Log files compressed with gzip are searched a block at a
+    time as they are decompressed.
+
+    The predicate is called with the raw bytes of each line, so lines can
+    be selected without writing a regular expression, eg on severity:
+
+        predicate=LogFilter(severities=[ "ERROR" ]).accept_line
+
+    Args:
+        filename (str): The name of the log file
+        search (str | bytes | re.Pattern | None): A regular expression to
+            search for in each line (as bytes).  If None, every line
+            matching the format is returned
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        log_format (LogFormat | None): A compiled log format to use
+            instead of format and token_map
+        encoding (str): The encoding of the log file
+        predicate (Callable[[bytes], bool] | None): Called with the raw
+            bytes of each line (without the line ending), only lines for
+            which it returns True are decoded.  If None, every line is
+            decoded
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when mapping is not valid
+            when search is not a bytes regular expression
+            when predicate is not callable or None
+    '''
+    assert filename, "Empty filename supplied."
+    assert isinstance(filename, str), "Filename must be a string."
+
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
+
+    if isinstance(search, str): search = search.encode(encoding)
+    if isinstance(search, bytes): search = re.compile(search)
+    assert search is None or (
+        isinstance(search, re.Pattern) and isinstance(search.pattern, bytes)
+    ), "search must be a bytes regular expression"
+    assert predicate is None or callable(predicate), (
+        "predicate must be callable or None"
+    )
+
+    if _is_gzip_file(filename):
+        # Can't be memory mapped - Scan the decompressed blocks
+        with gzip.open(filename, "rb") as f:
+            _remainder = b""
+            while True:
+                _block = f.read(DEFAULT_READ_BUFFER_SIZE)
+                if not _block: break
+
+                # Only scan complete lines
+                _data = _remainder + _block
+                _end = _data.rfind(b"\n") + 1
+                _remainder = _data[_end:]
+
+                yield from _scan_buffer(
+                    buffer=_data[:_end],
+                    search=search,
+                    predicate=predicate,
+                    log_format=log_format,
+                    encoding=encoding
+                )
+
+            yield from _scan_buffer(
+                buffer=_remainder,
+                search=search,
+                predicate=predicate,
+                log_format=log_format,
+                encoding=encoding
+            )
+
+        return
+
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0: return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as _map:
+            yield from _scan_buffer(
+                buffer=_map,
+                search=search,
+                predicate=predicate,
+                log_format=log_format,
+                encoding=encoding
+            )
 
 
 ###########################################################################
 #
-# LogEntry Class Definition
+# EncodedColumn Class Definition
 #
 ###########################################################################
-class LogEntry():
+class EncodedColumn():
     '''
-    Class for processing a log string and decoding it
+    Class to hold a dictionary encoded column
+
+    Each distinct value is stored once, and each row holds the (small
+    integer) code for its value.  The codes are held in the smallest array
+    type that fits, so a column with few distinct values (eg severity) uses
+    a byte per row rather than a reference to a string.
+
+    Comparing codes is quicker than comparing strings, eg to select the
+    rows with a value:
+
+        _code = column.code("ERROR")
+        _rows = [ _i for _i, _c in enumerate(column.codes) if _c == _code ]
 
     Attributes:
-        time (str) [ReadOnly]: The time the entry was logged
-        logger_name (str) [ReadOnly]: The name of the logger used
-        severity (str) [ReadOnly]: The severity of the log message
-        source (str) [ReadOnly]: The source of the log message
-        process_id (int) [ReadOnly]: The process ID that logged the message
-        process_name (str) [ReadOnly]: The process Name that logged the message
-        thread_id (int) [ReadOnly]: The thread ID that logged the message
-        thread_name (str) [ReadOnly]: The thread Name that logged the message
-        message (str) [ReadOnly]: The message
+        codes (array.array) [ReadOnly]: The code for each row (a NumPy
+            array if requested from parse_many)
+        values (tuple) [ReadOnly]: The distinct values, indexed by code
     '''
 
+    __slots__ = ( "_codes", "_values", "_lookup" )
+
+
     #
     # __init__
     #
-    def __init__(
-            self,
-            msg: str = "",
-            format: str = DEFAULT_LOG_FORMAT,
-            token_map: dict = {}
-    ):
+    def __init__(self, values: Iterable = ()):
         '''
         Initialises the instance.
 
-        A number of tokens can be extracted.  The extraction and order of
-        tokens is described by the format
-
         Args:
-            msg: (str): The log message to be decoded
-            format (str): The format used to create the log entry
-            token_map (dict): Modifications to the default mapping dict used
-                to extract the tokens
+            values (Iterable): The value for each row
 
         Returns:
             None
 
         Raises:
-            AssertionError:
-                when mapping is not valid
+            None
         '''
-        # Private Attributes
-        self._time = ""
-        self._logger_name = ""
-        self._severity = ""
-        self._source = ""
-        self._process_id = 0
-        self._process_name = ""
-        self._thread_id = 0
-        self._thread_name = ""
-        self._message = ""
-
-        # The token map
-        self._token_map = {}
-
-        # Manually merge in the default token map
-        self._merge_token_map(token_map=DEFAULT_TOKEN_MAP)
-
-        # Manually merge in any changes to the token map
-        self._merge_token_map(token_map=token_map)
+        _lookup = {}
+        _codes = [
+            _lookup.setdefault(_value, len(_lookup)) for _value in values
+        ]
 
-        # Attributes
+        _typecode = next(
+            _type for _size, _type in ENCODED_TYPECODES
+            if len(_lookup) <= _size
+        )
 
-        # Decode the entry
-        self._decode_log_entry(msg=msg, format=format)
+        # Private Attributes
+        self._codes = array.array(_typecode, _codes)
+        self._values = tuple(_lookup)
+        self._lookup = _lookup
 
 
     ###########################################################################
@@ -184,245 +3073,320 @@ class LogEntry():
     #
     ###########################################################################
     #
-    # time
+    # codes
     #
     @property
-    def time(self) -> str:
-        ''' The time string found in the log entry '''
-        return self._time
+    def codes(self) -> array.array:
+        ''' The code for each row '''
+        return self._codes
 
 
     #
-    # logger_name
+    # values
     #
     @property
-    def logger_name(self) -> str:
-        ''' The name of the logger used '''
-        return self._logger_name
+    def values(self) -> tuple:
+        ''' The distinct values, indexed by code '''
+        return self._values
 
 
+    ###########################################################################
     #
-    # severity
+    # Methods
     #
-    @property
-    def severity(self) -> str:
-        ''' The severity of the log message '''
-        return self._severity
-
-
+    ###########################################################################
     #
-    # source
+    # __len__
     #
-    @property
-    def source(self) -> str:
-        ''' The source of the log message '''
-        return self._source
+    def __len__(self) -> int:
+        ''' The number of rows '''
+        return len(self._codes)
 
 
     #
-    # process_id
+    # __getitem__
     #
-    @property
-    def process_id(self) -> int:
-        ''' The process ID that logged the message '''
-        return self._process_id
+    def __getitem__(self, index: int) -> Any:
+        ''' The value of a row '''
+        return self._values[self._codes[index]]
 
 
     #
-    # process_name
+    # __iter__
     #
-    @property
-    def process_name(self) -> str:
-        ''' The process name that logged the message '''
-        return self._process_name
+    def __iter__(self) -> Iterator[Any]:
+        ''' The value of each row '''
+        return map(self._values.__getitem__, self._codes)
 
 
     #
-    # thread_id
+    # from_codes
     #
-    @property
-    def thread_id(self) -> int:
-        ''' The thread ID that logged the message '''
-        return self._thread_id
+    @classmethod
+    def from_codes(
+            cls,
+            codes: Iterable[int] = (),
+            values: Iterable = ()
+    ) -> EncodedColumn:
+        '''
+        Create a column from values which have already been encoded
 
+        Args:
+            codes (Iterable[int]): The code for each row.  An array (eg
+                array.array, a memoryview or a NumPy array) is used as is
+            values (Iterable): The distinct values, indexed by code
 
-    #
-    # thread_name
-    #
-    @property
-    def thread_name(self) -> str:
-        ''' The thread name that logged the message '''
-        return self._thread_name
+        Returns:
+            EncodedColumn: The column
+
+        Raises:
+            None
+        '''
+        _column = cls.__new__(cls)
+        _column._values = tuple(values)
+        _column._lookup = {
+            _value: _code for _code, _value in enumerate(_column._values)
+        }
+
+        # Anything other than an array (eg a list) is copied into one
+        _is_array = isinstance(codes, (array.array, memoryview)) or hasattr(
+            codes, "__array_interface__"
+        )
+        if not _is_array:
+            _typecode = next(
+                _type for _size, _type in ENCODED_TYPECODES
+                if len(_column._values) <= _size
+            )
+            codes = array.array(_typecode, codes)
 
+        _column._codes = codes
 
-    #
-    # message
-    #
-    @property
-    def message(self) -> str:
-        ''' The  message '''
-        return self._message
+        return _column
 
 
-    ###########################################################################
-    #
-    # Methods
     #
-    ###########################################################################
-    #
-    # _merge_token_map
+    # code
     #
-    def _merge_token_map(self, token_map: dict = {}):
+    def code(self, value: Any = "") -> int | None:
         '''
-        Merge in any changes to the token map
-            
+        Get the code for a value
+
         Args:
-            token_map (dict): Dict containing updates to the token map
-        
+            value (Any): The value
+
         Returns:
-            None
+            int | None: The code, or None if no row has the value
 
         Raises:
-            AssertionError:
-                when token_map is not a dict
+            None
         '''
-        assert isinstance(token_map, dict), "map must be a dict"
-
-        # Go through token_map and merge in any items
-        for _key, _val in token_map.items():
-            # Make sure the entry contains a sub-dict
-            assert isinstance(_val, dict), (
-                f"Invalid token mapping entry: {_key}"
-            )
-
-            # Create a new entry
-            _entry = {}
-
-            # Go through the list of attributes to process
-            for _attr in [ "mapto", "delimiters" ]:
-                if _attr in _val:
-                    # The map contains the attribute - Just set it
-                    _entry[_attr] = _val[_attr]
-
-                else:
-                    # See if there is a default for the attribute
-                    _default_entry = DEFAULT_TOKEN_MAP.get(_key, {})
-
-                    if _attr in _default_entry:
-                        # There is an entry in the default map
-                        _entry[_attr] = _default_entry[_attr]
-
-                    else:
-                        # Create an entry based on some sensible defaults
-                        if _attr in [ "mapto", ]:
-                            _entry[_attr] = ""
-                        elif _attr in [ "delimiters", ]:
-                            _entry[_attr] = [ "[", "]" ]
-
-            # Ensure mapto is a string
-            assert isinstance(_entry["mapto"], str), (
-                f"mapto must be a string: {_key}"
-            )
-
-            # Make sure delimiters is a list
-            assert isinstance(_entry["delimiters"], list), (
-                f"delimiters must be a list: {_key}"
-            )
-
-            # Add the entry
-            self._token_map[_key] = _entry
+        return self._lookup.get(value)
 
 
     #
-    # _decode_log_entry
+    # decode
     #
-    def _decode_log_entry(self, msg: str = "", format: str = ""):
+    def decode(self) -> list:
         '''
-        Decode the message into the tokens
-            
+        Get the value of each row
+
         Args:
-            msg: (str): The log message to be decoded
-            format (str): The format used to create the log entry
-        
-        Returns:
             None
 
+        Returns:
+            list: The values
+
         Raises:
-            AssertionError:
-                when format is empty or not a string
-                when mapping is not valid
+            None
         '''
-        assert format, "Format is empty"
-        assert isinstance(format, str), "Format is not a string"
+        return list(self)
 
-        _decoded_msg = msg
 
-        # Go through the token map to find any tokens in the format string
-        _re_format = format
-        for _attr, _val in self._token_map.items():
-            assert isinstance(_val, dict), "Token map is invalid"
+###########################################################################
+#
+# Column Mode
+#
+###########################################################################
+#
+# _import_numpy
+#
+def _import_numpy() -> Any:
+    '''
+    Import NumPy (which is an optional dependency)
 
-            # The token to look for is the attr surrounded by delimiters
-            _delimiters = _val.get("delimiters", [])
-            assert isinstance(_delimiters, list) and len(_delimiters) > 1, (
-                "Token map delimiters are invalid"
-            )
+    Args:
+        None
 
-            _start_delimiter = _delimiters[0]
-            _end_delimiter = _delimiters[1]
+    Returns:
+        Any: The numpy module
 
-            _attr_type = TOKEN_TYPING.get(_attr, "s")
-            _format_token = (
-                f"{_start_delimiter}"
-                f"%({_attr}){_attr_type}"
-                f"{str(_end_delimiter)}"
-            )
+    Raises:
+        ImportError:
+            when NumPy is not installed
+    '''
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy must be installed to return NumPy arrays")
 
-            # Replace the token in the format with a regular expression
-            if _start_delimiter in DELIMITERS_TO_ESCAPE:
-                _start_delimiter = f"\\{_start_delimiter}"
+    return numpy
 
-            if _end_delimiter in DELIMITERS_TO_ESCAPE:
-                _end_delimiter = f"\\{_end_delimiter}"
 
-            _regexp = (
-                f"{_start_delimiter}"
-                f"(?P<{_attr}>.*)"
-                f"{_end_delimiter}"
-            )
+#
+# parse_many
+#
+def parse_many(
+        lines: Iterable[str] = (),
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        columns: Iterable[str] | None = None,
+        numpy: bool = False,
+        multiline: bool = True,
+        encode: bool = False
+) -> dict:
+    '''
+    Decode many log strings into columns, without creating LogEntry objects
+
+    Blank lines are skipped.  Lines not matching the format (eg a traceback)
+    are joined to the preceding entry.
+
+    Args:
+        lines (Iterable[str]): The log strings to be decoded
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        log_format (LogFormat | None): A compiled log format to use
+            instead of format and token_map
+        columns (Iterable[str] | None): The columns to return (from
+            COLUMN_FIELDS).  All of ENTRY_FIELDS are returned if None
+        numpy (bool): If True, return NumPy arrays rather than lists
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise decode each line on its own
+        encode (bool): If True, the columns with few distinct values (in
+            INTERNED_FIELDS) are returned as an EncodedColumn
+
+    Returns:
+        dict: A list (or array) of values for each column, keyed by name
+
+    Raises:
+        AssertionError:
+            when mapping is not valid
+            when a column is not valid
+        ImportError:
+            when numpy is True but NumPy is not installed
+    '''
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
 
-            _re_format = _re_format.replace(_format_token, _regexp)
+    if columns is None: columns = ENTRY_FIELDS
+    columns = tuple(columns)
 
-        # Remove the 'message' attribute
-        # The message attribute is set from everything left over
-        _re_format = _re_format.replace("%(message)s", "")
+    for _column in columns:
+        assert _column in COLUMN_FIELDS, f"Invalid column: {_column}"
 
-        match = re.match(fr"^{_re_format}", msg)
-        if match:
-            # Process the matched entries
-            for _key, _val in match.groupdict().items():
-                # Get the mapto property, and set the attr in the instance
-                _token = self._token_map.get(_key, None)
-                if _token and isinstance(_token, dict):
-                    _mapto = _token.get("mapto", None)
-                    _delims = _token.get("delimiters", [])
-                else:
-                    _mapto = None
-                    _delims = []
+    return _decode_columns(
+        records=_iter_records(
+            lines=lines,
+            log_format=log_format,
+            multiline=multiline
+        ),
+        log_format=log_format,
+        columns=columns,
+        numpy=numpy,
+        encode=encode
+    )
 
-                if _mapto and hasattr(self, f"_{_mapto}"):
-                    setattr(self, f"_{_mapto}", _val)
 
-                # Remove the val from the entry string
-                assert isinstance(_delims, list) and len(_delims) > 1, (
-                    "Token map delimiters are invalid"
+#
+# _decode_columns
+#
+def _decode_columns(
+        records: Iterable[tuple],
+        log_format: LogFormat,
+        columns: tuple = ENTRY_FIELDS,
+        numpy: bool = False,
+        encode: bool = False
+) -> dict:
+    '''
+    Decode log entries into columns
+
+    Args:
+        records (Iterable[tuple]): The message for each entry, and the
+            result of matching the format against it (eg from _iter_records)
+        log_format (LogFormat): The compiled log format
+        columns (tuple): The columns to return (from COLUMN_FIELDS)
+        numpy (bool): If True, return NumPy arrays rather than lists
+        encode (bool): If True, the columns with few distinct values (in
+            INTERNED_FIELDS) are returned as an EncodedColumn
+
+    Returns:
+        dict: A list (or array) of values for each column, keyed by name
+
+    Raises:
+        ImportError:
+            when numpy is True but NumPy is not installed
+    '''
+    _np = _import_numpy() if numpy else None
+
+    # The position in ENTRY_FIELDS of the field each column is built from
+    _indices = [
+        ENTRY_FIELDS.index("time" if _column == "timestamp" else _column)
+        for _column in columns
+    ]
+
+    # Append each decoded value straight onto the list for its field, so
+    # only one entry is held at a time (numbers are converted a column at
+    # a time)
+    _fields = { _index: [] for _index in _indices }
+    _appends = [
+        ( _index, _field.append ) for _index, _field in _fields.items()
+    ]
+
+    _decode = log_format.decode
+    for _msg, _match in records:
+        _values = _decode(_msg, match=_match, convert=False)
+        for _index, _append in _appends: _append(_values[_index])
+
+    _columns = {}
+    for _position, _column in enumerate(columns):
+        _index = _indices[_position]
+
+        # Release each field once the last column using it has been built
+        if _index in _indices[_position + 1:]:
+            _field = _fields[_index]
+
+        else:
+            _field = _fields.pop(_index)
+
+        if _column == "timestamp":
+            # Decode the time column in a single pass
+            _decode_timestamp = log_format.timestamp_decoder.decode
+            _values = [ _decode_timestamp(_time) for _time in _field ]
+
+            if _np:
+                _columns[_column] = _np.array(_values, dtype=float)
+                continue
+
+        else:
+            _values = log_format.convert_column(index=_index, values=_field)
+
+        del _field
+
+        if encode and _column in INTERNED_FIELDS:
+            _encoded = EncodedColumn(_values)
+            if _np:
+                _encoded = EncodedColumn.from_codes(
+                    _np.asarray(_encoded.codes),
+                    _encoded.values
                 )
-                _val_to_del = f"{_delims[0]}{_val}{_delims[1]}"
 
-                _decoded_msg = _decoded_msg.replace(_val_to_del, "")
+            _columns[_column] = _encoded
+            continue
 
-        # Whatever is left in the message can be used as the message component
-        self._message = _decoded_msg.strip()
+        _columns[_column] = _np.array(_values) if _np else _values
+
+    return _columns
 
 
 ###########################################################################
@@ -0,0 +1,834 @@
+#!/usr/bin/env python3
+'''
+Follow - Functions for following a log file as it is written
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import re
+import sys
+import time
+import struct
+import ctypes
+import ctypes.util
+import select
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.entry import (
+    DEFAULT_READ_BUFFER_SIZE,
+    LogEntry,
+    LogFormat,
+    get_log_format
+)
+
+# Imports for python variable type hints
+from typing import IO, Iterable, Iterator
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# Polling intervals (in seconds) - The interval doubles while the file is
+# idle, up to the maximum
+DEFAULT_POLL_INTERVAL = 0.05
+DEFAULT_MAX_POLL_INTERVAL = 2.0
+
+# The time (in seconds) the last entry is held, waiting for more
+# continuation lines, once the file is idle
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+# inotify events (see inotify(7)) - The directory is watched, so the
+# replacement of the file on rotation is seen.  Events for other files in
+# the directory are ignored
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+INOTIFY_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+    IN_DELETE
+)
+
+# The header of each event read (wd, mask, cookie, len), followed by len
+# bytes of (null padded) name
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+#
+# Global Variables
+#
+
+# The libc functions for inotify (False if not yet loaded)
+_inotify_libc = False
+
+
+###########################################################################
+#
+# File Watcher
+#
+###########################################################################
+#
+# _load_inotify
+#
+def _load_inotify() -> ctypes.CDLL | None:
+    '''
+    Load the inotify functions from libc (Linux only)
+
+    Args:
+        None
+
+    Returns:
+        ctypes.CDLL | None: libc, or None if inotify is not available
+
+    Raises:
+        None
+    '''
+    global _inotify_libc
+
+    if _inotify_libc is not False: return _inotify_libc
+
+    _inotify_libc = None
+    if not sys.platform.startswith("linux"): return None
+
+    try:
+        _libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6",
+            use_errno=True
+        )
+        _libc.inotify_init1.argtypes = [ ctypes.c_int ]
+        _libc.inotify_init1.restype = ctypes.c_int
+        _libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32
+        ]
+        _libc.inotify_add_watch.restype = ctypes.c_int
+
+    except (OSError, AttributeError):
+        return None
+
+    _inotify_libc = _libc
+
+    return _inotify_libc
+
+
+#
+# _FileWatcher
+#
+class _FileWatcher():
+    '''
+    Wait for a file to change
+
+    inotify is used where available (the wait ends as soon as the file, or
+    a file rotated from it, changes in the directory containing it).
+    Otherwise the file is polled, with the interval backing off while the
+    file is idle.
+
+    Attributes:
+        uses_inotify (bool) [ReadOnly]: True if inotify is being used
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            filename: str = "",
+            poll_interval: float = DEFAULT_POLL_INTERVAL,
+            max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+            inotify: bool = True
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            filename (str): The name of the file to watch
+            poll_interval (float): The initial polling interval (in seconds)
+            max_poll_interval (float): The maximum polling interval (in
+                seconds).  Also the longest wait when using inotify
+            inotify (bool): Use inotify if available
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._interval = poll_interval
+        self._fd = -1
+
+        # The names of the files in the directory which end a wait - The
+        # file itself, and the files rotated from it (eg app.log.1)
+        self._name = os.fsencode(os.path.basename(filename))
+        self._rotated_prefix = self._name + b"."
+
+        _libc = _load_inotify() if inotify else None
+        if not _libc: return
+
+        _fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if _fd < 0: return
+
+        _dir = os.path.dirname(os.path.abspath(filename))
+        if _libc.inotify_add_watch(_fd, os.fsencode(_dir), INOTIFY_MASK) < 0:
+            os.close(_fd)
+            return
+
+        self._fd = _fd
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # uses_inotify
+    #
+    @property
+    def uses_inotify(self) -> bool:
+        ''' True if inotify is being used '''
+        return self._fd >= 0
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _read_events
+    #
+    def _read_events(self) -> bool:
+        '''
+        Read the inotify events waiting
+
+        Args:
+            None
+
+        Returns:
+            bool: True if any of the events are for the file (or a file
+                rotated from it)
+
+        Raises:
+            None
+        '''
+        _relevant = False
+
+        while True:
+            try:
+                _data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+
+            if not _data: break
+
+            _pos = 0
+            while _pos + INOTIFY_EVENT.size <= len(_data):
+                _, _mask, _, _length = INOTIFY_EVENT.unpack_from(_data, _pos)
+                _pos += INOTIFY_EVENT.size
+                _name = _data[_pos:_pos + _length].rstrip(b"\0")
+                _pos += _length
+
+                # An overflow (events may have been lost) or an event for
+                # the directory itself is treated as a change to the file
+                if (
+                    _mask & IN_Q_OVERFLOW or not _name
+                    or _name == self._name
+                    or _name.startswith(self._rotated_prefix)
+                ):
+                    _relevant = True
+
+        return _relevant
+
+
+    #
+    # reset
+    #
+    def reset(self):
+        '''
+        Reset the polling interval (after the file changed)
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self._interval = self._poll_interval
+
+
+    #
+    # wait
+    #
+    def wait(self, timeout: float | None = None):
+        '''
+        Wait for the file to change (or the polling interval to expire)
+
+        Args:
+            timeout (float | None): The longest time to wait (in seconds)
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if self._fd >= 0:
+            _wait = self._max_poll_interval
+            if timeout is not None: _wait = min(_wait, timeout)
+            _end = time.monotonic() + max(_wait, 0)
+
+            while True:
+                _wait = _end - time.monotonic()
+                _ready, _, _ = select.select(
+                    [ self._fd ], [], [], max(_wait, 0)
+                )
+                if not _ready: return
+
+                # Keep waiting if only other files in the directory changed
+                if self._read_events() or _wait <= 0: return
+
+        _wait = self._interval
+        if timeout is not None: _wait = min(_wait, timeout)
+        time.sleep(max(_wait, 0))
+
+        self._interval = min(self._interval * 2, self._max_poll_interval)
+
+
+    #
+    # close
+    #
+    def close(self):
+        '''
+        Stop watching the file
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if self._fd >= 0: os.close(self._fd)
+        self._fd = -1
+
+
+###########################################################################
+#
+# Entry Builder
+#
+###########################################################################
+class _EntryBuilder():
+    '''
+    Build log entries from lines as they are read
+
+    The last entry is held until the next entry starts (in case more
+    continuation lines follow) or flush() is called.
+
+    Attributes:
+        pending (bool) [ReadOnly]: True if an entry is being held
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            log_format: LogFormat | None = None,
+            encoding: str = "utf-8",
+            multiline: bool = True,
+            lazy: bool = False
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            log_format (LogFormat): The compiled log format
+            encoding (str): The encoding of the lines
+            multiline (bool): If True, join continuation lines to the
+                preceding entry, otherwise return each line on its own
+            lazy (bool): If True, the attributes of each entry are decoded
+                when first accessed
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._log_format = log_format
+        self._encoding = encoding
+        self._multiline = multiline
+        self._lazy = lazy
+
+        # The entry being built
+        self._match = None
+        self._lines = []
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # pending
+    #
+    @property
+    def pending(self) -> bool:
+        ''' True if an entry is being held '''
+        return bool(self._lines)
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _entry
+    #
+    def _entry(self, msg: str = "", match: re.Match | None = None) -> LogEntry:
+        '''
+        Create the log entry
+
+        Args:
+            msg (str): The log string
+            match (re.Match | None): The result of matching the format
+
+        Returns:
+            LogEntry: The log entry
+
+        Raises:
+            None
+        '''
+        if self._lazy:
+            return LogEntry.from_match(
+                msg=msg,
+                match=match,
+                log_format=self._log_format
+            )
+
+        return LogEntry.from_values(
+            values=self._log_format.decode(msg, match=match),
+            log_format=self._log_format
+        )
+
+
+    #
+    # add
+    #
+    def add(self, lines: Iterable[bytes] = ()) -> Iterator[LogEntry]:
+        '''
+        Add lines, returning any entries which are complete
+
+        Args:
+            lines (Iterable[bytes]): The lines (without line endings)
+
+        Returns:
+            Iterator[LogEntry]: The complete log entries
+
+        Raises:
+            None
+        '''
+        _match_line = self._log_format._match_line
+
+        for _raw in lines:
+            _line = _raw.decode(self._encoding, errors="replace").rstrip("\r")
+            if not _line.strip(): continue
+
+            _match = _match_line(_line)
+            if not self._multiline:
+                yield self._entry(_line, _match)
+
+            elif _match:
+                yield from self.flush()
+                self._match = _match
+                self._lines = [ _line ]
+
+            elif self._lines:
+                self._lines.append(_line)
+
+            else:
+                # Not part of an entry
+                yield self._entry(_line, None)
+
+
+    #
+    # flush
+    #
+    def flush(self) -> Iterator[LogEntry]:
+        '''
+        Return the entry being built
+
+        Args:
+            None
+
+        Returns:
+            Iterator[LogEntry]: The entry being built (if any)
+
+        Raises:
+            None
+        '''
+        if self._lines:
+            yield self._entry("\n".join(self._lines), self._match)
+
+        self._match = None
+        self._lines = []
+
+
+###########################################################################
+#
+# Follow
+#
+###########################################################################
+#
+# _file_id
+#
+def _file_id(filename: str = "") -> tuple | None:
+    '''
+    Identify the file currently at a path
+
+    Args:
+        filename (str): The name of the file
+
+    Returns:
+        tuple | None: The device, inode and size of the file, or None if
+            the file does not exist
+
+    Raises:
+        None
+    '''
+    try:
+        _stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+
+    return _stat.st_dev, _stat.st_ino, _stat.st_size
+
+
+#
+# _open_file
+#
+def _open_file(filename: str = "", position: tuple | None = None) -> IO | None:
+    '''
+    Open the file to be followed
+
+    Args:
+        filename (str): The name of the file
+        position (tuple | None): The device, inode and size of the file
+            (from _file_id) when following started.  If the file is still
+            the same file, reading starts from this size, otherwise from
+            the start of the file
+
+    Returns:
+        IO | None: The file (binary), or None if the file does not exist
+
+    Raises:
+        None
+    '''
+    try:
+        _file = open(filename, "rb")
+    except FileNotFoundError:
+        return None
+
+    if position is not None:
+        _stat = os.fstat(_file.fileno())
+        if (_stat.st_dev, _stat.st_ino) == position[:2]:
+            _file.seek(position[2])
+
+    return _file
+
+
+#
+# _follow
+#
+def _follow(
+        filename: str = "",
+        position: tuple | None = None,
+        builder: _EntryBuilder | None = None,
+        timeout: float | None = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        inotify: bool = True
+) -> Iterator[LogEntry]:
+    '''
+    Read the entries appended to a file, switching to the new file when
+    it is rotated
+
+    The file and the watcher are only opened once iteration starts, and are
+    closed when the generator finishes (or is closed).
+
+    Args:
+        filename (str): The name of the file
+        position (tuple | None): The device, inode and size of the file
+            when following started (None to read from the start)
+        builder (_EntryBuilder): The builder used to create the entries
+        timeout (float | None): Stop when there are no new entries for this
+            many seconds (follow forever if None)
+        flush_interval (float): The time (in seconds) the file must be idle
+            before the last entry is returned
+        poll_interval (float): The initial polling interval (in seconds)
+        max_poll_interval (float): The maximum polling interval (in seconds)
+        inotify (bool): Use inotify if available
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        None
+    '''
+    _file = None
+    _watcher = None
+
+    try:
+        _watcher = _FileWatcher(
+            filename=filename,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            inotify=inotify
+        )
+
+        _file = _open_file(filename=filename, position=position)
+        _id = None
+        if _file is not None:
+            _stat = os.fstat(_file.fileno())
+            _id = (_stat.st_dev, _stat.st_ino)
+
+        _remainder = b""
+        _idle_since = time.monotonic()
+
+        while True:
+            if _file is None:
+                # Wait for the file to (re)appear - Read it from the start
+                _file = _open_file(filename=filename)
+                if _file is not None:
+                    _stat = os.fstat(_file.fileno())
+                    _id = (_stat.st_dev, _stat.st_ino)
+
+            if _file is not None:
+                _data = _file.read(DEFAULT_READ_BUFFER_SIZE)
+                if _data:
+                    _lines = (_remainder + _data).split(b"\n")
+                    _remainder = _lines.pop()
+
+                    yield from builder.add(_lines)
+
+                    _watcher.reset()
+                    _idle_since = time.monotonic()
+                    continue
+
+                _current = _file_id(filename)
+                if _current is None or _current[:2] != _id:
+                    # Rotated - Anything written before the rotation is
+                    # now in the file, so finish it and switch
+                    _data = _file.read()
+                    _lines = (_remainder + _data).split(b"\n")
+                    _remainder = b""
+
+                    yield from builder.add(_lines)
+                    yield from builder.flush()
+
+                    _file.close()
+                    _file = None
+                    if _current is not None: continue
+
+                elif _current[2] < _file.tell():
+                    # Truncated - Finish the last entry and start again
+                    yield from builder.flush()
+
+                    _file.seek(0)
+                    _remainder = b""
+                    continue
+
+            # Up to date - The last entry is held (in case the rest of it
+            # has not been written yet) until the file has been idle for
+            # flush_interval
+            _idle = time.monotonic() - _idle_since
+            if builder.pending and _idle >= flush_interval:
+                yield from builder.flush()
+
+                # The timeout counts from the last entry returned
+                _idle_since = time.monotonic()
+                continue
+
+            _wait = None
+            if timeout is not None:
+                _wait = timeout - _idle
+                if _wait <= 0:
+                    yield from builder.flush()
+                    return
+
+            if builder.pending:
+                _flush_wait = flush_interval - _idle
+                _wait = _flush_wait if _wait is None else min(
+                    _wait, _flush_wait
+                )
+
+            _watcher.wait(timeout=_wait)
+
+    finally:
+        if _watcher is not None: _watcher.close()
+        if _file is not None: _file.close()
+
+
+#
+# follow_entries
+#
+def follow_entries(
+        filename: str = "",
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8",
+        from_start: bool = False,
+        timeout: float | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        multiline: bool = True,
+        lazy: bool = False,
+        inotify: bool = True,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+) -> Iterator[LogEntry]:
+    '''
+    Follow a log file, decoding each entry as it is appended
+
+    Only the new bytes are read.  When the file is rotated (the path refers
+    to a different file) or truncated, the rest of the old file is read
+    before following the new file from the start, so no entries are lost.
+
+    The last entry is held until the next entry starts, the file is
+    rotated, or the file has been idle for flush_interval seconds, so the
+    continuation lines of an entry (eg a traceback) may be written
+    separately.
+
+    The file is not opened until iteration starts, so nothing is left open
+    if the generator is never used.
+
+    Args:
+        filename (str): The name of the log file
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used to
+            extract the tokens
+        log_format (LogFormat | None): A compiled log format to use instead
+            of format and token_map
+        encoding (str): The encoding of the log file
+        from_start (bool): If True, read the entries already in the file,
+            otherwise start at the end of the file (as it was when called)
+        timeout (float | None): Stop when there are no new entries for this
+            many seconds (follow forever if None)
+        poll_interval (float): The initial polling interval (in seconds),
+            when inotify is not available
+        max_poll_interval (float): The maximum polling interval (in seconds)
+        multiline (bool): If True, join continuation lines to the preceding
+            entry, otherwise return each line on its own
+        lazy (bool): If True, the attributes of each entry are decoded when
+            first accessed
+        inotify (bool): If True, use inotify (where available) to wait for
+            changes, otherwise poll the file
+        flush_interval (float): The time (in seconds) the file must be idle
+            before the last entry is returned
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when poll_interval or max_poll_interval is not positive
+            when flush_interval is negative
+    '''
+    assert filename, "Empty filename supplied."
+    assert isinstance(filename, str), "Filename must be a string."
+    assert poll_interval > 0, "poll_interval must be greater than 0"
+    assert max_poll_interval >= poll_interval, (
+        "max_poll_interval must not be less than poll_interval"
+    )
+    assert flush_interval >= 0, "flush_interval must not be negative"
+
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
+
+    _builder = _EntryBuilder(
+        log_format=log_format,
+        encoding=encoding,
+        multiline=multiline,
+        lazy=lazy
+    )
+
+    # Note where the file ends now, so entries appended from here on are
+    # returned (the file itself is opened by the generator)
+    _position = None if from_start else _file_id(filename)
+
+    return _follow(
+        filename=filename,
+        position=_position,
+        builder=_builder,
+        timeout=timeout,
+        flush_interval=flush_interval,
+        poll_interval=poll_interval,
+        max_poll_interval=max_poll_interval,
+        inotify=inotify
+    )
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
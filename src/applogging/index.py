@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+'''
+LogIndex - Class for maintaining a sidecar index for a log file
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import io
+import json
+import hashlib
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.entry import (
+    ENTRY_FIELDS,
+    DEFAULT_READ_BUFFER_SIZE,
+    LogEntry,
+    get_log_format,
+    iter_entries
+)
+from applogging.reader import TimeValue, _to_timestamp
+
+# Imports for python variable type hints
+from typing import Iterable, Iterator
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# The suffix added to the log filename for the index
+INDEX_SUFFIX = ".idx"
+
+# The version of the index file layout
+INDEX_VERSION = 1
+
+# The default width of each time bucket (in seconds)
+DEFAULT_BUCKET_WIDTH = 60
+
+# The number of bytes at the start of the file used to identify it
+INDEX_HEAD_SIZE = 4096
+
+# The position of the indexed attributes in ENTRY_FIELDS
+_TIME_INDEX = ENTRY_FIELDS.index("time")
+_SEVERITY_INDEX = ENTRY_FIELDS.index("severity")
+_LOGGER_NAME_INDEX = ENTRY_FIELDS.index("logger_name")
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# LogIndex Class Definition
+#
+###########################################################################
+class LogIndex():
+    '''
+    Class for maintaining a sidecar index for a log file
+
+    The index is stored next to the log file (with the suffix '.idx') and
+    holds the byte range of each time bucket in the file, along with posting
+    lists of the buckets containing each severity and logger name.  The
+    index is updated incrementally as the log file grows.
+
+    Attributes:
+        filename (str) [ReadOnly]: The name of the log file
+        index_filename (str) [ReadOnly]: The name of the index file
+        bucket_width (int) [ReadOnly]: The width of each time bucket
+            (in seconds)
+        size (int) [ReadOnly]: The number of bytes of the log file indexed
+        buckets (list) [ReadOnly]: For each bucket - (bucket start time,
+            start offset, end offset, number of entries)
+        severities (dict) [ReadOnly]: The buckets containing each severity
+        logger_names (dict) [ReadOnly]: The buckets containing each logger
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            filename: str = "",
+            bucket_width: int = DEFAULT_BUCKET_WIDTH,
+            format: str = DEFAULT_LOG_FORMAT,
+            token_map: dict = {},
+            encoding: str = "utf-8"
+    ):
+        '''
+        Initialises the instance.
+
+        An existing index file is loaded if it is still valid for the log
+        file.  Call update() to index any new entries.
+
+        Args:
+            filename (str): The name of the log file
+            bucket_width (int): The width of each time bucket (in seconds)
+            format (str): The format used to create the log entries
+            token_map (dict): Modifications to the default mapping dict used
+                to extract the tokens
+            encoding (str): The encoding of the log file
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when filename is not a non-empty string
+                when bucket_width is not a positive integer
+                when mapping is not valid
+        '''
+        assert filename, "Empty filename supplied."
+        assert isinstance(filename, str), "Filename must be a string."
+        assert isinstance(bucket_width, int) and bucket_width > 0, (
+            "bucket_width must be a positive integer"
+        )
+
+        # Private Attributes
+        self._filename = filename
+        self._index_filename = f"{filename}{INDEX_SUFFIX}"
+        self._bucket_width = bucket_width
+        self._format = format
+        self._token_map = token_map
+        self._log_format = get_log_format(format=format, token_map=token_map)
+        self._encoding = encoding
+
+        # The identity of the indexed file
+        self._inode = 0
+        self._head = ""
+        self._head_size = 0
+
+        # The index
+        self._size = 0
+        self._buckets = []
+        self._severities = {}
+        self._logger_names = {}
+
+        self._load()
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # filename
+    #
+    @property
+    def filename(self) -> str:
+        ''' The name of the log file '''
+        return self._filename
+
+
+    #
+    # index_filename
+    #
+    @property
+    def index_filename(self) -> str:
+        ''' The name of the index file '''
+        return self._index_filename
+
+
+    #
+    # bucket_width
+    #
+    @property
+    def bucket_width(self) -> int:
+        ''' The width of each time bucket (in seconds) '''
+        return self._bucket_width
+
+
+    #
+    # size
+    #
+    @property
+    def size(self) -> int:
+        ''' The number of bytes of the log file indexed '''
+        return self._size
+
+
+    #
+    # buckets
+    #
+    @property
+    def buckets(self) -> list:
+        ''' The time buckets - (time, start offset, end offset, count) '''
+        return self._buckets
+
+
+    #
+    # severities
+    #
+    @property
+    def severities(self) -> dict:
+        ''' The buckets containing each severity '''
+        return self._severities
+
+
+    #
+    # logger_names
+    #
+    @property
+    def logger_names(self) -> dict:
+        ''' The buckets containing each logger name '''
+        return self._logger_names
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _reset
+    #
+    def _reset(self):
+        '''
+        Clear the index
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self._inode = 0
+        self._head = ""
+        self._head_size = 0
+        self._size = 0
+        self._buckets = []
+        self._severities = {}
+        self._logger_names = {}
+
+
+    #
+    # _read_head
+    #
+    def _read_head(self, size: int = INDEX_HEAD_SIZE) -> str:
+        '''
+        Get a hash of the start of the log file (used to identify it)
+
+        Args:
+            size (int): The number of bytes to hash
+
+        Returns:
+            str: The hash of the bytes
+
+        Raises:
+            None
+        '''
+        with open(self._filename, "rb") as f:
+            return hashlib.sha1(f.read(size)).hexdigest()
+
+
+    #
+    # _load
+    #
+    def _load(self):
+        '''
+        Load the index file, if it exists and is valid for the log file
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self._reset()
+
+        try:
+            with open(self._index_filename, "r") as f:
+                _index = json.load(f)
+
+            _valid = (
+                isinstance(_index, dict) and
+                _index.get("version") == INDEX_VERSION and
+                _index.get("format") == self._format and
+                _index.get("token_map") == self._token_map and
+                _index.get("bucket_width") == self._bucket_width
+            )
+            if not _valid: return
+
+            self._inode = _index["inode"]
+            self._head = _index["head"]
+            self._head_size = _index["head_size"]
+            self._size = _index["size"]
+            self._buckets = [ tuple(_bucket) for _bucket in _index["buckets"] ]
+            self._severities = {
+                _key: set(_val) for _key, _val in _index["severities"].items()
+            }
+            self._logger_names = {
+                _key: set(_val)
+                for _key, _val in _index["logger_names"].items()
+            }
+
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+
+
+    #
+    # save
+    #
+    def save(self):
+        '''
+        Save the index file
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        _index = {
+            "version": INDEX_VERSION,
+            "format": self._format,
+            "token_map": self._token_map,
+            "bucket_width": self._bucket_width,
+            "inode": self._inode,
+            "head": self._head,
+            "head_size": self._head_size,
+            "size": self._size,
+            "buckets": self._buckets,
+            "severities": {
+                _key: sorted(_val) for _key, _val in self._severities.items()
+            },
+            "logger_names": {
+                _key: sorted(_val) for _key, _val in self._logger_names.items()
+            }
+        }
+
+        # Write to a temporary file and replace, so the index is never partial
+        _tmp_filename = f"{self._index_filename}.tmp"
+        with open(_tmp_filename, "w") as f:
+            json.dump(_index, f, separators=(",", ":"))
+
+        os.replace(_tmp_filename, self._index_filename)
+
+
+    #
+    # _is_current
+    #
+    def _is_current(self, stat: os.stat_result) -> bool:
+        '''
+        Check the index is for the current log file (ie it hasn't been
+        rotated or truncated since it was indexed)
+
+        Args:
+            stat (os.stat_result): The status of the log file
+
+        Returns:
+            bool: True if the index can be updated, False if it must be
+                rebuilt
+
+        Raises:
+            None
+        '''
+        if not self._size: return False
+        if stat.st_ino != self._inode: return False
+        if stat.st_size < self._size: return False
+
+        return self._read_head(size=self._head_size) == self._head
+
+
+    #
+    # update
+    #
+    def update(self) -> bool:
+        '''
+        Index any entries added to the log file since the last update
+
+        The index is rebuilt if the log file has been rotated or truncated.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the index was changed
+
+        Raises:
+            None
+        '''
+        _stat = os.stat(self._filename)
+
+        if not self._is_current(stat=_stat): self._reset()
+        if _stat.st_size == self._size: return False
+
+        self._inode = _stat.st_ino
+
+        _match_line = self._log_format.bytes_pattern.match
+        _decode = self._log_format.decode
+        _decode_timestamp = self._log_format.timestamp_decoder.decode
+        _encoding = self._encoding
+        _width = self._bucket_width
+
+        # Continue the last bucket if there is one
+        if self._buckets:
+            _bucket_id = len(self._buckets) - 1
+            _key, _start, _, _count = self._buckets[_bucket_id]
+        else:
+            _bucket_id = -1
+            _key = None
+            _start = _count = 0
+
+        _offset = self._size
+
+        with open(self._filename, "rb") as f:
+            f.seek(_offset)
+            _remainder = b""
+
+            while True:
+                _block = f.read(DEFAULT_READ_BUFFER_SIZE)
+                if not _block: break
+
+                _lines = (_remainder + _block).split(b"\n")
+                _remainder = _lines.pop()
+
+                for _line in _lines:
+                    _line_offset = _offset
+                    _offset += len(_line) + 1
+
+                    if _match_line(_line):
+                        _values = _decode(
+                            _line.decode(_encoding, errors="replace")
+                        )
+                        _timestamp = _decode_timestamp(_values[_TIME_INDEX])
+                        _line_key = None
+                        if _timestamp is not None:
+                            _line_key = int(_timestamp // _width) * _width
+
+                    elif _bucket_id >= 0:
+                        # Continuation lines belong to the current bucket
+                        self._buckets[_bucket_id] = (
+                            _key, _start, _offset, _count
+                        )
+                        continue
+
+                    else:
+                        # Lines before the first entry
+                        _values = None
+                        _line_key = None
+
+                    # Start a new bucket when the time bucket changes
+                    if _bucket_id < 0 or _line_key != _key:
+                        _key = _line_key
+                        _start = _line_offset
+                        _count = 0
+                        self._buckets.append(None)
+                        _bucket_id = len(self._buckets) - 1
+
+                    if _values:
+                        _count += 1
+                        self._severities.setdefault(
+                            _values[_SEVERITY_INDEX], set()
+                        ).add(_bucket_id)
+                        self._logger_names.setdefault(
+                            _values[_LOGGER_NAME_INDEX], set()
+                        ).add(_bucket_id)
+
+                    self._buckets[_bucket_id] = (_key, _start, _offset, _count)
+
+        # Only complete lines are indexed
+        self._size = _offset
+
+        if not self._head:
+            self._head_size = min(self._size, INDEX_HEAD_SIZE)
+            self._head = self._read_head(size=self._head_size)
+
+        self.save()
+
+        return True
+
+
+    #
+    # ranges
+    #
+    def ranges(
+            self,
+            start: TimeValue | None = None,
+            end: TimeValue | None = None,
+            severities: Iterable[str] | None = None,
+            logger_names: Iterable[str] | None = None
+    ) -> list:
+        '''
+        Find the byte ranges of the log file which may contain matching
+        entries
+
+        Args:
+            start (TimeValue | None): The start of the time range (inclusive)
+            end (TimeValue | None): The end of the time range (exclusive)
+            severities (Iterable[str] | None): The severities to find (any
+                severity if None)
+            logger_names (Iterable[str] | None): The logger names to find
+                (any logger if None)
+
+        Returns:
+            list: The (start, end) byte offsets, with adjacent ranges merged
+
+        Raises:
+            ValueError:
+                when start or end is a string that cannot be decoded
+        '''
+        _start = _to_timestamp(value=start, log_format=self._log_format)
+        _end = _to_timestamp(value=end, log_format=self._log_format)
+
+        _bucket_ids = set(range(len(self._buckets)))
+
+        # Use the posting lists to find the buckets
+        for _wanted, _postings in [
+                (severities, self._severities),
+                (logger_names, self._logger_names)
+        ]:
+            if _wanted is None: continue
+
+            _found = set()
+            for _value in _wanted:
+                _found.update(_postings.get(_value, ()))
+
+            _bucket_ids &= _found
+
+        _ranges = []
+        for _bucket_id in sorted(_bucket_ids):
+            _key, _range_start, _range_end, _ = self._buckets[_bucket_id]
+
+            if _start is not None or _end is not None:
+                if _key is None: continue
+                if _start is not None and _key + self._bucket_width <= _start:
+                    continue
+                if _end is not None and _key >= _end: continue
+
+            if _ranges and _ranges[-1][1] == _range_start:
+                _ranges[-1] = (_ranges[-1][0], _range_end)
+            else:
+                _ranges.append((_range_start, _range_end))
+
+        return _ranges
+
+
+    #
+    # iter_entries
+    #
+    def iter_entries(
+            self,
+            start: TimeValue | None = None,
+            end: TimeValue | None = None,
+            severities: Iterable[str] | None = None,
+            logger_names: Iterable[str] | None = None,
+            lazy: bool = False
+    ) -> Iterator[LogEntry]:
+        '''
+        Decode the matching entries, only reading the parts of the log file
+        found using the index
+
+        The index is updated before it is used.
+
+        Args:
+            start (TimeValue | None): The start of the time range (inclusive)
+            end (TimeValue | None): The end of the time range (exclusive)
+            severities (Iterable[str] | None): The severities to find (any
+                severity if None)
+            logger_names (Iterable[str] | None): The logger names to find
+                (any logger if None)
+            lazy (bool): If True, the attributes of each entry are decoded
+                when first accessed
+
+        Returns:
+            Iterator[LogEntry]: The decoded log entries
+
+        Raises:
+            ValueError:
+                when start or end is a string that cannot be decoded
+        '''
+        self.update()
+
+        _start = _to_timestamp(value=start, log_format=self._log_format)
+        _end = _to_timestamp(value=end, log_format=self._log_format)
+        if severities is not None: severities = set(severities)
+        if logger_names is not None: logger_names = set(logger_names)
+
+        with open(self._filename, "rb") as f:
+            for _range_start, _range_end in self.ranges(
+                    start=_start,
+                    end=_end,
+                    severities=severities,
+                    logger_names=logger_names
+            ):
+                f.seek(_range_start)
+                _data = io.BytesIO(f.read(_range_end - _range_start))
+
+                for _entry in iter_entries(
+                        source=_data,
+                        log_format=self._log_format,
+                        encoding=self._encoding,
+                        lazy=lazy
+                ):
+                    if (
+                        severities is not None and
+                        _entry.severity not in severities
+                    ):
+                        continue
+
+                    if (
+                        logger_names is not None and
+                        _entry.logger_name not in logger_names
+                    ):
+                        continue
+
+                    if _start is not None or _end is not None:
+                        _timestamp = _entry.timestamp
+                        if _timestamp is None: continue
+                        if _start is not None and _timestamp < _start: continue
+                        if _end is not None and _timestamp >= _end: continue
+
+                    yield _entry
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
@@ -29,10 +29,16 @@ from __future__ import annotations
 # Shared variables, constants, etc
 
 # System Modules
+import os
 import sys
+import gzip
+import json
+import shutil
 import logging
 import logging.handlers
 import datetime
+import threading
+import collections
 
 # Local app modules
 from applogging.constants import (
@@ -42,6 +48,7 @@ from applogging.constants import (
 )
 
 # Imports for python variable type hints
+from typing import Callable
 
 
 ###########################################################################
@@ -69,6 +76,9 @@ DEFAULT_TIMED_ROTATING_FILE_WHEN = "W6"
 DEFAULT_TIMED_ROTATING_FILE_AT_TIME = datetime.time(0, 0, 0)
 DEFAULT_TIMED_ROTATING_FILE_COPIES = 5
 
+# The suffix added to compressed log files
+GZIP_SUFFIX = ".gz"
+
 
 ###########################################################################
 #
@@ -314,6 +324,350 @@ def set_log_level(
     logger.setLevel(level=level.upper())
 
 
+###########################################################################
+#
+# Compression of Rotated Files
+#
+###########################################################################
+#
+# _gzip_namer
+#
+def _gzip_namer(default_name: str = "") -> str:
+    '''
+    Name a rotated log file which will be compressed
+
+    Args:
+        default_name (str): The name given by the handler
+
+    Returns:
+        str: The name of the compressed file
+
+    Raises:
+        None
+    '''
+    return f"{default_name}{GZIP_SUFFIX}"
+
+
+#
+# _compress_file
+#
+def _compress_file(source: str = "", dest: str = ""):
+    '''
+    Compress a file with gzip, removing the original
+
+    The compressed file is written to a hidden temporary file first, so
+    readers never see a partial file.  If compression fails, the original
+    is kept.
+
+    Args:
+        source (str): The name of the file to compress
+        dest (str): The name of the compressed file
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    _dir, _base = os.path.split(dest)
+    _tmp_filename = os.path.join(_dir, f".{_base}.tmp")
+
+    try:
+        with open(source, "rb") as f_in:
+            with gzip.open(_tmp_filename, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+
+        os.replace(_tmp_filename, dest)
+        os.remove(source)
+
+    except OSError:
+        if os.path.exists(_tmp_filename): os.remove(_tmp_filename)
+
+
+#
+# _GzipRotator
+#
+class _GzipRotator():
+    '''
+    Rotator for a log handler, compressing the rotated files with gzip
+
+    The file is renamed during the rollover, and compressed on a background
+    thread, so logging is not blocked.  The files are compressed one at a
+    time, in the order they were rotated, and the oldest files are pruned
+    on the same thread after each file is compressed (so a file is never
+    deleted, or counted twice, while it is being compressed).  The thread
+    is not a daemon thread, so any compression is completed before the
+    program exits.
+
+    Attributes:
+        None
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(self, prune: Callable | None = None):
+        '''
+        Initialises the instance.
+
+        Args:
+            prune (Callable | None): Called (on the background thread) after
+                each file is compressed, to delete the oldest files
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._prune = prune
+        self._pending = collections.deque()
+        self._thread = None
+        self._lock = threading.Lock()
+
+
+    #
+    # __call__
+    #
+    def __call__(self, source: str = "", dest: str = ""):
+        '''
+        Rotate the log file
+
+        Args:
+            source (str): The name of the log file
+            dest (str): The name of the compressed file
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # A file may not have been created if the handler is delayed
+        if not os.path.exists(source): return
+
+        _filename = dest
+        if _filename.endswith(GZIP_SUFFIX):
+            _filename = _filename[:-len(GZIP_SUFFIX)]
+
+        os.replace(source, _filename)
+
+        with self._lock:
+            self._pending.append(( _filename, dest ))
+            if self._thread is not None: return
+
+            self._thread = threading.Thread(
+                target=self._compress_pending,
+                name=f"compress:{os.path.basename(_filename)}",
+                daemon=False
+            )
+            self._thread.start()
+
+
+    #
+    # _compress_pending
+    #
+    def _compress_pending(self):
+        '''
+        Compress the rotated files, pruning the oldest files after each one
+        (run on the background thread)
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+
+                _source, _dest = self._pending.popleft()
+
+            _compress_file(source=_source, dest=_dest)
+
+            if self._prune:
+                try:
+                    self._prune()
+                except OSError:
+                    pass
+
+
+    #
+    # wait
+    #
+    def wait(self, timeout: float | None = None):
+        '''
+        Wait for any compression (and pruning) to complete
+
+        Args:
+            timeout (float | None): The longest time to wait (in seconds)
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        with self._lock:
+            _thread = self._thread
+
+        if _thread is not None: _thread.join(timeout=timeout)
+
+
+#
+# _GzipTimedRotatingFileHandler
+#
+class _GzipTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    '''
+    Timed rotating file handler, compressing the rotated files with gzip
+
+    The oldest files are deleted by the rotator once each file has been
+    compressed, rather than during the rollover.
+
+    Attributes:
+        None
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(self, *args, **kwargs):
+        '''
+        Initialises the instance.
+
+        Args:
+            *args: Passed to TimedRotatingFileHandler
+            **kwargs: Passed to TimedRotatingFileHandler
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        super().__init__(*args, **kwargs)
+
+        self.namer = _gzip_namer
+        self.rotator = _GzipRotator(prune=self._prune)
+
+
+    #
+    # getFilesToDelete
+    #
+    def getFilesToDelete(self) -> list:
+        '''
+        Get the files to delete during the rollover
+
+        Args:
+            None
+
+        Returns:
+            list: Always empty - The rotator deletes the files
+
+        Raises:
+            None
+        '''
+        return []
+
+
+    #
+    # _prune
+    #
+    def _prune(self):
+        '''
+        Delete the oldest files, keeping backupCount files
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        if self.backupCount <= 0: return
+
+        for _filename in super().getFilesToDelete():
+            try:
+                os.remove(_filename)
+            except FileNotFoundError:
+                pass
+
+
+###########################################################################
+#
+# JsonFormatter Class Definition
+#
+###########################################################################
+class JsonFormatter(logging.Formatter):
+    '''
+    Formatter writing each log record as a JSON object on a single line
+
+    The keys are the LogEntry attributes and the timestamp, always in the
+    same order (see entry.JSON_FIELDS), so the readers can decode the lines
+    without a regular expression.  Any exception or stack information is
+    included in the message.
+
+    Attributes:
+        None
+    '''
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # format
+    #
+    def format(self, record: logging.LogRecord) -> str:
+        '''
+        Format a log record as a JSON line
+
+        Args:
+            record (logging.LogRecord): The log record
+
+        Returns:
+            str: The JSON object (with no line ending)
+
+        Raises:
+            None
+        '''
+        record.message = record.getMessage()
+        _message = record.message
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        if record.exc_text: _message = f"{_message}\n{record.exc_text}"
+        if record.stack_info:
+            _message = f"{_message}\n{self.formatStack(record.stack_info)}"
+
+        return json.dumps(
+            {
+                "time": self.formatTime(record, self.datefmt),
+                "logger_name": record.name,
+                "severity": record.levelname,
+                "source": f"{record.filename}:{record.lineno}",
+                "process_id": record.process or 0,
+                "process_name": record.processName or "",
+                "thread_id": record.thread or 0,
+                "thread_name": record.threadName or "",
+                "message": _message,
+                "timestamp": record.created
+            },
+            ensure_ascii=False
+        )
+
+
 ###########################################################################
 #
 # 'Standard' handlers
@@ -438,6 +792,34 @@ def handler_to_file(
     return _handler
 
 
+#
+# handler_to_json_file
+#
+def handler_to_json_file(filename: str = "") -> logging.Handler:
+    '''
+    Create a handler to output JSON lines to a file (see JsonFormatter)
+
+    Args:
+        filename (str): The name of the file to log to
+
+    Returns:
+        Handler: The handler for output stream
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+    '''
+    assert filename, f"Empty filename supplied."
+    assert isinstance(filename, str), f"Filename must be a string."
+
+    _handler = logging.FileHandler(filename, encoding="utf-8")
+    _handler.setFormatter(JsonFormatter())
+    _handler.name = filename
+
+    # Return the handler
+    return _handler
+
+
 #
 # handler_to_timed_rotating_file
 #
@@ -446,7 +828,8 @@ def handler_to_timed_rotating_file(
         format:str = DEFAULT_LOG_FORMAT,
         when:str = DEFAULT_TIMED_ROTATING_FILE_WHEN,
         at_time: datetime.time = DEFAULT_TIMED_ROTATING_FILE_AT_TIME,
-        copies: int = DEFAULT_TIMED_ROTATING_FILE_COPIES
+        copies: int = DEFAULT_TIMED_ROTATING_FILE_COPIES,
+        compress: bool = False
 ) -> logging.Handler:
     '''
     Create a handler to output to a file that is rotated on a timed basis
@@ -459,6 +842,8 @@ def handler_to_timed_rotating_file(
         at_time (datetime.time): A time structure indicating the time to rotate
             the file
         copies (int): Number of backup copies to keep
+        compress (bool): If True, the rotated files are compressed with gzip
+            (on a background thread)
 
     Returns:
         Handler: The handler for output stream
@@ -485,7 +870,10 @@ def handler_to_timed_rotating_file(
     assert copies >= 0, "copies must be greater than or equal to 0"
 
     # Set up the handler to rotate log files
-    _handler = logging.handlers.TimedRotatingFileHandler(
+    _handler_class = logging.handlers.TimedRotatingFileHandler
+    if compress: _handler_class = _GzipTimedRotatingFileHandler
+
+    _handler = _handler_class(
         filename,
         when=when,
         atTime=at_time,
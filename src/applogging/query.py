@@ -0,0 +1,779 @@
+#!/usr/bin/env python3
+'''
+Query - Filtering, counting and exporting the entries in log files
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import io
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+import datetime
+import functools
+import itertools
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.entry import (
+    COLUMN_FIELDS,
+    ENTRY_FIELDS,
+    MESSAGE_INDEX,
+    LogFilter,
+    get_log_format,
+    _is_gzip_file,
+    _iter_filtered_records,
+    _iter_raw_lines,
+    _open_log_file
+)
+from applogging.reader import (
+    DEFAULT_CHUNK_SIZE,
+    find_time_offset,
+    split_file,
+    _iter_gzip_blocks,
+    _run_tasks,
+    _to_timestamp
+)
+
+# Imports for python variable type hints
+from typing import Iterable, Iterator
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# The ways matching entries can be written
+OUTPUT_FORMATS = ( "text", "jsonl", "csv" )
+
+# The number of entries written at a time when reading in this process
+OUTPUT_BATCH_SIZE = 1024
+
+# Unless the number of workers is given, a pool of workers (one per CPU) is
+# used once the log files reach this total size (in bytes), or number of
+# files - Smaller queries are quicker without starting the pool
+AUTO_WORKERS_SIZE = 4 * DEFAULT_CHUNK_SIZE
+AUTO_WORKERS_FILES = 8
+
+# The position of the filtered attributes in ENTRY_FIELDS
+_TIME_INDEX = ENTRY_FIELDS.index("time")
+_SEVERITY_INDEX = ENTRY_FIELDS.index("severity")
+_LOGGER_NAME_INDEX = ENTRY_FIELDS.index("logger_name")
+
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Matching
+#
+###########################################################################
+#
+# _match_entries
+#
+def _match_entries(lines: Iterable[bytes], query: dict) -> Iterator[tuple]:
+    '''
+    Find the entries matching a query
+
+    Entries are rejected using cheap checks on the bytes (see LogFilter)
+    before being decoded.  As for iter_entries_between, the entries must be
+    in time order if the query has an end time.
+
+    Args:
+        lines (Iterable[bytes]): The lines of the log file
+        query (dict): The query (see _iter_query)
+
+    Returns:
+        Iterator[tuple]: The log string, decoded values and timestamp of
+            each matching entry
+
+    Raises:
+        None
+    '''
+    _log_format = get_log_format(
+        format=query["format"],
+        token_map=query["token_map"]
+    )
+    _filter = LogFilter(
+        severities=query["severities"],
+        logger_names=query["logger_names"],
+        contains=query["contains"],
+        log_format=_log_format,
+        encoding=query["encoding"]
+    )
+
+    _severities = _filter.severities
+    _logger_names = _filter.logger_names
+    _start = query["start"]
+    _end = query["end"]
+    _search = re.compile(query["regex"]).search if query["regex"] else None
+    _decode = _log_format.decode
+    _decode_timestamp = _log_format.timestamp_decoder.decode
+
+    for _msg, _match in _iter_filtered_records(
+            lines=lines,
+            log_format=_log_format,
+            log_filter=_filter,
+            multiline=query["multiline"],
+            encoding=query["encoding"]
+    ):
+        _values = _decode(_msg, match=_match)
+
+        if (
+            _severities is not None and
+            _values[_SEVERITY_INDEX] not in _severities
+        ):
+            continue
+
+        if (
+            _logger_names is not None and
+            _values[_LOGGER_NAME_INDEX] not in _logger_names
+        ):
+            continue
+
+        _timestamp = _decode_timestamp(_values[_TIME_INDEX])
+        if _start is not None or _end is not None:
+            if _timestamp is None: continue
+            if _start is not None and _timestamp < _start: continue
+
+            # The rest of the entries are after the end
+            if _end is not None and _timestamp >= _end: break
+
+        if _search and not _search(_values[MESSAGE_INDEX]): continue
+
+        yield _msg, _values, _timestamp
+
+
+#
+# _iter_output
+#
+def _iter_output(
+        entries: Iterable[tuple],
+        output: str | None = "text",
+        batch_size: int | None = OUTPUT_BATCH_SIZE
+) -> Iterator[tuple]:
+    '''
+    Write matching entries to strings, a batch at a time
+
+    Args:
+        entries (Iterable[tuple]): The log string, decoded values and
+            timestamp of each entry
+        output (str | None): The output format (from OUTPUT_FORMATS).  If
+            None, the entries are only counted
+        batch_size (int | None): The number of entries in each batch.  If
+            None, all of the entries are in one batch
+
+    Returns:
+        Iterator[tuple]: The number of entries in the batch, and the output
+
+    Raises:
+        None
+    '''
+    while True:
+        _batch = list(itertools.islice(entries, batch_size))
+        if not _batch: return
+
+        _output = io.StringIO()
+        if output == "text":
+            for _msg, _, _ in _batch:
+                _output.write(_msg)
+                _output.write("\n")
+
+        elif output == "jsonl":
+            for _, _values, _timestamp in _batch:
+                _output.write(json.dumps(
+                    dict(zip(COLUMN_FIELDS, _values + ( _timestamp, )))
+                ))
+                _output.write("\n")
+
+        elif output == "csv":
+            csv.writer(_output, lineterminator="\n").writerows(
+                _values + ( _timestamp, ) for _, _values, _timestamp in _batch
+            )
+
+        yield len(_batch), _output.getvalue()
+
+        if batch_size is None: return
+
+
+#
+# _query_block
+#
+def _query_block(
+        data: bytes,
+        query: dict,
+        output: str | None
+) -> tuple:
+    '''
+    Find the entries matching a query in a block of lines (run in a worker
+    process)
+
+    Args:
+        data (bytes): The lines to search
+        query (dict): The query (see _iter_query)
+        output (str | None): The output format (None to only count)
+
+    Returns:
+        tuple: The number of matching entries, and the output
+
+    Raises:
+        None
+    '''
+    # Split on newlines only, as the serial path does (a message may hold
+    # other line breaks, eg a carriage return)
+    _lines = data.split(b"\n")
+    if not _lines[-1]: _lines.pop()
+
+    for _result in _iter_output(
+            _match_entries(lines=_lines, query=query),
+            output=output,
+            batch_size=None
+    ):
+        return _result
+
+    return 0, ""
+
+
+#
+# _query_range
+#
+def _query_range(
+        filename: str,
+        start: int,
+        end: int,
+        query: dict,
+        output: str | None
+) -> tuple:
+    '''
+    Find the entries matching a query in a byte range of a file (run in a
+    worker process)
+
+    Args:
+        filename (str): The name of the file to read
+        start (int): The offset of the start of the range
+        end (int): The offset of the end of the range
+        query (dict): The query (see _iter_query)
+        output (str | None): The output format (None to only count)
+
+    Returns:
+        tuple: The number of matching entries, and the output
+
+    Raises:
+        None
+    '''
+    with open(filename, "rb") as f:
+        f.seek(start)
+        _data = f.read(end - start)
+
+    return _query_block(_data, query=query, output=output)
+
+
+###########################################################################
+#
+# Queries
+#
+###########################################################################
+#
+# _query_tasks
+#
+def _query_tasks(
+        filename: str,
+        query: dict,
+        output: str | None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterable[functools.partial]:
+    '''
+    Split the search of a log file into tasks for the workers
+
+    Args:
+        filename (str): The name of the log file
+        query (dict): The query (see _iter_query)
+        output (str | None): The output format (None to only count)
+        chunk_size (int): The approximate size of each byte range
+
+    Returns:
+        Iterable[functools.partial]: The tasks
+
+    Raises:
+        None
+    '''
+    _log_format = get_log_format(
+        format=query["format"],
+        token_map=query["token_map"]
+    )
+    _align = _log_format if query["multiline"] else None
+
+    if _is_gzip_file(filename):
+        return (
+            functools.partial(_query_block, _block, query, output)
+            for _block in _iter_gzip_blocks(
+                filename=filename,
+                chunk_size=chunk_size,
+                log_format=_align
+            )
+        )
+
+    # Skip to the start time
+    _offset = 0
+    if query["start"] is not None:
+        with open(filename, "rb") as f:
+            _offset = find_time_offset(
+                f,
+                start=query["start"],
+                log_format=_log_format,
+                encoding=query["encoding"]
+            )
+
+    return [
+        functools.partial(
+            _query_range,
+            filename,
+            max(_start, _offset),
+            _end,
+            query,
+            output
+        )
+        for _start, _end in split_file(
+            filename=filename,
+            chunk_size=chunk_size,
+            log_format=_align
+        )
+        if _end > _offset
+    ]
+
+
+#
+# _iter_file
+#
+def _iter_file(
+        filename: str,
+        query: dict,
+        output: str | None
+) -> Iterator[tuple]:
+    '''
+    Search a log file in this process, a batch at a time
+
+    Args:
+        filename (str): The name of the log file
+        query (dict): The query (see _iter_query)
+        output (str | None): The output format (None to only count)
+
+    Returns:
+        Iterator[tuple]: The number of matching entries in each batch, and
+            the output
+
+    Raises:
+        None
+    '''
+    with _open_log_file(filename) as f:
+        if query["start"] is not None and not _is_gzip_file(filename):
+            # Skip to the start time
+            f.seek(find_time_offset(
+                f,
+                start=query["start"],
+                log_format=get_log_format(
+                    format=query["format"],
+                    token_map=query["token_map"]
+                ),
+                encoding=query["encoding"]
+            ))
+
+        yield from _iter_output(
+            _match_entries(lines=_iter_raw_lines(f), query=query),
+            output=output
+        )
+
+
+#
+# _iter_query
+#
+def _iter_query(
+        filenames: Iterable[str],
+        query: dict,
+        output: str | None = "text",
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple]:
+    '''
+    Search log files, in file order
+
+    The query is a dict containing: format, token_map, start, end (as
+    timestamps), severities, logger_names, contains, regex, encoding and
+    multiline.
+
+    Args:
+        filenames (Iterable[str]): The log files
+        query (dict): The query
+        output (str | None): The output format (None to only count)
+        workers (int): The number of worker processes.  If 1, the files are
+            read in this process
+        chunk_size (int): The approximate size of the range of a file
+            searched by each worker
+
+    Returns:
+        Iterator[tuple]: The number of matching entries, and the output, as
+            each part of the files is searched
+
+    Raises:
+        None
+    '''
+    if workers <= 1:
+        for _filename in filenames:
+            yield from _iter_file(_filename, query=query, output=output)
+
+        return
+
+    yield from _run_tasks(
+        tasks=itertools.chain.from_iterable(
+            _query_tasks(
+                _filename,
+                query=query,
+                output=output,
+                chunk_size=chunk_size
+            )
+            for _filename in filenames
+        ),
+        workers=workers,
+        ordered=True
+    )
+
+
+#
+# _auto_workers
+#
+def _auto_workers(
+        filenames: Iterable[str],
+        min_size: int = AUTO_WORKERS_SIZE,
+        min_files: int = AUTO_WORKERS_FILES
+) -> int:
+    '''
+    Choose the number of worker processes for a query
+
+    Args:
+        filenames (Iterable[str]): The log files
+        min_size (int): The total size of the files (in bytes) from which
+            a worker is used for each CPU
+        min_files (int): The number of files from which a worker is used
+            for each CPU
+
+    Returns:
+        int: The number of workers (1 to search in this process)
+
+    Raises:
+        None
+    '''
+    filenames = list(filenames)
+    _size = sum(os.path.getsize(_filename) for _filename in filenames)
+    if _size < min_size and len(filenames) < min_files: return 1
+
+    return os.cpu_count() or 1
+
+
+###########################################################################
+#
+# Command Line
+#
+###########################################################################
+#
+# _parse_time
+#
+def _parse_time(value: str, log_format_string: str) -> float:
+    '''
+    Convert a time given on the command line into a timestamp
+
+    Args:
+        value (str): An epoch timestamp, ISO 8601 time, or a time in the
+            format used by the log (eg asctime)
+        log_format_string (str): The format used to create the log entries
+
+    Returns:
+        float: The timestamp
+
+    Raises:
+        ValueError:
+            when value cannot be converted
+    '''
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+
+    return _to_timestamp(
+        value,
+        log_format=get_log_format(format=log_format_string)
+    )
+
+
+#
+# _build_parser
+#
+def _build_parser() -> argparse.ArgumentParser:
+    '''
+    Create the command line parser
+
+    Args:
+        None
+
+    Returns:
+        argparse.ArgumentParser: The parser
+
+    Raises:
+        None
+    '''
+    _parser = argparse.ArgumentParser(
+        prog="python -m applogging",
+        description=(
+            "Filter, count and export the entries in log files.  Exits "
+            "with 0 if any entries match, otherwise 1."
+        )
+    )
+
+    _parser.add_argument(
+        "files",
+        nargs="+",
+        metavar="FILE",
+        help="log files to search (in order), which may be compressed"
+    )
+    _parser.add_argument(
+        "-f", "--format",
+        default=DEFAULT_LOG_FORMAT,
+        help="the format used to create the log entries"
+    )
+    _parser.add_argument(
+        "--since",
+        metavar="TIME",
+        help=(
+            "only entries logged at or after TIME (an epoch timestamp, ISO "
+            "8601 time or a time as written in the log)"
+        )
+    )
+    _parser.add_argument(
+        "--until",
+        metavar="TIME",
+        help="only entries logged before TIME"
+    )
+    _parser.add_argument(
+        "-s", "--severity",
+        action="append",
+        dest="severities",
+        metavar="SEVERITY",
+        help="only entries with SEVERITY (may be repeated)"
+    )
+    _parser.add_argument(
+        "-l", "--logger",
+        action="append",
+        dest="logger_names",
+        metavar="NAME",
+        help="only entries from the logger NAME (may be repeated)"
+    )
+    _parser.add_argument(
+        "-c", "--contains",
+        metavar="TEXT",
+        help="only entries containing TEXT"
+    )
+    _parser.add_argument(
+        "-e", "--regex",
+        metavar="PATTERN",
+        help="only entries with a message matching the regular expression"
+    )
+    _parser.add_argument(
+        "--count",
+        action="store_true",
+        help="print the number of matching entries, rather than the entries"
+    )
+    _parser.add_argument(
+        "-o", "--output",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="how matching entries are written (default: text)"
+    )
+    _parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help=(
+            "the number of worker processes (0 for the number of CPUs, "
+            "default: one per CPU for large queries, otherwise 1)"
+        )
+    )
+    _parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="the size of the part of a file searched by each worker"
+    )
+    _parser.add_argument(
+        "--encoding",
+        default="utf-8",
+        help="the encoding of the log files (default: utf-8)"
+    )
+    _parser.add_argument(
+        "--no-multiline",
+        action="store_false",
+        dest="multiline",
+        help="treat each line as an entry (don't join continuation lines)"
+    )
+
+    return _parser
+
+
+#
+# main
+#
+def main(argv: list | None = None) -> int:
+    '''
+    Run the command line tool
+
+    Args:
+        argv (list | None): The command line arguments (sys.argv if None)
+
+    Returns:
+        int: The exit status - 0 if any entries matched, otherwise 1
+
+    Raises:
+        SystemExit:
+            when the arguments are not valid
+    '''
+    _parser = _build_parser()
+    _args = _parser.parse_args(argv)
+
+    try:
+        get_log_format(format=_args.format)
+    except AssertionError as _err:
+        _parser.error(f"invalid format: {_err}")
+
+    _times = {}
+    for _name in ( "since", "until" ):
+        _value = getattr(_args, _name)
+        try:
+            _times[_name] = (
+                None if _value is None else _parse_time(_value, _args.format)
+            )
+        except ValueError:
+            _parser.error(f"invalid time for --{_name}: '{_value}'")
+
+    if _args.regex:
+        try:
+            re.compile(_args.regex)
+        except re.error as _err:
+            _parser.error(f"invalid regular expression: {_err}")
+
+    for _filename in _args.files:
+        if not os.path.isfile(_filename):
+            _parser.error(f"no such file: '{_filename}'")
+
+    _workers = _args.workers
+    if _workers is None:
+        _workers = _auto_workers(_args.files)
+
+    elif _workers < 0:
+        _parser.error("--workers must not be negative")
+
+    elif _workers == 0:
+        _workers = os.cpu_count() or 1
+
+    if _args.chunk_size <= 0: _parser.error("--chunk-size must be positive")
+
+    _query = {
+        "format": _args.format,
+        "token_map": {},
+        "start": _times["since"],
+        "end": _times["until"],
+        "severities": (
+            None if _args.severities is None
+            else [ _severity.upper() for _severity in _args.severities ]
+        ),
+        "logger_names": _args.logger_names,
+        "contains": _args.contains,
+        "regex": _args.regex,
+        "encoding": _args.encoding,
+        "multiline": _args.multiline
+    }
+    _output = None if _args.count else _args.output
+
+    _total = 0
+    try:
+        if _output == "csv":
+            csv.writer(sys.stdout, lineterminator="\n").writerow(COLUMN_FIELDS)
+
+        for _count, _text in _iter_query(
+                _args.files,
+                query=_query,
+                output=_output,
+                workers=_workers,
+                chunk_size=_args.chunk_size
+        ):
+            _total += _count
+            if _text:
+                sys.stdout.write(_text)
+                sys.stdout.flush()
+
+        if _args.count: print(_total)
+        sys.stdout.flush()
+
+    except BrokenPipeError:
+        # The output has been closed (eg piped to head) - Stop quietly
+        _devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(_devnull, sys.stdout.fileno())
+
+    except KeyboardInterrupt:
+        return 130
+
+    return 0 if _total else 1
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    sys.exit(main())
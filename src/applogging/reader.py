@@ -0,0 +1,995 @@
+#!/usr/bin/env python3
+'''
+Readers - Functions for reading and decoding log files
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import os
+import gzip
+import heapq
+import datetime
+import functools
+import logging.handlers
+import concurrent.futures
+
+# Local app modules
+from applogging.constants import DEFAULT_LOG_FORMAT
+from applogging.logging import DEFAULT_TIMED_ROTATING_FILE_WHEN
+from applogging.entry import (
+    ENTRY_FIELDS,
+    LogEntry,
+    LogFormat,
+    get_log_format,
+    iter_entries,
+    parse_many,
+    _is_gzip_file,
+    _open_log_file
+)
+
+# Imports for python variable type hints
+from typing import IO, Any, Callable, Iterable, Iterator, Union
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+TimeValue = Union[float, int, str, datetime.datetime]
+
+
+#
+# Constants
+#
+
+# The size of the byte ranges processed by each worker
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# The position of the time in ENTRY_FIELDS
+TIME_INDEX = ENTRY_FIELDS.index("time")
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Parallel Parsing
+#
+###########################################################################
+#
+# split_file
+#
+def split_file(
+        filename: str = "",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        log_format: LogFormat | None = None
+) -> list:
+    '''
+    Split a file into byte ranges, aligned to the start of a line
+
+    Args:
+        filename (str): The name of the file to split
+        chunk_size (int): The approximate size of each byte range
+        log_format (LogFormat | None): If provided, ranges are aligned to
+            the start of a line matching the format, so entries spanning
+            multiple lines are not split
+
+    Returns:
+        list: A list of (start, end) byte offsets
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when chunk_size is not a positive integer
+    '''
+    assert filename, "Empty filename supplied."
+    assert isinstance(filename, str), "Filename must be a string."
+    assert isinstance(chunk_size, int) and chunk_size > 0, (
+        "chunk_size must be a positive integer"
+    )
+
+    _size = os.path.getsize(filename)
+    _boundaries = [ 0 ]
+
+    with open(filename, "rb") as f:
+        for _offset in range(chunk_size, _size, chunk_size):
+            if _offset <= _boundaries[-1]: continue
+
+            # Move to the start of the line following the offset
+            f.seek(_offset - 1)
+            f.readline()
+            _boundary = f.tell()
+
+            # Skip any continuation lines
+            if log_format:
+                _line = f.readline()
+                while _line and not log_format.bytes_pattern.match(_line):
+                    _boundary = f.tell()
+                    _line = f.readline()
+
+            if _boundary >= _size: break
+            _boundaries.append(_boundary)
+
+    _boundaries.append(_size)
+
+    return [
+        (_start, _end)
+        for _start, _end in zip(_boundaries[:-1], _boundaries[1:])
+        if _end > _start
+    ]
+
+
+#
+# _parse_range
+#
+def _parse_range(
+        filename: str,
+        start: int,
+        end: int,
+        format: str,
+        token_map: dict,
+        columns: tuple | None,
+        encoding: str,
+        multiline: bool,
+        map_func: Callable | None,
+        encode: bool
+) -> Any:
+    '''
+    Decode the lines in a byte range of a file (run in a worker process)
+
+    Args:
+        filename (str): The name of the file to read
+        start (int): The offset of the start of the range
+        end (int): The offset of the end of the range
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        columns (tuple | None): The columns to return
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        map_func (Callable | None): A function applied to the columns
+        encode (bool): If True, dictionary encode the columns with few
+            distinct values
+
+    Returns:
+        Any: The columns (or the result of map_func)
+
+    Raises:
+        None
+    '''
+    with open(filename, "rb") as f:
+        f.seek(start)
+        _data = f.read(end - start)
+
+    return _parse_block(
+        _data,
+        format=format,
+        token_map=token_map,
+        columns=columns,
+        encoding=encoding,
+        multiline=multiline,
+        map_func=map_func,
+        encode=encode
+    )
+
+
+#
+# _parse_block
+#
+def _parse_block(
+        data: bytes,
+        format: str,
+        token_map: dict,
+        columns: tuple | None,
+        encoding: str,
+        multiline: bool,
+        map_func: Callable | None,
+        encode: bool
+) -> Any:
+    '''
+    Decode a block of lines (run in a worker process)
+
+    Args:
+        data (bytes): The lines to decode
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        columns (tuple | None): The columns to return
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        map_func (Callable | None): A function applied to the columns
+        encode (bool): If True, dictionary encode the columns with few
+            distinct values
+
+    Returns:
+        Any: The columns (or the result of map_func)
+
+    Raises:
+        None
+    '''
+    _columns = parse_many(
+        data.decode(encoding, errors="replace").split("\n"),
+        log_format=get_log_format(format=format, token_map=token_map),
+        columns=columns,
+        multiline=multiline,
+        encode=encode
+    )
+
+    return map_func(_columns) if map_func else _columns
+
+
+#
+# _iter_gzip_blocks
+#
+def _iter_gzip_blocks(
+        filename: str = "",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        log_format: LogFormat | None = None
+) -> Iterator[bytes]:
+    '''
+    Decompress a gzip file into blocks, aligned to the start of a line
+
+    A compressed file can't be split into byte ranges, so the blocks are
+    decompressed here and passed to the workers.
+
+    Args:
+        filename (str): The name of the file to split
+        chunk_size (int): The approximate size of each block
+        log_format (LogFormat | None): If provided, blocks are aligned to
+            the start of a line matching the format, so entries spanning
+            multiple lines are not split
+
+    Returns:
+        Iterator[bytes]: The blocks
+
+    Raises:
+        None
+    '''
+    with gzip.open(filename, "rb") as f:
+        _remainder = b""
+        while True:
+            _block = f.read(chunk_size)
+            if not _block: break
+
+            _data = _remainder + _block
+
+            # Find the start of the last line (or entry) in the block
+            _end = _data.rfind(b"\n") + 1
+            if log_format:
+                _match = log_format.bytes_pattern.match
+                while _end > 0 and not _match(_data, _end):
+                    _end = _data.rfind(b"\n", 0, _end - 1) + 1
+
+            if _end <= 0:
+                # No boundary in the block - Keep reading
+                _remainder = _data
+                continue
+
+            _remainder = _data[_end:]
+            yield _data[:_end]
+
+        if _remainder: yield _remainder
+
+
+#
+# iter_chunks_parallel
+#
+def iter_chunks_parallel(
+        filename: str = "",
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        columns: Iterable[str] | None = None,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        map_func: Callable | None = None,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        encode: bool = False
+) -> Iterator[Any]:
+    '''
+    Decode a log file in parallel, using a pool of worker processes
+
+    The file is split into byte ranges aligned to line boundaries, and each
+    range is decoded into columns (as per parse_many) by a worker.
+
+    Args:
+        filename (str): The name of the log file
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        columns (Iterable[str] | None): The columns to return.  All columns
+            are returned if None
+        workers (int | None): The number of worker processes (defaults to
+            the number of CPUs).  If 1, the file is decoded in this process
+        chunk_size (int): The approximate size of each byte range
+        ordered (bool): If True, results are returned in file order,
+            otherwise they are returned as they are completed
+        map_func (Callable | None): A function applied (in the worker) to
+            the columns for each range.  Must be able to be pickled
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry (ranges are aligned to the start of an entry)
+        encode (bool): If True, the columns with few distinct values are
+            returned as an EncodedColumn (as per parse_many)
+
+    Returns:
+        Iterator[Any]: The columns (or result of map_func) for each range
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when mapping is not valid
+            when chunk_size is not a positive integer
+            when workers is not None or a positive integer
+    '''
+    assert workers is None or (isinstance(workers, int) and workers > 0), (
+        "workers must be None or a positive integer"
+    )
+
+    # Validate the format before starting any workers
+    _log_format = get_log_format(format=format, token_map=token_map)
+
+    _options = dict(
+        format=format,
+        token_map=token_map,
+        columns=tuple(columns) if columns is not None else None,
+        encoding=encoding,
+        multiline=multiline,
+        map_func=map_func,
+        encode=encode
+    )
+
+    if _is_gzip_file(filename):
+        # The workers are given the decompressed blocks
+        _tasks = (
+            functools.partial(_parse_block, _block, **_options)
+            for _block in _iter_gzip_blocks(
+                filename=filename,
+                chunk_size=chunk_size,
+                log_format=_log_format if multiline else None
+            )
+        )
+
+    else:
+        _tasks = [
+            functools.partial(
+                _parse_range,
+                filename,
+                start=_start,
+                end=_end,
+                **_options
+            )
+            for _start, _end in split_file(
+                filename=filename,
+                chunk_size=chunk_size,
+                log_format=_log_format if multiline else None
+            )
+        ]
+
+    yield from _run_tasks(tasks=_tasks, workers=workers, ordered=ordered)
+
+
+#
+# _run_tasks
+#
+def _run_tasks(
+        tasks: Iterable[functools.partial],
+        workers: int | None = None,
+        ordered: bool = True
+) -> Iterator[Any]:
+    '''
+    Run tasks using a pool of worker processes
+
+    Args:
+        tasks (Iterable[functools.partial]): The tasks to run.  Each must be
+            able to be pickled
+        workers (int | None): The number of worker processes (defaults to
+            the number of CPUs).  If 1, the tasks are run in this process
+        ordered (bool): If True, results are returned in the order of the
+            tasks, otherwise they are returned as they are completed
+
+    Returns:
+        Iterator[Any]: The result of each task
+
+    Raises:
+        None
+    '''
+    if workers is None: workers = os.cpu_count() or 1
+    if isinstance(tasks, list): workers = min(workers, len(tasks))
+
+    if workers <= 1:
+        for _task in tasks:
+            yield _task()
+
+        return
+
+    # Only a few tasks are queued for each worker, so the blocks of a
+    # compressed file are not all held in memory
+    _queue_size = workers * 2
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as _pool:
+        _futures = []
+        for _task in tasks:
+            _futures.append(
+                _pool.submit(_task.func, *_task.args, **_task.keywords)
+            )
+            if len(_futures) < _queue_size: continue
+
+            if ordered:
+                yield _futures.pop(0).result()
+                continue
+
+            _done, _ = concurrent.futures.wait(
+                _futures,
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for _future in _done:
+                _futures.remove(_future)
+                yield _future.result()
+
+        if not ordered:
+            _futures = concurrent.futures.as_completed(_futures)
+
+        for _future in _futures:
+            yield _future.result()
+
+
+#
+# reduce_parallel
+#
+def reduce_parallel(
+        filename: str = "",
+        map_func: Callable | None = None,
+        reduce_func: Callable | None = None,
+        initial: Any = None,
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        columns: Iterable[str] | None = None,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        encode: bool = False
+) -> Any:
+    '''
+    Decode a log file in parallel, reducing the results as they complete
+
+    Args:
+        filename (str): The name of the log file
+        map_func (Callable): A function applied (in the worker) to the
+            columns for each range.  Must be able to be pickled
+        reduce_func (Callable): A function combining the accumulated value
+            and the result of map_func for a range
+        initial (Any): The initial accumulated value
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        columns (Iterable[str] | None): The columns passed to map_func.  All
+            columns are passed if None
+        workers (int | None): The number of worker processes (defaults to
+            the number of CPUs)
+        chunk_size (int): The approximate size of each byte range
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        encode (bool): If True, the columns with few distinct values are
+            passed to map_func as an EncodedColumn
+
+    Returns:
+        Any: The accumulated value
+
+    Raises:
+        AssertionError:
+            when map_func or reduce_func is not callable
+            when filename is not a non-empty string
+            when mapping is not valid
+    '''
+    assert callable(map_func), "map_func must be callable"
+    assert callable(reduce_func), "reduce_func must be callable"
+
+    _result = initial
+    for _chunk in iter_chunks_parallel(
+            filename=filename,
+            format=format,
+            token_map=token_map,
+            columns=columns,
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=False,
+            map_func=map_func,
+            encoding=encoding,
+            multiline=multiline,
+            encode=encode
+    ):
+        _result = reduce_func(_result, _chunk)
+
+    return _result
+
+
+###########################################################################
+#
+# Time Range
+#
+###########################################################################
+#
+# _to_timestamp
+#
+def _to_timestamp(
+        value: TimeValue | None = None,
+        log_format: LogFormat | None = None
+) -> float | None:
+    '''
+    Convert a time into an epoch timestamp
+
+    Args:
+        value (TimeValue | None): An epoch timestamp, datetime, or time
+            string in the format used by the log (eg asctime)
+        log_format (LogFormat | None): The log format used to decode
+            time strings
+
+    Returns:
+        float | None: The timestamp, or None if value is None
+
+    Raises:
+        ValueError:
+            when value is a string that cannot be decoded
+    '''
+    if value is None: return None
+
+    if isinstance(value, datetime.datetime): return value.timestamp()
+
+    if isinstance(value, str):
+        if log_format is None: log_format = get_log_format()
+
+        _timestamp = log_format.timestamp_decoder.decode(value)
+        if _timestamp is None:
+            raise ValueError(f"'{value}' is not a valid time")
+
+        return _timestamp
+
+    assert isinstance(value, (int, float)), (
+        "time must be a timestamp, datetime or string"
+    )
+
+    return float(value)
+
+
+#
+# _next_entry_timestamp
+#
+def _next_entry_timestamp(
+        fileobj: IO,
+        offset: int,
+        log_format: LogFormat,
+        encoding: str = "utf-8"
+) -> tuple:
+    '''
+    Find the first entry starting at or after an offset, and its timestamp
+
+    Lines not matching the format, or without a valid time, are skipped.
+
+    Args:
+        fileobj (IO): The log file (opened in binary mode)
+        offset (int): The offset to start looking from
+        log_format (LogFormat): The compiled log format
+        encoding (str): The encoding of the log file
+
+    Returns:
+        tuple: The offset of the entry and its timestamp, or (None, None) if
+            there are no more entries
+
+    Raises:
+        None
+    '''
+    # Resync to the start of the next line
+    if offset > 0:
+        fileobj.seek(offset - 1)
+        fileobj.readline()
+    else:
+        fileobj.seek(0)
+
+    _match_line = log_format._match_line
+    _decode_timestamp = log_format.timestamp_decoder.decode
+
+    while True:
+        _offset = fileobj.tell()
+        _line = fileobj.readline()
+        if not _line: return None, None
+
+        _line = _line.decode(encoding, errors="replace")
+        _match = _match_line(_line)
+        if not _match: continue
+
+        _time = log_format.decode_field(
+            msg=_line,
+            match=_match,
+            index=TIME_INDEX
+        )
+        _timestamp = _decode_timestamp(_time)
+        if _timestamp is not None: return _offset, _timestamp
+
+
+#
+# find_time_offset
+#
+def find_time_offset(
+        fileobj: IO,
+        start: TimeValue | None = None,
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8"
+) -> int:
+    '''
+    Binary search a log file for the first entry logged at or after a time
+
+    The entries in the file must be in time order (as written by a handler).
+
+    Args:
+        fileobj (IO): The log file (opened in binary mode)
+        start (TimeValue | None): The time to search for
+        log_format (LogFormat | None): The compiled log format (the default
+            format if None)
+        encoding (str): The encoding of the log file
+
+    Returns:
+        int: The offset of the entry (the size of the file if there are no
+            entries at or after start)
+
+    Raises:
+        ValueError:
+            when start is a string that cannot be decoded
+    '''
+    if log_format is None: log_format = get_log_format()
+
+    fileobj.seek(0, os.SEEK_END)
+    _size = fileobj.tell()
+
+    _start = _to_timestamp(value=start, log_format=log_format)
+    if _start is None: return 0
+
+    # Find the smallest offset where the next entry is at or after start
+    _low = 0
+    _high = _size
+    while _low < _high:
+        _mid = (_low + _high) // 2
+        _, _timestamp = _next_entry_timestamp(
+            fileobj=fileobj,
+            offset=_mid,
+            log_format=log_format,
+            encoding=encoding
+        )
+
+        if _timestamp is None or _timestamp >= _start:
+            _high = _mid
+        else:
+            _low = _mid + 1
+
+    _offset, _ = _next_entry_timestamp(
+        fileobj=fileobj,
+        offset=_low,
+        log_format=log_format,
+        encoding=encoding
+    )
+
+    return _size if _offset is None else _offset
+
+
+#
+# iter_entries_between
+#
+def iter_entries_between(
+        filename: str = "",
+        start: TimeValue | None = None,
+        end: TimeValue | None = None,
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        lazy: bool = False
+) -> Iterator[LogEntry]:
+    '''
+    Decode the entries in a log file logged between two times
+
+    The start of the range is found with a binary search of the file, and
+    entries are only decoded from there until the end of the range.  The
+    entries in the file must be in time order (as written by a handler).
+    Log files compressed with gzip are read from the start.
+
+    Args:
+        filename (str): The name of the log file
+        start (TimeValue | None): The start of the range (inclusive).  If
+            None, start from the beginning of the file
+        end (TimeValue | None): The end of the range (exclusive).  If None,
+            continue to the end of the file
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        log_format (LogFormat | None): A compiled log format to use
+            instead of format and token_map
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        lazy (bool): If True, the attributes of each entry are decoded when
+            first accessed
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+            when mapping is not valid
+        ValueError:
+            when start or end is a string that cannot be decoded
+    '''
+    assert filename, "Empty filename supplied."
+    assert isinstance(filename, str), "Filename must be a string."
+
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
+
+    _end = _to_timestamp(value=end, log_format=log_format)
+
+    _start = None
+
+    with _open_log_file(filename) as f:
+        if isinstance(f, gzip.GzipFile):
+            # Seeking a compressed file means decompressing it from the
+            # start - Skip the entries before the start instead
+            _start = _to_timestamp(value=start, log_format=log_format)
+
+        else:
+            f.seek(find_time_offset(
+                fileobj=f,
+                start=start,
+                log_format=log_format,
+                encoding=encoding
+            ))
+
+        for _entry in iter_entries(
+                source=f,
+                log_format=log_format,
+                encoding=encoding,
+                multiline=multiline,
+                lazy=lazy
+        ):
+            if _start is not None:
+                _timestamp = _entry.timestamp
+                if _timestamp is None or _timestamp < _start: continue
+                _start = None
+
+            if _end is not None:
+                _timestamp = _entry.timestamp
+                if _timestamp is not None and _timestamp >= _end: break
+
+            yield _entry
+
+
+###########################################################################
+#
+# Rotation Sets
+#
+###########################################################################
+#
+# rotation_files
+#
+def rotation_files(
+        filename: str = "",
+        when: str = DEFAULT_TIMED_ROTATING_FILE_WHEN
+) -> list:
+    '''
+    Find the files in a rotation set (as created by the timed rotating file
+    handler), oldest first
+
+    The rotated files are found using the same match as the handler uses to
+    find the files to delete, including compressed files (.gz).
+
+    Args:
+        filename (str): The name of the log file (as given to the handler)
+        when (str): The type of interval used by the handler (see
+            logging.handlers.TimedRotatingFileHandler)
+
+    Returns:
+        list: The names of the rotated files (oldest first), followed by the
+            log file (if it exists)
+
+    Raises:
+        AssertionError:
+            when filename is not a non-empty string
+        ValueError:
+            when 'when' is not valid
+    '''
+    assert filename, "Empty filename supplied."
+    assert isinstance(filename, str), "Filename must be a string."
+
+    # Use the handler to get the match for the rotated file names (delay
+    # means the log file is not opened)
+    _handler = logging.handlers.TimedRotatingFileHandler(
+        filename,
+        when=when,
+        delay=True
+    )
+    _ext_match = _handler.extMatch
+    _handler.close()
+
+    _dir, _base = os.path.split(os.path.abspath(filename))
+    _prefix = f"{_base}."
+
+    _suffixes = []
+    for _name in os.listdir(_dir):
+        if not _name.startswith(_prefix): continue
+
+        _suffix = _name[len(_prefix):]
+        if _ext_match.match(_suffix): _suffixes.append(_suffix)
+
+    # Compression may not be complete - Use the compressed file if present
+    _suffixes = [
+        _suffix for _suffix in _suffixes
+        if f"{_suffix}.gz" not in _suffixes
+    ]
+
+    # The suffixes are times, so sort oldest first
+    _files = [
+        os.path.join(os.path.dirname(filename), f"{_prefix}{_suffix}")
+        for _suffix in sorted(_suffixes)
+    ]
+    if os.path.exists(filename): _files.append(filename)
+
+    return _files
+
+
+#
+# _iter_keyed_entries
+#
+def _iter_keyed_entries(
+        filename: str = "",
+        number: int = 0,
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        lazy: bool = False
+) -> Iterator[tuple]:
+    '''
+    Decode the entries in a log file, with the key used to merge them
+
+    Args:
+        filename (str): The name of the log file
+        number (int): The position of the file in the files being merged
+        log_format (LogFormat): The compiled log format
+        encoding (str): The encoding of the log file
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        lazy (bool): If True, the attributes of each entry are decoded when
+            first accessed
+
+    Returns:
+        Iterator[tuple]: For each entry - (timestamp, file number, entry
+            number, entry)
+
+    Raises:
+        None
+    '''
+    # Entries without a time stay with the entry before them
+    _timestamp = float("-inf")
+
+    for _count, _entry in enumerate(iter_entries(
+            source=filename,
+            log_format=log_format,
+            encoding=encoding,
+            multiline=multiline,
+            lazy=lazy
+    )):
+        _entry_timestamp = _entry.timestamp
+        if _entry_timestamp is not None: _timestamp = _entry_timestamp
+
+        yield _timestamp, number, _count, _entry
+
+
+#
+# merge_entries
+#
+def merge_entries(
+        filenames: Iterable[str] = (),
+        format: str = DEFAULT_LOG_FORMAT,
+        token_map: dict = {},
+        log_format: LogFormat | None = None,
+        encoding: str = "utf-8",
+        multiline: bool = True,
+        lazy: bool = False
+) -> Iterator[LogEntry]:
+    '''
+    Decode the entries in a number of log files, in time order
+
+    The entries in each file must be in time order (as written by a
+    handler).  The files are read as a stream and merged, so only one entry
+    from each file is held at a time.  Entries with the same time are
+    returned in the order of the files.
+
+    Args:
+        filenames (Iterable[str]): The names of the log files (eg from
+            rotation_files)
+        format (str): The format used to create the log entries
+        token_map (dict): Modifications to the default mapping dict used
+            to extract the tokens
+        log_format (LogFormat | None): A compiled log format to use
+            instead of format and token_map
+        encoding (str): The encoding of the log files
+        multiline (bool): If True, join continuation lines to the preceding
+            entry
+        lazy (bool): If True, the attributes of each entry are decoded when
+            first accessed
+
+    Returns:
+        Iterator[LogEntry]: The decoded log entries
+
+    Raises:
+        AssertionError:
+            when filenames is a string
+            when mapping is not valid
+    '''
+    assert not isinstance(filenames, str), (
+        "filenames must be a collection of strings"
+    )
+
+    if log_format is None:
+        log_format = get_log_format(format=format, token_map=token_map)
+
+    _streams = [
+        _iter_keyed_entries(
+            filename=_filename,
+            number=_number,
+            log_format=log_format,
+            encoding=encoding,
+            multiline=multiline,
+            lazy=lazy
+        )
+        for _number, _filename in enumerate(filenames)
+    ]
+
+    for _, _, _, _entry in heapq.merge(*_streams):
+        yield _entry
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
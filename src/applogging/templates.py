@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+'''
+Templates - Mining message templates from log entries
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import collections
+
+# Local app modules
+from applogging.entry import LogEntry
+
+# Imports for python variable type hints
+from typing import Any, Iterable, Iterator
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# Marks a variable token (parameter) in a template
+WILDCARD = "<*>"
+
+# Defaults for the template miner
+DEFAULT_DEPTH = 4
+DEFAULT_SIMILARITY = 0.4
+DEFAULT_MAX_CHILDREN = 100
+DEFAULT_MAX_TEMPLATES = 1000
+
+# Characters marking a token as a likely parameter (it contains a digit)
+_DIGITS = frozenset("0123456789")
+
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Node Class Definition
+#
+###########################################################################
+class _Node():
+    '''
+    A node of the prefix tree
+
+    Attributes:
+        children (dict): The child nodes, keyed by token
+        templates (list): The templates in a leaf node (in the order
+            created)
+        parent (_Node | None): The parent node (None for the root)
+        key (Any): The key of the node in the children of its parent
+    '''
+    __slots__ = ( "children", "templates", "parent", "key" )
+
+    #
+    # __init__
+    #
+    def __init__(self, parent: _Node | None = None, key: Any = None):
+        '''
+        Initialises the instance.
+
+        Args:
+            parent (_Node | None): The parent node (None for the root)
+            key (Any): The key of the node in the children of its parent
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self.children = {}
+        self.templates = []
+        self.parent = parent
+        self.key = key
+
+
+###########################################################################
+#
+# Template Class Definition
+#
+###########################################################################
+class _Template():
+    '''
+    A message template found by the miner
+
+    Attributes:
+        template_id (int): The ID of the template
+        tokens (list): The tokens of the template (WILDCARD where the token
+            is a parameter)
+        count (int): The number of messages added to the template
+        leaf (_Node | None): The leaf node holding the template
+    '''
+    __slots__ = ( "template_id", "tokens", "count", "leaf" )
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            template_id: int = 0,
+            tokens: list = [],
+            leaf: _Node | None = None
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            template_id (int): The ID of the template
+            tokens (list): The tokens of the template (WILDCARD where the
+                token is a parameter)
+            leaf (_Node | None): The leaf node holding the template
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        self.template_id = template_id
+        self.tokens = tokens
+        self.count = 1
+        self.leaf = leaf
+
+
+###########################################################################
+#
+# TemplateMiner Class Definition
+#
+###########################################################################
+class TemplateMiner():
+    '''
+    Class to cluster log messages into templates, a message at a time (in
+    the style of the Drain algorithm)
+
+    Messages are split into tokens on whitespace.  A prefix tree, keyed by
+    the number of tokens and then the first (depth - 2) tokens, finds the
+    few templates a message is compared with.  Tokens containing a digit
+    are routed as parameters, and a node with max_children children routes
+    any new tokens to a wildcard node, so the tree stays small.
+
+    A message is added to the most similar template (the fraction of its
+    tokens matching the template), if at least similarity.  The tokens that
+    differ become parameters of the template.  Otherwise a new template is
+    created.  Once there are max_templates templates, the least recently
+    used template is discarded to make room for a new one.
+
+    Attributes:
+        depth (int) [ReadOnly]: The depth of the prefix tree
+        similarity (float) [ReadOnly]: The similarity needed to add a
+            message to a template
+        max_children (int) [ReadOnly]: The maximum number of children of a
+            node in the prefix tree
+        max_templates (int | None) [ReadOnly]: The maximum number of
+            templates kept (no limit if None)
+        templates (dict) [ReadOnly]: The template string for each template
+            ID (the least recently used first)
+        counts (dict) [ReadOnly]: The number of messages added to each
+            template, by template ID
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(
+            self,
+            depth: int = DEFAULT_DEPTH,
+            similarity: float = DEFAULT_SIMILARITY,
+            max_children: int = DEFAULT_MAX_CHILDREN,
+            max_templates: int | None = DEFAULT_MAX_TEMPLATES
+    ):
+        '''
+        Initialises the instance.
+
+        Args:
+            depth (int): The depth of the prefix tree (at least 3) - The
+                root, the number of tokens, (depth - 2) tokens, and the
+                leaf nodes holding the templates
+            similarity (float): The similarity (from 0 to 1) needed to add
+                a message to a template
+            max_children (int): The maximum number of children of a node
+                in the prefix tree (at least 2)
+            max_templates (int | None): The maximum number of templates
+                kept (no limit if None)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when depth is not an integer of at least 3
+                when similarity is not a number from 0 to 1
+                when max_children is not an integer of at least 2
+                when max_templates is not None or a positive integer
+        '''
+        assert isinstance(depth, int) and depth >= 3, (
+            "depth must be an integer of at least 3"
+        )
+        assert isinstance(similarity, (int, float)), (
+            "similarity must be a number"
+        )
+        assert 0 <= similarity <= 1, "similarity must be from 0 to 1"
+        assert isinstance(max_children, int) and max_children >= 2, (
+            "max_children must be an integer of at least 2"
+        )
+        assert max_templates is None or (
+            isinstance(max_templates, int) and max_templates > 0
+        ), "max_templates must be None or a positive integer"
+
+        # Private Attributes
+        self._depth = depth
+        self._similarity = similarity
+        self._max_children = max_children
+        self._max_templates = max_templates
+
+        # The prefix tree (the first layer is keyed by the number of tokens)
+        self._root = _Node()
+
+        # The templates by ID, the least recently used first
+        self._templates = collections.OrderedDict()
+        self._last_id = 0
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # depth
+    #
+    @property
+    def depth(self) -> int:
+        ''' The depth of the prefix tree '''
+        return self._depth
+
+
+    #
+    # similarity
+    #
+    @property
+    def similarity(self) -> float:
+        ''' The similarity needed to add a message to a template '''
+        return self._similarity
+
+
+    #
+    # max_children
+    #
+    @property
+    def max_children(self) -> int:
+        ''' The maximum number of children of a node '''
+        return self._max_children
+
+
+    #
+    # max_templates
+    #
+    @property
+    def max_templates(self) -> int | None:
+        ''' The maximum number of templates kept '''
+        return self._max_templates
+
+
+    #
+    # templates
+    #
+    @property
+    def templates(self) -> dict:
+        ''' The template string for each template ID '''
+        return {
+            _id: " ".join(_template.tokens)
+            for _id, _template in self._templates.items()
+        }
+
+
+    #
+    # counts
+    #
+    @property
+    def counts(self) -> dict:
+        ''' The number of messages added to each template '''
+        return {
+            _id: _template.count
+            for _id, _template in self._templates.items()
+        }
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # __len__
+    #
+    def __len__(self) -> int:
+        ''' The number of templates '''
+        return len(self._templates)
+
+
+    #
+    # _find_leaf
+    #
+    def _find_leaf(self, tokens: list, create: bool = False) -> _Node | None:
+        '''
+        Find the leaf node for a message
+
+        Args:
+            tokens (list): The tokens of the message
+            create (bool): If True, create any nodes needed, otherwise
+                return None if there is no leaf for the message
+
+        Returns:
+            _Node | None: The leaf node
+
+        Raises:
+            None
+        '''
+        _node = self._root.children.get(len(tokens))
+        if _node is None:
+            if not create: return None
+
+            _node = self._root.children[len(tokens)] = _Node(
+                parent=self._root,
+                key=len(tokens)
+            )
+
+        for _token in tokens[:self._depth - 2]:
+            _children = _node.children
+
+            _child = _children.get(_token)
+            if _child is not None:
+                _node = _child
+                continue
+
+            if not create:
+                _node = _children.get(WILDCARD)
+                if _node is None: return None
+                continue
+
+            # Tokens with a digit, and new tokens once the node is full,
+            # are routed to the wildcard
+            _key = _token
+            if not _DIGITS.isdisjoint(_token):
+                _key = WILDCARD
+            elif len(_children) >= self._max_children - (
+                    WILDCARD not in _children):
+                _key = WILDCARD
+
+            _child = _children.get(_key)
+            if _child is None:
+                _child = _children[_key] = _Node(parent=_node, key=_key)
+
+            _node = _child
+
+        return _node
+
+
+    #
+    # _best_template
+    #
+    def _best_template(self, leaf: _Node, tokens: list) -> tuple:
+        '''
+        Find the template in a leaf node most similar to a message
+
+        The templates in a leaf all have the same number of tokens as the
+        message, so the number of tokens the same is compared.
+
+        Args:
+            leaf (_Node): The leaf node
+            tokens (list): The tokens of the message
+
+        Returns:
+            tuple: The template (the one with the most parameters if several
+                are as similar, or None if the leaf is empty), the number of
+                tokens the same and the number of parameters
+
+        Raises:
+            None
+        '''
+        _best = None
+        _best_score = ( -1, -1 )
+
+        for _template in leaf.templates:
+            _same = 0
+            _parameters = 0
+            for _template_token, _token in zip(_template.tokens, tokens):
+                if _template_token == WILDCARD:
+                    _parameters += 1
+                elif _template_token == _token:
+                    _same += 1
+
+            if ( _same, _parameters ) > _best_score:
+                _best = _template
+                _best_score = ( _same, _parameters )
+
+        return _best, *_best_score
+
+
+    #
+    # _remove_oldest
+    #
+    def _remove_oldest(self):
+        '''
+        Discard the least recently used template
+
+        Any nodes left empty are removed from the prefix tree, so the tree
+        does not grow with the templates discarded.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        _, _template = self._templates.popitem(last=False)
+        _node = _template.leaf
+        _node.templates.remove(_template)
+
+        while (
+            _node.parent is not None and
+            not _node.templates and
+            not _node.children
+        ):
+            del _node.parent.children[_node.key]
+            _node = _node.parent
+
+
+    #
+    # add
+    #
+    def add(self, message: str = "") -> tuple:
+        '''
+        Add a message to the most similar template, or a new template
+
+        Args:
+            message (str): The message (eg LogEntry.message)
+
+        Returns:
+            tuple: The template ID, and a tuple of the parameters (the
+                tokens of the message where the template has a WILDCARD)
+
+        Raises:
+            None
+        '''
+        _tokens = message.split()
+
+        _leaf = self._find_leaf(_tokens, create=True)
+        _template, _same, _parameters = self._best_template(_leaf, _tokens)
+
+        # An empty message matches the empty template
+        if _template is not None and _tokens and (
+                _same / len(_tokens) < self._similarity):
+            _template = None
+
+        if _template is None:
+            if (
+                self._max_templates is not None and
+                len(self._templates) >= self._max_templates
+            ):
+                self._remove_oldest()
+
+                # The leaf may have been removed with the template
+                _leaf = self._find_leaf(_tokens, create=True)
+
+            self._last_id += 1
+            _template = _Template(
+                template_id=self._last_id,
+                tokens=_tokens,
+                leaf=_leaf
+            )
+            _leaf.templates.append(_template)
+            self._templates[_template.template_id] = _template
+
+            return _template.template_id, ()
+
+        # Tokens which differ become parameters
+        if _same + _parameters < len(_tokens):
+            _template.tokens = [
+                _template_token if _template_token == _token else WILDCARD
+                for _template_token, _token in zip(_template.tokens, _tokens)
+            ]
+
+        _template.count += 1
+        self._templates.move_to_end(_template.template_id)
+
+        return _template.template_id, tuple(
+            _token
+            for _template_token, _token in zip(_template.tokens, _tokens)
+            if _template_token == WILDCARD
+        )
+
+
+    #
+    # match
+    #
+    def match(self, message: str = "") -> tuple | None:
+        '''
+        Find the template a message fits, without changing the templates
+
+        Args:
+            message (str): The message
+
+        Returns:
+            tuple | None: The template ID, and a tuple of the parameters, or
+                None if the message does not fit a template exactly (every
+                token other than the parameters must be the same)
+
+        Raises:
+            None
+        '''
+        _tokens = message.split()
+
+        _leaf = self._find_leaf(_tokens, create=False)
+        if _leaf is None: return None
+
+        # The template with the most tokens the same, and no others
+        # different
+        _template = None
+        _best_same = -1
+        for _candidate in _leaf.templates:
+            _same = 0
+            for _template_token, _token in zip(_candidate.tokens, _tokens):
+                if _template_token == _token:
+                    _same += 1
+                elif _template_token != WILDCARD:
+                    break
+            else:
+                if _same > _best_same:
+                    _template = _candidate
+                    _best_same = _same
+
+        if _template is None: return None
+
+        return _template.template_id, tuple(
+            _token
+            for _template_token, _token in zip(_template.tokens, _tokens)
+            if _template_token == WILDCARD
+        )
+
+
+    #
+    # template
+    #
+    def template(self, template_id: int = 0) -> str | None:
+        '''
+        Get a template string
+
+        Args:
+            template_id (int): The ID of the template
+
+        Returns:
+            str | None: The template (tokens joined by spaces, with WILDCARD
+                for each parameter), or None if there is no such template
+
+        Raises:
+            None
+        '''
+        _template = self._templates.get(template_id)
+        if _template is None: return None
+
+        return " ".join(_template.tokens)
+
+
+###########################################################################
+#
+# Streaming
+#
+###########################################################################
+#
+# iter_templates
+#
+def iter_templates(
+        entries: Iterable[LogEntry] = (),
+        miner: TemplateMiner | None = None
+) -> Iterator[tuple]:
+    '''
+    Add the message of each entry to a template miner, as the entries are
+    read (eg from iter_entries)
+
+    Args:
+        entries (Iterable[LogEntry]): The log entries
+        miner (TemplateMiner | None): The template miner (a new miner with
+            the default settings if None)
+
+    Returns:
+        Iterator[tuple]: The entry, the template ID and the parameters, for
+            each entry
+
+    Raises:
+        None
+    '''
+    if miner is None: miner = TemplateMiner()
+
+    _add = miner.add
+    for _entry in entries:
+        _template_id, _parameters = _add(_entry.message)
+        yield _entry, _template_id, _parameters
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
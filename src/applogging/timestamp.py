@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+'''
+AsctimeDecoder - Class for decoding asctime strings into timestamps
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+from __future__ import annotations
+
+# Shared variables, constants, etc
+
+# System Modules
+import datetime
+
+# Local app modules
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+
+#
+# Constants
+#
+
+# The length of the 'YYYY-MM-DD HH:MM:SS' prefix of asctime
+ASCTIME_SECONDS_LENGTH = 19
+
+# The length of asctime including milliseconds ('YYYY-MM-DD HH:MM:SS,mmm')
+ASCTIME_LENGTH = 23
+
+# The separators expected at each position in the prefix
+ASCTIME_SEPARATORS = { 4: "-", 7: "-", 10: " ", 13: ":", 16: ":" }
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# AsctimeDecoder Class Definition
+#
+###########################################################################
+class AsctimeDecoder():
+    '''
+    Class for decoding asctime strings (as produced by the logging module)
+    into an epoch timestamp
+
+    Consecutive log entries are usually logged in the same second, so the
+    'YYYY-MM-DD HH:MM:SS' prefix of the last string decoded is cached and
+    only the milliseconds are decoded when the prefix is the same.
+
+    Attributes:
+        utc (bool) [ReadOnly]: True if the times are in UTC rather than the
+            local timezone
+    '''
+
+    #
+    # __init__
+    #
+    def __init__(self, utc: bool = False):
+        '''
+        Initialises the instance.
+
+        Args:
+            utc (bool): True if the times are in UTC rather than the local
+                timezone (the logging module uses local time by default)
+
+        Returns:
+            None
+
+        Raises:
+            None
+        '''
+        # Private Attributes
+        self._utc = bool(utc)
+
+        # The last prefix decoded and its timestamp - (prefix, timestamp)
+        self._cache = ( "", 0.0 )
+
+
+    ###########################################################################
+    #
+    # Properties
+    #
+    ###########################################################################
+    #
+    # utc
+    #
+    @property
+    def utc(self) -> bool:
+        ''' True if the times are in UTC rather than the local timezone '''
+        return self._utc
+
+
+    ###########################################################################
+    #
+    # Methods
+    #
+    ###########################################################################
+    #
+    # _decode_seconds
+    #
+    def _decode_seconds(self, prefix: str = "") -> float | None:
+        '''
+        Decode the 'YYYY-MM-DD HH:MM:SS' prefix of asctime
+            
+        Args:
+            prefix (str): The prefix to decode
+        
+        Returns:
+            float | None: The timestamp, or None if the prefix is not valid
+
+        Raises:
+            None
+        '''
+        if len(prefix) != ASCTIME_SECONDS_LENGTH: return None
+
+        for _pos, _separator in ASCTIME_SEPARATORS.items():
+            if prefix[_pos] != _separator: return None
+
+        try:
+            _datetime = datetime.datetime(
+                int(prefix[0:4]),
+                int(prefix[5:7]),
+                int(prefix[8:10]),
+                int(prefix[11:13]),
+                int(prefix[14:16]),
+                int(prefix[17:19]),
+                tzinfo=datetime.timezone.utc if self._utc else None
+            )
+
+        except ValueError:
+            return None
+
+        return _datetime.timestamp()
+
+
+    #
+    # decode
+    #
+    def decode(self, asctime: str = "") -> float | None:
+        '''
+        Decode asctime into an epoch timestamp
+            
+        Args:
+            asctime (str): The time string (eg '2025-01-01 10:00:00,000')
+        
+        Returns:
+            float | None: The timestamp, or None if asctime is not valid
+
+        Raises:
+            None
+        '''
+        _prefix = asctime[:ASCTIME_SECONDS_LENGTH]
+
+        # Use the cached value if the second is the same
+        _cached_prefix, _seconds = self._cache
+        if _prefix != _cached_prefix:
+            _seconds = self._decode_seconds(prefix=_prefix)
+            if _seconds is None: return None
+
+            self._cache = ( _prefix, _seconds )
+
+        _length = len(asctime)
+        if _length == ASCTIME_SECONDS_LENGTH: return _seconds
+
+        _msecs = asctime[ASCTIME_SECONDS_LENGTH + 1:]
+        if (
+            _length != ASCTIME_LENGTH or
+            asctime[ASCTIME_SECONDS_LENGTH] not in ",." or
+            not (_msecs.isascii() and _msecs.isdigit())
+        ):
+            return None
+
+        return _seconds + int(_msecs) / 1000
+
+
+###########################################################################
+#
+# In case this is run directly rather than imported...
+#
+###########################################################################
+'''
+Handle case of being run directly rather than imported
+'''
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of log entry aggregation
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+import pickle
+import datetime
+
+# Local app modules
+from applogging.entry import iter_entries, parse_many
+from applogging.analytics import Aggregator, aggregate_parallel, histogram
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+LOG_LINES = [
+    (
+        f"2025-01-01 10:{_count // 60:02d}:{_count % 60:02d},000: "
+        f"[{LOGGER_NAME}] [{SEVERITIES[_count % len(SEVERITIES)]}] "
+        f"{DEFAULT_LOG_STRING} {_count}"
+    )
+    for _count in range(300)
+]
+START = datetime.datetime(2025, 1, 1, 10, 0, 0).timestamp()
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Aggregation
+#
+class Test_Aggregator():
+    '''
+    Test Class - Test counting log entries by group
+
+    Attributes:
+        None
+    '''
+    #
+    # Count by severity and time bucket
+    #
+    def test_aggregator(self):
+        '''
+        Test counting by severity and minute
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _agg = Aggregator(group_by=[ "severity" ], bucket_width=60)
+        _agg.update_lines(LOG_LINES + [ "Traceback:", "  Line 1" ])
+
+        assert _agg.count == len(LOG_LINES)
+        assert len(_agg.groups) == len(SEVERITIES) * 5
+        assert _agg.groups[( "DEBUG", START )] == ( 15, START, START + 56 )
+        assert _agg.groups[( "ERROR", START + 240 )] == (
+            15, START + 243, START + 299
+        )
+
+        # The same counts from columns
+        _columns = Aggregator(group_by=[ "severity" ], bucket_width=60)
+        _columns.update_columns(parse_many(
+            LOG_LINES,
+            columns=[ "severity", "timestamp" ]
+        ))
+        assert _columns.groups == _agg.groups
+
+        with pytest.raises(ValueError):
+            Aggregator(group_by=[ "level" ])
+
+        with pytest.raises(AssertionError):
+            Aggregator(group_by="severity")
+
+
+    #
+    # Merge results
+    #
+    def test_aggregator_merge(self, logfile):
+        '''
+        Test aggregators from parts of a log can be merged
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        _all = Aggregator(group_by=[ "logger_name", "severity" ])
+        _all.update_entries(iter_entries(logfile))
+
+        _first = Aggregator(group_by=[ "logger_name", "severity" ])
+        _first.update_lines(LOG_LINES[:100])
+        _second = Aggregator(group_by=[ "logger_name", "severity" ])
+        _second.update_lines(LOG_LINES[100:])
+
+        # Results are passed between processes
+        _second = pickle.loads(pickle.dumps(_second))
+
+        assert _first.merge(_second).groups == _all.groups
+        assert _all.groups[( LOGGER_NAME, "INFO" )] == (
+            75, START + 1, START + 297
+        )
+
+        with pytest.raises(ValueError):
+            _all.merge(Aggregator(group_by=[ "severity" ]))
+
+
+    #
+    # Aggregate in parallel
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    def test_aggregate_parallel(self, workers, logfile):
+        '''
+        Test counting the entries in a log file with worker processes
+
+        Args:
+            workers (int): The number of worker processes
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        _agg = aggregate_parallel(
+            logfile,
+            group_by=[ "severity" ],
+            bucket_width=60,
+            workers=workers,
+            chunk_size=1024
+        )
+
+        _expected = Aggregator(group_by=[ "severity" ], bucket_width=60)
+        assert _agg.groups == _expected.update_lines(LOG_LINES).groups
+
+
+#
+# Histograms
+#
+class Test_Histogram():
+    '''
+    Test Class - Test counting log entries in time bins
+
+    Attributes:
+        None
+    '''
+    #
+    # Count by severity and minute
+    #
+    @pytest.mark.parametrize("encode", [ False, True ])
+    @pytest.mark.parametrize("numpy", [ False, True ])
+    def test_histogram(self, numpy, encode):
+        '''
+        Test the counts are the same as the Aggregator
+
+        Args:
+            numpy (bool): If True, use NumPy
+            encode (bool): If True, the severity column is encoded
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        if numpy: pytest.importorskip("numpy")
+
+        _columns = parse_many(
+            LOG_LINES + [ "Not a log entry" ],
+            columns=[ "severity", "timestamp" ],
+            multiline=False,
+            encode=encode
+        )
+
+        _bins, _counts = histogram(_columns, bin_width=60, numpy=numpy)
+        assert _bins == [ int(START) + _i * 60 for _i in range(5) ]
+
+        _expected = Aggregator(group_by=[ "severity" ], bucket_width=60)
+        _expected.update_lines(LOG_LINES)
+
+        assert set(_counts) == set(SEVERITIES)
+        for _severity, _values in _counts.items():
+            assert _values == [
+                _expected.groups[( _severity, _bin )][0] for _bin in _bins
+            ]
+
+        # All entries counted together
+        _bins, _counts = histogram(
+            _columns,
+            bin_width=3600,
+            group_by=None,
+            numpy=numpy
+        )
+        assert _bins == [ int(START) ]
+        assert _counts == { None: [ len(LOG_LINES) ] }
+
+
+    #
+    # Empty bins
+    #
+    def test_histogram_gaps(self):
+        '''
+        Test bins with no entries are included
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _columns = {
+            "timestamp": [ START + 1.5, None, float("nan"), START + 181 ],
+            "severity": [ "ERROR", "ERROR", "ERROR", "INFO" ]
+        }
+
+        _bins, _counts = histogram(_columns, numpy=False)
+        assert _bins == [ int(START) + _i * 60 for _i in range(4) ]
+        assert _counts == { "ERROR": [ 1, 0, 0, 0 ], "INFO": [ 0, 0, 0, 1 ] }
+
+        assert histogram({ "timestamp": [], "severity": [] }) == ( [], {} )
+
+        with pytest.raises(AssertionError):
+            histogram(_columns, bin_width=0)
+
+        with pytest.raises(KeyError):
+            histogram(_columns, group_by="logger_name")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of binary columnar export
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import gzip
+import math
+import array
+import pytest
+import datetime
+
+# Local app modules
+from applogging.entry import COLUMN_FIELDS, EncodedColumn, parse_many
+from applogging.columnar import ColumnarFile, export_columnar
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+LOG_LINES = [
+    (
+        f"2025-01-01 10:{_count // 60:02d}:{_count % 60:02d},000: "
+        f"[{LOGGER_NAME}] [{SEVERITIES[_count % len(SEVERITIES)]}] "
+        f"{DEFAULT_LOG_STRING} {_count} é"
+    )
+    for _count in range(300)
+]
+START = datetime.datetime(2025, 1, 1, 10, 0, 0).timestamp()
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Columnar files
+#
+class Test_Columnar():
+    '''
+    Test Class - Test exporting and reading columnar files
+
+    Attributes:
+        None
+    '''
+    #
+    # Export and read back
+    #
+    @pytest.mark.parametrize("block_rows", [ 7, 65536 ])
+    def test_columnar(self, block_rows, tmp_path):
+        '''
+        Test the columns read are the same as decoding the log file
+
+        Args:
+            block_rows (int): The maximum number of entries in each block
+            tmp_path (Path): Temporary directory (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _lines = LOG_LINES + [ "Traceback (most recent call last):" ]
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(_lines) + "\n")
+
+        _output = str(tmp_path / "test.col")
+        assert export_columnar(
+            _filename,
+            _output,
+            block_rows=block_rows
+        ) == len(LOG_LINES)
+
+        _expected = parse_many(_lines, columns=COLUMN_FIELDS)
+
+        with ColumnarFile(_output) as _file:
+            assert _file.rows == len(LOG_LINES)
+            assert sum(_block[0] for _block in _file.blocks) == _file.rows
+
+            _columns = _file.read()
+            assert list(_columns) == list(COLUMN_FIELDS)
+            for _column, _values in _columns.items():
+                assert list(_values) == _expected[_column]
+
+            assert isinstance(_columns["timestamp"], array.array)
+            assert isinstance(_columns["process_id"], array.array)
+
+            _columns = _file.read(columns=[ "severity" ], encode=True)
+            assert list(_columns) == [ "severity" ]
+            assert isinstance(_columns["severity"], EncodedColumn)
+            assert _columns["severity"].decode() == _expected["severity"]
+
+            with pytest.raises(AssertionError):
+                _file.read(columns=[ "not a column" ])
+
+            # The numeric columns of a block are views of the mapped file
+            _block = next(_file.iter_blocks(columns=[ "timestamp" ]))
+            assert isinstance(_block["timestamp"], memoryview)
+            assert _block["timestamp"].readonly
+
+        # The file can be closed while the views are still in use
+        _timestamps = _expected["timestamp"][:len(_block["timestamp"])]
+        assert list(_block["timestamp"]) == _timestamps
+
+
+    #
+    # Time range
+    #
+    def test_columnar_time_range(self, tmp_path):
+        '''
+        Test only the entries in a time range are read
+
+        Args:
+            tmp_path (Path): Temporary directory (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        _output = str(tmp_path / "test.col")
+        export_columnar(_filename, _output, block_rows=50)
+
+        with ColumnarFile(_output) as _file:
+            _columns = _file.read(
+                columns=[ "message", "timestamp" ],
+                start=START + 75,
+                end="2025-01-01 10:03:20,000"
+            )
+
+            assert _columns["timestamp"][0] == START + 75
+            assert len(_columns["message"]) == 200 - 75
+            assert _columns["message"][0] == f"{DEFAULT_LOG_STRING} 75 é"
+
+            # Blocks outside the range are skipped
+            assert len(list(_file.iter_blocks(end=START + 75))) == 2
+
+
+    #
+    # Rotation sets
+    #
+    def test_columnar_rotation_set(self, tmp_path):
+        '''
+        Test several log files (including compressed files) are exported
+
+        Args:
+            tmp_path (Path): Temporary directory (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _old = str(tmp_path / "test.log.1.gz")
+        with gzip.open(_old, "wt") as f:
+            f.write("\n".join(LOG_LINES[:100]) + "\n")
+
+        _current = str(tmp_path / "test.log")
+        with open(_current, "w") as f:
+            f.write("\n".join(LOG_LINES[100:]) + "\n")
+
+        _output = str(tmp_path / "test.col")
+        assert export_columnar([ _old, _current ], _output) == len(LOG_LINES)
+
+        with ColumnarFile(_output) as _file:
+            _timestamps = _file.read(columns=[ "timestamp" ])["timestamp"]
+
+        assert list(_timestamps) == [ START + _i for _i in range(300) ]
+        assert not any(math.isnan(_ts) for _ts in _timestamps)
+
+
+    #
+    # Invalid files
+    #
+    def test_columnar_invalid(self, tmp_path):
+        '''
+        Test files which are not columnar files are rejected
+
+        Args:
+            tmp_path (Path): Temporary directory (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        with pytest.raises(ValueError):
+            ColumnarFile(_filename)
+
+        _empty = str(tmp_path / "empty.col")
+        open(_empty, "w").close()
+
+        with pytest.raises(ValueError):
+            ColumnarFile(_empty)
@@ -29,9 +29,29 @@ from tests.constants import *
 
 # System Modules
 import pytest
+import io
+import json
+import datetime
 
 # Local app modules
-from applogging.entry import LogEntry
+from applogging.logging import (
+    init_file_logger,
+    clear_handlers,
+    get_logger,
+    handler_to_json_file
+)
+from applogging.entry import (
+    ENTRY_FIELDS,
+    JSON_FIELDS,
+    EncodedColumn,
+    LogEntry,
+    LogFormat,
+    LogFilter,
+    get_log_format,
+    iter_entries,
+    scan_entries,
+    parse_many
+)
 
 # Imports for python variable type hints
 
@@ -135,3 +155,1217 @@ class Test_LogEntry():
         assert _log_entry.message == DEFAULT_LOG_STRING
         assert _log_entry.severity == DEFAULT_LOG_SEVERITY
         assert _log_entry.logger_name == LOGGER_NAME
+
+
+
+    #
+    # Lazy decoding
+    #
+    @pytest.mark.parametrize("log_entry_dict_key", LOG_ENTRY_DICT)
+    def test_log_entry_lazy(self, log_entry_dict_key):
+        '''
+        Test lazy entries decode the same as other entries
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_info = LOG_ENTRY_DICT[log_entry_dict_key]
+
+        _eager = LogEntry(
+            msg=_log_info["message"],
+            format=_log_info["format"],
+            token_map=_log_info["token_map"]
+        )
+        _lazy = LogEntry(
+            msg=_log_info["message"],
+            format=_log_info["format"],
+            token_map=_log_info["token_map"],
+            lazy=True
+        )
+
+        assert _lazy.severity == DEFAULT_LOG_SEVERITY
+        for _field in ENTRY_FIELDS:
+            assert getattr(_lazy, _field) == getattr(_eager, _field)
+
+        # Message not matching the format
+        _lazy = LogEntry(msg=f" {DEFAULT_LOG_STRING} ", lazy=True)
+        assert _lazy.message == DEFAULT_LOG_STRING
+        assert _lazy.severity == ""
+        assert _lazy.process_id == 0
+
+
+    def test_log_entry_lazy_single_field(self, monkeypatch):
+        '''
+        Test reading one attribute of a lazy entry does not split the log
+        string (only that attribute is decoded)
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = get_log_format()
+        _log_string = (
+            f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] "
+            f"[{DEFAULT_LOG_SEVERITY}] {DEFAULT_LOG_STRING}"
+        )
+        _eager = LogEntry(msg=_log_string, log_format=_log_format)
+
+        _splits = []
+        _match_line = _log_format._match_line
+        def _count(line):
+            _splits.append(line)
+            return _match_line(line)
+
+        monkeypatch.setattr(_log_format, "_match_line", _count)
+
+        _lazy = LogEntry(msg=_log_string, log_format=_log_format, lazy=True)
+        assert _lazy.severity == DEFAULT_LOG_SEVERITY
+        assert _splits == []
+
+        # The log string is split once for the other attributes
+        for _field in ENTRY_FIELDS:
+            assert getattr(_lazy, _field) == getattr(_eager, _field)
+
+        assert _splits == [ _log_string ]
+
+
+    #
+    # Timestamp
+    #
+    def test_log_entry_timestamp(self):
+        '''
+        Test the time is decoded into a timestamp
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_entry = LogEntry(msg=LOG_ENTRY_DICT["DEFAULT"]["message"])
+        _expected = datetime.datetime(2025, 1, 1, 10, 0, 0).timestamp()
+
+        assert _log_entry.timestamp == pytest.approx(_expected)
+        assert LogEntry(msg=DEFAULT_LOG_STRING).timestamp is None
+
+
+    #
+    # Compact entries
+    #
+    def test_log_entry_compact(self):
+        '''
+        Test entries share the log format and intern repeated values
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _message = LOG_ENTRY_DICT["DEFAULT"]["message"]
+
+        _first = LogEntry(msg=_message)
+        _second = LogEntry(msg=f"{_message} ")
+
+        assert not hasattr(_first, "__dict__")
+        assert _first.log_format is _second.log_format
+        assert _first.severity is _second.severity
+        assert _first.logger_name is _second.logger_name
+
+#
+# Compiled log formats
+#
+class Test_LogFormat():
+    '''
+    Test Class - Test compiled log formats
+
+    Attributes:
+        None
+    '''
+    #
+    # Decoding with a compiled format
+    #
+    @pytest.mark.parametrize("log_entry_dict_key", LOG_ENTRY_DICT)
+    def test_log_format(self, log_entry_dict_key):
+        '''
+        Test Log Entry decodes the same way using a compiled log format
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_info = LOG_ENTRY_DICT[log_entry_dict_key]
+
+        _log_format = LogFormat(
+            format=_log_info["format"],
+            token_map=_log_info["token_map"]
+        )
+
+        _log_entry = LogEntry(
+            msg=_log_info["message"],
+            log_format=_log_format
+        )
+
+        assert _log_entry.message == DEFAULT_LOG_STRING
+        assert _log_entry.severity == DEFAULT_LOG_SEVERITY
+        assert _log_entry.logger_name == LOGGER_NAME
+
+
+    #
+    # Caching of compiled formats
+    #
+    def test_log_format_cache(self):
+        '''
+        Test compiled log formats are re-used
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_info = LOG_ENTRY_DICT["TOKEN_CURLY_BRACES"]
+
+        _first = get_log_format(
+            format=_log_info["format"],
+            token_map=_log_info["token_map"]
+        )
+        _second = get_log_format(
+            format=_log_info["format"],
+            token_map=dict(_log_info["token_map"])
+        )
+
+        assert _first is _second
+        assert _first is not get_log_format()
+        assert _first.token_map["name"]["delimiters"] == [ "{", "}" ]
+
+
+    #
+    # Invalid token maps
+    #
+    def test_log_format_invalid(self):
+        '''
+        Test invalid token maps are rejected
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with pytest.raises(AssertionError):
+            get_log_format(token_map={ "name": "not a dict" })
+
+        with pytest.raises(AssertionError):
+            get_log_format(token_map={ "name": { "delimiters": "[]" } })
+
+        with pytest.raises(AssertionError):
+            get_log_format(format="")
+
+
+    #
+    # Split log strings on the delimiters
+    #
+    @pytest.mark.parametrize("format, tokenized", [
+        ( "%(asctime)s: [%(name)s] [%(levelname)s] %(message)s", True ),
+        ( "%(asctime)s: [%(name)s] [%(process)d] [%(threadName)s]", True ),
+        ( "%(asctime)s.x [%(name)s] %(message)s", False ),
+        ( "%(message)s [%(name)s]", False )
+    ])
+    def test_log_format_tokenized(self, format, tokenized):
+        '''
+        Test the results are the same as the regular expression
+
+        Args:
+            format (str): The log format
+            tokenized (bool): True if the format can be split on delimiters
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = LogFormat(format=format)
+        assert _log_format.tokenized == tokenized
+
+        _line = format % {
+            "asctime": "2025-01-01 10:00:00,000",
+            "name": LOGGER_NAME,
+            "levelname": DEFAULT_LOG_SEVERITY,
+            "process": 1234,
+            "threadName": "MainThread",
+            "message": DEFAULT_LOG_STRING
+        }
+        _match = _log_format.pattern.match(_line)
+        if _match:
+            assert _log_format.match(_line).groups() == _match.groups()
+
+        assert _log_format.decode(_line) == _log_format.decode(
+            _line,
+            match=_match
+        )
+
+        assert _log_format.match("Traceback (most recent call last):") is None
+        assert _log_format.match("") is None
+
+
+    #
+    # Delimiters in the message
+    #
+    def test_log_format_delimiters_in_message(self):
+        '''
+        Test delimiters and values repeated in the message are kept
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = LogFormat()
+        _message = "Disk [ERROR]: [sda] [retry]" + " [x]" * 1000
+        _line = (
+            f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] "
+            f"[{DEFAULT_LOG_SEVERITY}] {_message}"
+        )
+
+        _entry = LogEntry(
+            msg=f"{_line}\nTraceback: [ERROR]",
+            log_format=_log_format
+        )
+        assert _entry.time == "2025-01-01 10:00:00,000"
+        assert _entry.logger_name == LOGGER_NAME
+        assert _entry.severity == DEFAULT_LOG_SEVERITY
+        assert _entry.message == f"{_message}\nTraceback: [ERROR]"
+
+
+    #
+    # Generated decoders
+    #
+    def test_log_format_decoder(self):
+        '''
+        Test the generated decoder matches the regular expression
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = LogFormat()
+        assert _log_format.decoder is not None
+
+        # Decoders are shared by formats with the same layout
+        assert LogFormat().decoder is _log_format.decoder
+        assert LogFormat(
+            format="%(asctime)s.x [%(name)s] %(message)s"
+        ).decoder is None
+
+        _line = (
+            f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] "
+            f"[{DEFAULT_LOG_SEVERITY}] {DEFAULT_LOG_STRING}\nTraceback:"
+        )
+        assert _log_format.decoder(_line) == _log_format.decode(
+            _line,
+            match=_log_format.pattern.match(_line)
+        )
+
+        assert _log_format.decoder("Traceback: [ERROR]") is None
+        assert _log_format.decoder("2025-01-01 10:00:00,000: [x]") is None
+
+
+    #
+    # Numeric tokens
+    #
+    @pytest.mark.parametrize("regex", [ False, True ])
+    def test_log_format_numeric(self, regex):
+        '''
+        Test numeric tokens are converted to numbers
+
+        Args:
+            regex (bool): If True, decode using the regular expression
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = LogFormat(
+            format="%(asctime)s: [%(process)d] [%(thread)d] %(message)s"
+        )
+        _process = ENTRY_FIELDS.index("process_id")
+        _thread = ENTRY_FIELDS.index("thread_id")
+
+        def _decode(line, convert=True):
+            _match = _log_format.pattern.match(line) if regex else None
+            return _log_format.decode(line, match=_match, convert=convert)
+
+        _line = (
+            "2025-01-01 10:00:00,000: [1234] [140000000000001] "
+            f"{DEFAULT_LOG_STRING}"
+        )
+        _values = _decode(_line)
+        assert _values[_process] == 1234
+        assert _values[_thread] == 140000000000001
+
+        _raw = _decode(_line, convert=False)
+        assert _raw[_process] == "1234"
+        assert _log_format.convert_column(_process, [ "1", "x" ]) == [ 1, "x" ]
+        assert _log_format.convert_column(0, [ "1" ]) == [ "1" ]
+
+        # Values which aren't numbers are left as they are
+        assert _decode(_line.replace("1234", "main"))[_process] == "main"
+
+        # The values found when checking for the start of an entry are
+        # used, unless continuation lines were joined to the entry
+        _match = _log_format._match_line(_line)
+        assert _log_format.decode(_line, match=_match) == _values
+        assert _log_format.decode(_line, match=_match, convert=False) == _raw
+
+        _values = _log_format.decode(f"{_line}\nTraceback:", match=_match)
+        assert _values[_process] == 1234
+        assert _values[-1] == f"{DEFAULT_LOG_STRING}\nTraceback:"
+
+
+#
+# Streaming log files
+#
+class Test_IterEntries():
+    '''
+    Test Class - Test streaming of log files
+
+    Attributes:
+        None
+    '''
+    #
+    # Read a log file in blocks
+    #
+    @pytest.mark.parametrize("buffer_size", [ 7, 64, 1024 * 1024 ])
+    def test_iter_entries(self, buffer_size, logfile):
+        '''
+        Test all entries are decoded, regardless of the block size
+
+        Args:
+            buffer_size (int): The size of the blocks to read
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _message = LOG_ENTRY_DICT["DEFAULT"]["message"]
+
+        # The last line has no line ending
+        with open(logfile, "w") as f:
+            f.write("\n".join([ _message ] * 25) + "\n\n" + _message)
+
+        _entries = list(iter_entries(logfile, buffer_size=buffer_size))
+
+        assert len(_entries) == 26
+        for _log_entry in _entries:
+            assert _log_entry.message == DEFAULT_LOG_STRING
+            assert _log_entry.severity == DEFAULT_LOG_SEVERITY
+            assert _log_entry.logger_name == LOGGER_NAME
+
+
+    #
+    # Read from a file object
+    #
+    @pytest.mark.parametrize("log_entry_dict_key", LOG_ENTRY_DICT)
+    def test_iter_entries_fileobj(self, log_entry_dict_key):
+        '''
+        Test entries are decoded from text and binary file objects
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_info = LOG_ENTRY_DICT[log_entry_dict_key]
+        _contents = f"{_log_info['message']}\n" * 3
+
+        for _fileobj in [
+                io.StringIO(_contents),
+                io.BytesIO(_contents.encode())
+        ]:
+            _entries = list(iter_entries(
+                _fileobj,
+                format=_log_info["format"],
+                token_map=_log_info["token_map"]
+            ))
+
+            assert len(_entries) == 3
+            for _log_entry in _entries:
+                assert _log_entry.message == DEFAULT_LOG_STRING
+                assert _log_entry.severity == DEFAULT_LOG_SEVERITY
+                assert _log_entry.logger_name == LOGGER_NAME
+
+
+
+    #
+    # Entries spanning multiple lines
+    #
+    @pytest.mark.parametrize("lazy", [ True, False ])
+    @pytest.mark.parametrize("multiline", [ True, False ])
+    def test_iter_entries_multiline(self, multiline, lazy, logfile):
+        '''
+        Test tracebacks are joined to the entry that logged them
+
+        Args:
+            multiline (bool): Join continuation lines to the entry
+            lazy (bool): Decode the entries when first accessed
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log = init_file_logger(name=LOGGER_NAME, filename=logfile)
+        _log.setLevel(level="DEBUG")
+
+        _log.info(DEFAULT_LOG_STRING)
+        try:
+            raise ValueError("Multiline test")
+        except ValueError:
+            _log.exception(DEFAULT_LOG_STRING)
+        _log.error(DEFAULT_LOG_STRING)
+
+        clear_handlers(_log)
+
+        _entries = list(iter_entries(
+            logfile,
+            multiline=multiline,
+            lazy=lazy
+        ))
+
+        if not multiline:
+            assert len(_entries) > 3
+            return
+
+        assert [ _e.severity for _e in _entries ] == [
+            "INFO", "ERROR", "ERROR"
+        ]
+        assert _entries[0].message == DEFAULT_LOG_STRING
+        assert _entries[1].message.startswith(f"{DEFAULT_LOG_STRING}\n")
+        assert "Traceback" in _entries[1].message
+        assert _entries[1].message.endswith("ValueError: Multiline test")
+        assert _entries[2].message == DEFAULT_LOG_STRING
+
+
+    @pytest.mark.parametrize("multiline", [ True, False ])
+    def test_iter_entries_mixed(self, multiline, logfile):
+        '''
+        Test entries read without a filter decode the same as lazy entries,
+        for lines not part of an entry, continuation and JSON lines
+
+        Args:
+            multiline (bool): Join continuation lines to the entry
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _entry = (
+            f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] "
+            f"[{DEFAULT_LOG_SEVERITY}] {DEFAULT_LOG_STRING}"
+        )
+        _json = json.dumps({
+            "time": "2025-01-01 10:00:01,000",
+            "logger_name": LOGGER_NAME,
+            "severity": "ERROR",
+            "message": DEFAULT_LOG_STRING
+        })
+        with open(logfile, "w") as f:
+            f.write("\n".join([
+                "Started", "", _entry, "Traceback:", "", "  line 1",
+                _json, "  after json", _entry, _entry, "  more", ""
+            ]))
+
+        _eager = list(iter_entries(logfile, multiline=multiline))
+        _lazy = list(iter_entries(logfile, multiline=multiline, lazy=True))
+
+        assert len(_eager) == (5 if multiline else 9)
+        assert len(_eager) == len(_lazy)
+        for _first, _second in zip(_eager, _lazy):
+            for _field in ENTRY_FIELDS:
+                assert getattr(_first, _field) == getattr(_second, _field)
+
+        if multiline:
+            assert _eager[1].message == (
+                f"{DEFAULT_LOG_STRING}\nTraceback:\n\n  line 1"
+            )
+            assert _eager[2].severity == "ERROR"
+            assert _eager[4].message == f"{DEFAULT_LOG_STRING}\n  more"
+
+
+#
+# Filtering entries
+#
+class Test_LogFilter():
+    '''
+    Test Class - Filtering log entries before they are decoded
+
+    Attributes:
+        None
+    '''
+    #
+    # Filter on the raw bytes
+    #
+    def test_log_filter(self):
+        '''
+        Test the checks on the raw bytes of a log string
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filter = LogFilter(severities=[ "ERROR" ], contains="disk")
+
+        _line = (
+            f"2025-01-01 10:00:00,000 [{LOGGER_NAME}] [ERROR] "
+            f"(app.py:1) disk full"
+        ).encode()
+
+        assert _filter.severities == frozenset([ "ERROR" ])
+        assert _filter.accept_line(_line)
+        assert _filter.accept_bytes(_line)
+        assert not _filter.accept_line(_line.replace(b"[ERROR]", b"[INFO]"))
+        assert not _filter.accept_bytes(_line.replace(b"disk", b"file"))
+
+        # A severity in the message is not mistaken for the severity
+        assert not _filter.accept_line(
+            _line.replace(b"[ERROR]", b"[INFO]") + b" ERROR"
+        )
+
+        with pytest.raises(AssertionError):
+            LogFilter(severities="ERROR")
+
+
+    #
+    # Filter the entries in a log file
+    #
+    @pytest.mark.parametrize("lazy", [ True, False ])
+    @pytest.mark.parametrize("multiline", [ True, False ])
+    def test_iter_entries_filter(self, multiline, lazy, logfile):
+        '''
+        Test filtering the entries in a log file
+
+        Args:
+            multiline (bool): Join continuation lines to the entry
+            lazy (bool): Decode the entries when first accessed
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log = init_file_logger(name=LOGGER_NAME, filename=logfile)
+        _log.setLevel(level="DEBUG")
+
+        _log.info("ERROR in the message")
+        try:
+            raise ValueError("Filter test")
+        except ValueError:
+            _log.exception(DEFAULT_LOG_STRING)
+        _log.warning(DEFAULT_LOG_STRING)
+        _log.error("Second error")
+
+        clear_handlers(_log)
+
+        _entries = list(iter_entries(
+            logfile,
+            multiline=multiline,
+            lazy=lazy,
+            severities=[ "ERROR" ]
+        ))
+
+        if multiline:
+            assert _entries[1].message == "Second error"
+            assert "Traceback" in _entries[0].message
+        else:
+            assert _entries[-1].message == "Second error"
+
+        assert all(_e.severity == "ERROR" for _e in _entries)
+
+        # Search the continuation lines
+        _entries = list(iter_entries(
+            logfile,
+            multiline=multiline,
+            lazy=lazy,
+            contains="Filter test"
+        ))
+        if multiline:
+            assert len(_entries) == 1
+            assert _entries[0].message.startswith(DEFAULT_LOG_STRING)
+        else:
+            assert all("Filter test" in _e.message for _e in _entries)
+
+        # The same results for a text file object
+        with open(logfile, "r", encoding="utf-8") as _file:
+            _text = list(iter_entries(
+                _file,
+                multiline=multiline,
+                severities=[ "WARNING", "INFO" ],
+                logger_names=[ LOGGER_NAME ]
+            ))
+
+        with open(logfile, "rb") as _file:
+            _binary = list(iter_entries(
+                _file,
+                multiline=multiline,
+                severities=[ "WARNING", "INFO" ],
+                logger_names=[ LOGGER_NAME ]
+            ))
+
+        assert [ _e.severity for _e in _text ] == [ "INFO", "WARNING" ]
+        assert [ _e.message for _e in _text ] == [
+            _e.message for _e in _binary
+        ]
+
+        assert not list(iter_entries(logfile, logger_names=[ "Other" ]))
+
+#
+# Memory mapped log files
+#
+class Test_ScanEntries():
+    '''
+    Test Class - Test searching memory mapped log files
+
+    Attributes:
+        None
+    '''
+    #
+    # Search a log file
+    #
+    def test_scan_entries(self, logfile):
+        '''
+        Test only matching lines are decoded
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _lines = [
+            (
+                f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] "
+                f"[{_severity}] {DEFAULT_LOG_STRING}"
+            )
+            for _severity in [ "INFO", "ERROR", "DEBUG", "ERROR" ]
+        ]
+        _lines.insert(2, "Not a log entry [ERROR]")
+
+        with open(logfile, "w") as f:
+            f.write("\n".join(_lines))
+
+        _entries = list(scan_entries(logfile, search=rb"\[ERROR\]"))
+
+        assert len(_entries) == 2
+        for _log_entry in _entries:
+            assert _log_entry.message == DEFAULT_LOG_STRING
+            assert _log_entry.severity == "ERROR"
+            assert _log_entry.logger_name == LOGGER_NAME
+
+        # Without a search, all entries matching the format are returned
+        _entries = list(scan_entries(logfile))
+        assert [ _e.severity for _e in _entries ] == [
+            "INFO", "ERROR", "DEBUG", "ERROR"
+        ]
+
+        # A predicate on the raw bytes of each line
+        _entries = list(scan_entries(
+            logfile,
+            predicate=LogFilter(severities=[ "ERROR", "DEBUG" ]).accept_line
+        ))
+        assert [ _e.severity for _e in _entries ] == [
+            "ERROR", "DEBUG", "ERROR"
+        ]
+
+        # Both must accept the line
+        assert len(list(scan_entries(
+            logfile,
+            search=rb"\[ERROR\]",
+            predicate=lambda line: line.endswith(b"string")
+        ))) == 2
+        assert not list(scan_entries(
+            logfile,
+            search=rb"\[ERROR\]",
+            predicate=lambda line: b"[INFO]" in line
+        ))
+
+        with pytest.raises(AssertionError):
+            next(scan_entries(logfile, predicate=b"ERROR"))
+
+
+    #
+    # Empty log file
+    #
+    def test_scan_entries_empty(self, logfile):
+        '''
+        Test an empty log file returns no entries
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        open(logfile, "w").close()
+
+        assert list(scan_entries(logfile, search="ERROR")) == []
+
+#
+# Column mode
+#
+class Test_ParseMany():
+    '''
+    Test Class - Test decoding log strings into columns
+
+    Attributes:
+        None
+    '''
+    #
+    # Decode into columns
+    #
+    @pytest.mark.parametrize("log_entry_dict_key", LOG_ENTRY_DICT)
+    def test_parse_many(self, log_entry_dict_key):
+        '''
+        Test log strings are decoded into columns
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_info = LOG_ENTRY_DICT[log_entry_dict_key]
+
+        _columns = parse_many(
+            [ _log_info["message"], "", _log_info["message"] ],
+            format=_log_info["format"],
+            token_map=_log_info["token_map"],
+            columns=[ "severity", "logger_name", "message" ]
+        )
+
+        assert list(_columns) == [ "severity", "logger_name", "message" ]
+        assert _columns["severity"] == [ DEFAULT_LOG_SEVERITY ] * 2
+        assert _columns["logger_name"] == [ LOGGER_NAME ] * 2
+        assert _columns["message"] == [ DEFAULT_LOG_STRING ] * 2
+
+
+    #
+    # Timestamp column
+    #
+    def test_parse_many_timestamp(self):
+        '''
+        Test the timestamp column is decoded from the time
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _columns = parse_many(
+            [ LOG_ENTRY_DICT["DEFAULT"]["message"], DEFAULT_LOG_STRING ],
+            columns=[ "time", "timestamp" ],
+            multiline=False
+        )
+
+        _expected = datetime.datetime(2025, 1, 1, 10, 0, 0).timestamp()
+
+        assert _columns["time"] == [ "2025-01-01 10:00:00,000", "" ]
+        assert _columns["timestamp"] == [ pytest.approx(_expected), None ]
+
+
+    #
+    # Numeric columns
+    #
+    def test_parse_many_numeric(self):
+        '''
+        Test numeric columns are converted to numbers
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _format = "%(asctime)s: [%(process)d] [%(threadName)s] %(message)s"
+        _columns = parse_many(
+            [
+                f"2025-01-01 10:00:00,000: [1234] [Main] {DEFAULT_LOG_STRING}",
+                f"2025-01-01 10:00:00,000: [?] [Main] {DEFAULT_LOG_STRING}",
+                DEFAULT_LOG_STRING
+            ],
+            format=_format,
+            columns=[ "process_id", "thread_name" ],
+            multiline=False
+        )
+
+        assert _columns["process_id"] == [ 1234, "?", 0 ]
+        assert _columns["thread_name"] == [ "Main", "Main", "" ]
+
+
+    #
+    # Dictionary encoded columns
+    #
+    def test_parse_many_encode(self):
+        '''
+        Test columns with few distinct values are dictionary encoded
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _lines = [
+            f"2025-01-01 10:00:00,000: [{LOGGER_NAME}] [{_severity}] {_count}"
+            for _count, _severity in enumerate([ "INFO", "ERROR" ] * 50)
+        ]
+        _columns = parse_many(
+            _lines,
+            columns=[ "severity", "message" ],
+            encode=True
+        )
+
+        _severity = _columns["severity"]
+        assert isinstance(_severity, EncodedColumn)
+        assert _columns["message"] == [ str(_i) for _i in range(100) ]
+
+        assert len(_severity) == 100
+        assert _severity.values == ( "INFO", "ERROR" )
+        assert _severity.codes.itemsize == 1
+        assert _severity.decode() == [ "INFO", "ERROR" ] * 50
+        assert _severity[1] == "ERROR"
+
+        _code = _severity.code("ERROR")
+        assert _code == 1
+        assert _severity.code("DEBUG") is None
+        assert sum(_c == _code for _c in _severity.codes) == 50
+
+        # Larger arrays are used when there are more values
+        assert EncodedColumn(range(300)).codes.itemsize == 2
+        assert EncodedColumn().decode() == []
+
+
+    #
+    # No lines
+    #
+    def test_parse_many_empty(self):
+        '''
+        Test empty columns are returned when there are no lines
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _columns = parse_many([])
+
+        assert all(_values == [] for _values in _columns.values())
+        assert parse_many([], columns=[ "timestamp" ]) == { "timestamp": [] }
+
+        with pytest.raises(AssertionError):
+            parse_many([], columns=[ "not a column" ])
+
+
+    #
+    # NumPy arrays
+    #
+    def test_parse_many_numpy(self):
+        '''
+        Test NumPy arrays are returned when requested
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _np = pytest.importorskip("numpy")
+
+        _columns = parse_many(
+            [ LOG_ENTRY_DICT["DEFAULT"]["message"] ] * 3,
+            numpy=True
+        )
+
+        assert isinstance(_columns["severity"], _np.ndarray)
+        assert (_columns["severity"] == DEFAULT_LOG_SEVERITY).all()
+
+        _columns = parse_many(
+            [ LOG_ENTRY_DICT["DEFAULT"]["message"] ] * 3,
+            numpy=True,
+            encode=True
+        )
+
+        _severity = _columns["severity"]
+        assert isinstance(_severity.codes, _np.ndarray)
+        assert (_severity.codes == _severity.code(DEFAULT_LOG_SEVERITY)).all()
+
+
+#
+# JSON lines
+#
+class Test_JsonLines():
+    '''
+    Test Class - Writing and decoding JSON lines
+
+    Attributes:
+        None
+    '''
+    #
+    # Log to a JSON lines file
+    #
+    @pytest.mark.parametrize("lazy", [ True, False ])
+    def test_json_file(self, lazy, logfile):
+        '''
+        Test the entries logged as JSON lines are decoded
+
+        Args:
+            lazy (bool): Decode the entries when first accessed
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log = get_logger(name=LOGGER_NAME)
+        clear_handlers(_log)
+
+        _handler = handler_to_json_file(filename=logfile)
+        _log.addHandler(_handler)
+        _log.setLevel(level="DEBUG")
+
+        _log.info(DEFAULT_LOG_STRING)
+        _log.error("A \"quoted\" message é")
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            _log.exception(DEFAULT_LOG_STRING)
+
+        clear_handlers(_log)
+        _handler.close()
+
+        with open(logfile, "r") as f:
+            _lines = f.read().splitlines()
+
+        # One line per entry, with the keys in order
+        assert len(_lines) == 3
+        assert all(tuple(json.loads(_line)) == JSON_FIELDS for _line in _lines)
+
+        _entries = list(iter_entries(logfile, lazy=lazy))
+        assert len(_entries) == 3
+
+        assert _entries[0].message == DEFAULT_LOG_STRING
+        assert _entries[0].severity == "INFO"
+        assert _entries[0].logger_name == LOGGER_NAME
+        assert _entries[0].process_id == json.loads(_lines[0])["process_id"]
+        assert _entries[0].thread_name == "MainThread"
+        assert _entries[0].source.startswith("test_entry.py:")
+        assert _entries[0].timestamp == pytest.approx(
+            json.loads(_lines[0])["timestamp"],
+            abs=0.001
+        )
+
+        assert _entries[1].message == "A \"quoted\" message é"
+        assert _entries[2].message.startswith(
+            f"{DEFAULT_LOG_STRING}\nTraceback (most recent call last):"
+        )
+        assert _entries[2].message.endswith("ValueError: bad value")
+
+        # Filters are checked against the JSON line
+        assert [
+            _entry.message
+            for _entry in iter_entries(
+                logfile,
+                severities=[ "ERROR" ],
+                contains="\"quoted\"",
+                lazy=lazy
+            )
+        ] == [ "A \"quoted\" message é" ]
+
+        assert len(list(iter_entries(
+            logfile,
+            logger_names=[ LOGGER_NAME ],
+            contains="Traceback"
+        ))) == 1
+
+        # Columns
+        _columns = parse_many(_lines, columns=[ "severity", "process_id" ])
+        assert _columns["severity"] == [ "INFO", "ERROR", "ERROR" ]
+        assert _columns["process_id"] == [ _entries[0].process_id ] * 3
+
+
+    #
+    # Decode JSON lines
+    #
+    @pytest.mark.parametrize("format", [
+        "%(asctime)s: [%(name)s] [%(levelname)s] %(message)s",
+        "%(asctime)s.x [%(name)s] [%(levelname)s] %(message)s"
+    ])
+    def test_json_decode(self, format):
+        '''
+        Test JSON lines are decoded, whatever the format
+
+        Args:
+            format (str): The format of the other log strings
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _log_format = get_log_format(format=format)
+
+        _values = {
+            "time": "2025-01-01 10:00:00,000",
+            "logger_name": LOGGER_NAME,
+            "severity": DEFAULT_LOG_SEVERITY,
+            "source": "app.py:1",
+            "process_id": 100,
+            "process_name": "MainProcess",
+            "thread_id": 200,
+            "thread_name": "MainThread",
+            "message": f"{DEFAULT_LOG_STRING} é",
+            "timestamp": 1735725600.0
+        }
+        _expected = tuple(_values[_field] for _field in ENTRY_FIELDS)
+
+        # Split on the keys, and with json.loads (for escaped characters)
+        for _ascii in ( False, True ):
+            _line = json.dumps(_values, ensure_ascii=_ascii)
+
+            assert _log_format.match(_line)
+            assert _log_format.decode(_line) == _expected
+            assert _log_format.decode(
+                _line,
+                match=_log_format.match(_line)
+            ) == _expected
+            assert _log_format.bytes_pattern.match(_line.encode())
+
+            _entry = LogEntry(msg=_line, log_format=_log_format, lazy=True)
+            assert _entry.severity == DEFAULT_LOG_SEVERITY
+            assert _entry.thread_id == 200
+            assert _entry.message == f"{DEFAULT_LOG_STRING} é"
+
+        # Missing keys are the defaults
+        _line = json.dumps({ "time": _values["time"], "message": "text" })
+        assert _log_format.decode(_line) == (
+            _values["time"], "", "", "", 0, "", 0, "", "text"
+        )
+
+        # Not JSON
+        _line = '{"time": is not JSON'
+        assert LogEntry(msg=_line, log_format=_log_format).message == _line
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of following log files
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+import os
+import logging
+import threading
+
+# Local app modules
+from applogging.logging import handler_to_timed_rotating_file
+from applogging.follow import follow_entries, _FileWatcher
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+TIMEOUT = 0.5
+FLUSH_INTERVAL = 0.1
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# log_line
+#
+def log_line(count: int = 0, severity: str = DEFAULT_LOG_SEVERITY) -> str:
+    '''
+    Create a log line
+
+    Args:
+        count (int): The number of the line
+        severity (str): The severity of the line
+
+    Returns:
+        str: The line (with a line ending)
+
+    Raises:
+        None
+    '''
+    return (
+        f"2025-01-01 10:00:{count:02d},000: [{LOGGER_NAME}] [{severity}] "
+        f"{DEFAULT_LOG_STRING} {count}\n"
+    )
+
+
+###########################################################################
+#
+# Test Classes
+#
+###########################################################################
+#
+# Following log files
+#
+class Test_Follow():
+    '''
+    Test Class - Following log files as they are written
+
+    Attributes:
+        None
+    '''
+    #
+    # Follow appended entries
+    #
+    @pytest.mark.parametrize("inotify", [ True, False ])
+    def test_follow_entries(self, inotify, logfile):
+        '''
+        Test new entries are returned as they are appended
+
+        Args:
+            inotify (bool): Use inotify to wait for changes
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write(log_line(0) + log_line(1))
+
+        _follow = follow_entries(
+            logfile,
+            timeout=TIMEOUT,
+            poll_interval=0.01,
+            inotify=inotify,
+            flush_interval=FLUSH_INTERVAL
+        )
+
+        with open(logfile, "a") as f:
+            f.write(log_line(2) + "Traceback:\n  Line 1\n" + log_line(3))
+
+        _entry = next(_follow)
+        assert _entry.message == (
+            f"{DEFAULT_LOG_STRING} 2\nTraceback:\n  Line 1"
+        )
+        assert _entry.severity == DEFAULT_LOG_SEVERITY
+
+        # A partial line is held until it is complete (the last entry is
+        # returned once the file is idle)
+        with open(logfile, "a") as f:
+            f.write(log_line(4)[:20])
+
+        assert next(_follow).message == f"{DEFAULT_LOG_STRING} 3"
+
+        with open(logfile, "a") as f:
+            f.write(log_line(4)[20:])
+
+        _messages = [ _e.message for _e in _follow ]
+        assert _messages == [ f"{DEFAULT_LOG_STRING} 4" ]
+
+        # Read from the start of the file
+        _entries = list(follow_entries(
+            logfile,
+            from_start=True,
+            timeout=0.1,
+            inotify=inotify,
+            flush_interval=FLUSH_INTERVAL
+        ))
+        assert len(_entries) == 5
+
+
+    #
+    # Continuation lines written separately
+    #
+    def test_follow_held_entry(self, logfile):
+        '''
+        Test the last entry is held until its continuation lines are written
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write(log_line(0))
+
+        _follow = follow_entries(
+            logfile,
+            from_start=True,
+            timeout=TIMEOUT,
+            poll_interval=0.01,
+            flush_interval=TIMEOUT
+        )
+
+        with open(logfile, "a") as f:
+            f.write(log_line(1))
+
+        assert next(_follow).message == f"{DEFAULT_LOG_STRING} 0"
+
+        # The end of the file is reached before the traceback is written
+        def _write_traceback():
+            with open(logfile, "a") as f:
+                f.write("Traceback:\n  Line 1\n")
+
+        _writer = threading.Timer(FLUSH_INTERVAL, _write_traceback)
+        _writer.start()
+        _messages = [ _e.message for _e in _follow ]
+        _writer.join()
+
+        assert _messages == [
+            f"{DEFAULT_LOG_STRING} 1\nTraceback:\n  Line 1"
+        ]
+
+
+    #
+    # Nothing opened until iterated
+    #
+    @pytest.mark.skipif(
+        not os.path.isdir("/proc/self/fd"),
+        reason="Requires /proc/self/fd"
+    )
+    def test_follow_not_iterated(self, logfile):
+        '''
+        Test no files are left open if the generator is never used
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write(log_line(0))
+
+        _open = len(os.listdir("/proc/self/fd"))
+        _follow = follow_entries(
+            logfile,
+            timeout=TIMEOUT,
+            flush_interval=FLUSH_INTERVAL
+        )
+        assert len(os.listdir("/proc/self/fd")) == _open
+
+        # Starts from the end of the file as it was when called
+        with open(logfile, "a") as f:
+            f.write(log_line(1))
+
+        assert [ _e.message for _e in _follow ] == [
+            f"{DEFAULT_LOG_STRING} 1"
+        ]
+        assert len(os.listdir("/proc/self/fd")) == _open
+
+
+    #
+    # Follow through a rotation
+    #
+    def test_follow_rotation(self, tmp_path):
+        '''
+        Test following a file rotated by the timed rotating file handler
+
+        Args:
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log")
+        _handler = handler_to_timed_rotating_file(filename=_filename)
+        _log = logging.getLogger(f"{LOGGER_NAME}.follow")
+        _log.propagate = False
+        _log.setLevel(level="DEBUG")
+        _log.addHandler(_handler)
+
+        try:
+            _log.info("1")
+            _follow = follow_entries(
+                _filename,
+                from_start=True,
+                timeout=TIMEOUT,
+                flush_interval=FLUSH_INTERVAL
+            )
+            assert next(_follow).message == "1"
+
+            # Entries written just before the rotation must not be lost
+            _log.info("2")
+            _handler.doRollover()
+            _log.info("3")
+
+            assert [ _e.message for _e in _follow ] == [ "2", "3" ]
+            assert len(os.listdir(tmp_path)) == 2
+
+        finally:
+            _log.removeHandler(_handler)
+            _handler.close()
+
+
+    #
+    # Follow through a truncation
+    #
+    def test_follow_truncate(self, logfile):
+        '''
+        Test following a file which is truncated
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            f.write(log_line(0) + log_line(1))
+
+        _follow = follow_entries(
+            logfile,
+            from_start=True,
+            timeout=TIMEOUT,
+            flush_interval=FLUSH_INTERVAL
+        )
+        assert len([ next(_follow), next(_follow) ]) == 2
+
+        with open(logfile, "w") as f:
+            f.write(log_line(5))
+
+        _messages = [ _e.message for _e in _follow ]
+        assert _messages == [ f"{DEFAULT_LOG_STRING} 5" ]
+
+
+    #
+    # Waiting for changes
+    #
+    def test_file_watcher(self, logfile):
+        '''
+        Test the polling interval backs off while the file is idle
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _watcher = _FileWatcher(
+            logfile,
+            poll_interval=0.001,
+            max_poll_interval=0.004,
+            inotify=False
+        )
+        assert not _watcher.uses_inotify
+
+        _watcher.wait()
+        _watcher.wait()
+        _watcher.wait()
+        assert _watcher._interval == 0.004
+
+        _watcher.reset()
+        assert _watcher._interval == 0.001
+        _watcher.close()
+
+
+    #
+    # Only events for the file end a wait
+    #
+    def test_file_watcher_events(self, tmp_path):
+        '''
+        Test changes to other files in the directory are ignored
+
+        Args:
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log")
+        _watcher = _FileWatcher(_filename)
+        if not _watcher.uses_inotify: pytest.skip("inotify not available")
+
+        try:
+            ( tmp_path / "other.log" ).write_text("other\n")
+            ( tmp_path / "app.logger" ).write_text("other\n")
+            assert not _watcher._read_events()
+
+            ( tmp_path / "app.log" ).write_text(log_line(0))
+            assert _watcher._read_events()
+
+            # A file rotated from the followed file
+            os.rename(_filename, f"{_filename}.1")
+            assert _watcher._read_events()
+
+        finally:
+            _watcher.close()
+
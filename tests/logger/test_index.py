@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of log file indexes
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+import os
+
+# Local app modules
+from applogging.index import LogIndex, INDEX_SUFFIX
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+LOGGER_NAMES = [ LOGGER_NAME, "Other" ]
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# log_lines
+#
+def log_lines(first: int = 0, last: int = 600) -> list:
+    '''
+    Create log lines, one per second, each followed by a traceback
+
+    Args:
+        first (int): The number of the first line
+        last (int): The number of the line after the last line
+
+    Returns:
+        list: The lines
+
+    Raises:
+        None
+    '''
+    _lines = []
+    for _count in range(first, last):
+        _lines.append(
+            f"2025-01-01 10:{_count // 60:02d}:{_count % 60:02d},000: "
+            f"[{LOGGER_NAMES[(_count // 100) % 2]}] "
+            f"[{SEVERITIES[_count % len(SEVERITIES)]}] "
+            f"{DEFAULT_LOG_STRING} {_count}"
+        )
+
+        if _count % 10 == 3: _lines.extend([ "Traceback:", "  Line 1" ])
+
+    return _lines
+
+
+#
+# message_numbers
+#
+def message_numbers(entries: list) -> list:
+    '''
+    Get the message number from each entry
+
+    Args:
+        entries (list): The log entries
+
+    Returns:
+        list: The number of each message
+
+    Raises:
+        None
+    '''
+    return [ int(_e.message.split("\n")[0].split()[-1]) for _e in entries ]
+
+
+###########################################################################
+#
+# Fixtures
+#
+###########################################################################
+#
+# indexfile
+#
+@pytest.fixture(scope="function")
+def indexfile(request: pytest.FixtureRequest, logfile) -> str:
+    '''
+    Make sure the index file is deleted at the end of the test
+
+    Args:
+        logfile (str): Fixture managing the log file used during testing
+
+    Returns:
+        str: The path for the log file
+
+    Raises:
+        None
+    '''
+    def _delete_file():
+        if os.path.exists(f"{logfile}{INDEX_SUFFIX}"):
+            os.remove(f"{logfile}{INDEX_SUFFIX}")
+
+    _delete_file()
+    request.addfinalizer(_delete_file)
+
+    return logfile
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Log Index
+#
+class Test_LogIndex():
+    '''
+    Test Class - Test the sidecar index for log files
+
+    Attributes:
+        None
+    '''
+    #
+    # Queries
+    #
+    def test_log_index(self, indexfile):
+        '''
+        Test the index finds the matching entries
+
+        Args:
+            indexfile (str): Fixture managing the log and index files
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(indexfile, "w") as f:
+            f.write("\n".join(log_lines()) + "\n")
+
+        _index = LogIndex(indexfile)
+        assert _index.update()
+        assert os.path.exists(_index.index_filename)
+        assert len(_index.buckets) == 10
+        assert _index.size == os.path.getsize(indexfile)
+
+        # Severity
+        _entries = list(_index.iter_entries(severities=[ "ERROR" ]))
+        assert message_numbers(_entries) == list(range(3, 600, 4))
+        assert _entries[0].message.endswith("Traceback:\n  Line 1")
+
+        # Time and logger
+        _entries = list(_index.iter_entries(
+            start="2025-01-01 10:01:30,000",
+            end="2025-01-01 10:02:10,000",
+            logger_names=[ "Other" ]
+        ))
+        assert message_numbers(_entries) == list(range(100, 130))
+
+        # Only the buckets needed are read
+        _ranges = _index.ranges(
+            start="2025-01-01 10:01:30,000",
+            end="2025-01-01 10:02:10,000"
+        )
+        assert len(_ranges) == 1
+        assert _ranges[0][0] == _index.buckets[1][1]
+        assert _ranges[0][1] == _index.buckets[2][2]
+
+
+    #
+    # Incremental updates
+    #
+    def test_log_index_update(self, indexfile):
+        '''
+        Test the index is updated as the log file grows, and rebuilt when
+        the log file is replaced
+
+        Args:
+            indexfile (str): Fixture managing the log and index files
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(indexfile, "w") as f:
+            f.write("\n".join(log_lines(last=90)) + "\n")
+
+        LogIndex(indexfile).update()
+
+        # Loaded from the index file
+        _index = LogIndex(indexfile)
+        assert len(_index.buckets) == 2
+        assert not _index.update()
+
+        # Append to the log file
+        with open(indexfile, "a") as f:
+            f.write("\n".join(log_lines(first=90, last=150)) + "\n")
+
+        assert _index.update()
+        assert len(_index.buckets) == 3
+        assert _index.buckets[1][3] == 60
+        assert message_numbers(_index.iter_entries()) == list(range(150))
+
+        # Replace the log file
+        os.remove(indexfile)
+        with open(indexfile, "w") as f:
+            f.write("\n".join(log_lines(first=300, last=320)) + "\n")
+
+        _index = LogIndex(indexfile)
+        assert message_numbers(_index.iter_entries()) == list(range(300, 320))
+        assert len(_index.buckets) == 1
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of the command line query tool
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import os
+import gzip
+import json
+import pytest
+
+# Local app modules
+from applogging.query import main, _auto_workers
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+SEVERITIES = [ "DEBUG", "INFO", "WARNING", "ERROR" ]
+LOGGER_NAMES = [ LOGGER_NAME, "Other" ]
+LOG_LINES = [
+    (
+        f"2025-01-01 10:{_count // 60:02d}:{_count % 60:02d},000: "
+        f"[{LOGGER_NAMES[_count % 2]}] "
+        f"[{SEVERITIES[_count % len(SEVERITIES)]}] "
+        f"{DEFAULT_LOG_STRING} {_count}"
+    )
+    for _count in range(300)
+]
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Command line tool
+#
+class Test_Query():
+    '''
+    Test Class - Test the command line query tool
+
+    Attributes:
+        None
+    '''
+    #
+    # Filters
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    @pytest.mark.parametrize("args, expected", [
+        ([], LOG_LINES),
+        ([ "-s", "ERROR" ], LOG_LINES[3::4]),
+        ([ "-s", "error", "-s", "INFO" ], [
+            _line for _line in LOG_LINES if "[ERROR]" in _line or
+            "[INFO]" in _line
+        ]),
+        ([ "-l", "Other" ], LOG_LINES[1::2]),
+        ([ "-s", "DEBUG", "-l", "Other" ], []),
+        ([ "-c", f"{DEFAULT_LOG_STRING} 12" ], [
+            LOG_LINES[12],
+            *LOG_LINES[120:130]
+        ]),
+        ([ "-e", r" 2\d$" ], LOG_LINES[20:30]),
+        ([ "--since", "2025-01-01 10:04:00,000" ], LOG_LINES[240:]),
+        (
+            [
+                "--since", "2025-01-01T10:01:00",
+                "--until", "2025-01-01 10:01:10,000"
+            ],
+            LOG_LINES[60:70]
+        ),
+    ])
+    def test_query(self, args, expected, workers, tmp_path, capsys):
+        '''
+        Test the entries matching the filters are printed
+
+        Args:
+            args (list): The filter arguments
+            expected (list): The matching log lines
+            workers (int): The number of worker processes
+            tmp_path (Path): Temporary directory (fixture)
+            capsys (CaptureFixture): Output capture (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        _status = main([
+            _filename,
+            "-w", str(workers),
+            "--chunk-size", "1024",
+            *args
+        ])
+
+        assert _status == (0 if expected else 1)
+        assert capsys.readouterr().out.splitlines() == expected
+
+        assert main([ _filename, "--count", *args ]) == _status
+        assert capsys.readouterr().out == f"{len(expected)}\n"
+
+
+    #
+    # Output formats
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    def test_query_output(self, workers, tmp_path, capsys):
+        '''
+        Test the matching entries are exported as JSON lines and CSV
+
+        Args:
+            workers (int): The number of worker processes
+            tmp_path (Path): Temporary directory (fixture)
+            capsys (CaptureFixture): Output capture (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(LOG_LINES[:10]) + "\n")
+            f.write("Traceback (most recent call last):\n")
+
+        assert main([ _filename, "-s", "ERROR", "-o", "jsonl",
+                      "-w", str(workers) ]) == 0
+        _entries = [
+            json.loads(_line)
+            for _line in capsys.readouterr().out.splitlines()
+        ]
+
+        assert [ _entry["message"] for _entry in _entries ] == [
+            f"{DEFAULT_LOG_STRING} 3",
+            f"{DEFAULT_LOG_STRING} 7"
+        ]
+        assert _entries[0]["logger_name"] == "Other"
+        assert _entries[1]["timestamp"] - _entries[0]["timestamp"] == 4
+
+        assert main([ _filename, "-c", "Traceback", "-o", "csv",
+                      "-w", str(workers) ]) == 0
+        _lines = capsys.readouterr().out.splitlines()
+
+        assert _lines[0].startswith("time,logger_name,severity,")
+        assert _lines[1].startswith(
+            f"\"2025-01-01 10:00:09,000\",Other,INFO,"
+        )
+        assert _lines[2].startswith("Traceback")
+        assert len(_lines) == 3
+
+
+    #
+    # Line breaks in messages
+    #
+    def test_query_line_breaks(self, tmp_path, capsys):
+        '''
+        Test the log is only split on newlines, by the serial and parallel
+        search (a message may hold a carriage return)
+
+        Args:
+            tmp_path (Path): Temporary directory (fixture)
+            capsys (CaptureFixture): Output capture (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "wb") as f:
+            for _line in LOG_LINES:
+                f.write(f"{_line}\nValueError: bad\rX\x0c\n".encode())
+
+        _outputs = []
+        for _workers in ( [ "-w", "1" ], [ "-w", "2" ] ):
+            assert main([
+                _filename,
+                *_workers,
+                "--chunk-size", "2048",
+                "-s", "ERROR"
+            ]) == 0
+            _outputs.append(capsys.readouterr().out)
+
+        assert _outputs[0] == _outputs[1]
+        assert _outputs[0].count("ValueError: bad\rX\x0c\n") == 75
+
+
+    #
+    # Several (compressed) files
+    #
+    def test_query_files(self, tmp_path, capsys):
+        '''
+        Test the entries in several files are printed in file order
+
+        Args:
+            tmp_path (Path): Temporary directory (fixture)
+            capsys (CaptureFixture): Output capture (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _old = str(tmp_path / "test.log.1.gz")
+        with gzip.open(_old, "wt") as f:
+            f.write("\n".join(LOG_LINES[:100]) + "\n")
+
+        _current = str(tmp_path / "test.log")
+        with open(_current, "w") as f:
+            f.write("\n".join(LOG_LINES[100:]) + "\n")
+
+        for _workers in ( [ "-w", "1" ], [ "-w", "2" ], [] ):
+            assert main([
+                _old,
+                _current,
+                *_workers,
+                "--chunk-size", "2048",
+                "--since", "2025-01-01 10:01:30,000",
+                "--until", "2025-01-01 10:02:00,000"
+            ]) == 0
+            assert capsys.readouterr().out.splitlines() == LOG_LINES[90:120]
+
+        # Small queries are searched in this process
+        _files = [ _old, _current ]
+        _cpus = os.cpu_count() or 1
+        assert _auto_workers(_files) == 1
+        assert _auto_workers(_files, min_size=1024) == _cpus
+        assert _auto_workers(_files, min_files=2) == _cpus
+
+
+    #
+    # Invalid arguments
+    #
+    @pytest.mark.parametrize("args", [
+        [ "--since", "yesterday" ],
+        [ "-e", "(" ],
+        [ "-w", "-1" ],
+        [ "-o", "xml" ],
+    ])
+    def test_query_invalid(self, args, tmp_path, capsys):
+        '''
+        Test invalid arguments are rejected
+
+        Args:
+            args (list): The invalid arguments
+            tmp_path (Path): Temporary directory (fixture)
+            capsys (CaptureFixture): Output capture (fixture)
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "test.log")
+        with open(_filename, "w") as f:
+            f.write("\n".join(LOG_LINES) + "\n")
+
+        with pytest.raises(SystemExit):
+            main([ _filename, *args ])
+
+        with pytest.raises(SystemExit):
+            main([ str(tmp_path / "missing.log") ])
+
+        assert capsys.readouterr().out == ""
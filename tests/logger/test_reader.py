@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of log file readers
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+import os
+import gzip
+import logging
+import operator
+import datetime
+
+# Local app modules
+from applogging.logging import handler_to_timed_rotating_file
+from applogging.entry import iter_entries, scan_entries
+from applogging.reader import (
+    split_file,
+    iter_chunks_parallel,
+    reduce_parallel,
+    find_time_offset,
+    iter_entries_between,
+    rotation_files,
+    merge_entries
+)
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+LOG_LINES = [
+    (
+        f"2025-01-01 10:{_count // 60:02d}:{_count % 60:02d},000: "
+        f"[{LOGGER_NAME}] "
+        f"[{DEFAULT_LOG_SEVERITY}] {DEFAULT_LOG_STRING} {_count}"
+    )
+    for _count in range(500)
+]
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# Helpers
+#
+###########################################################################
+#
+# write_log_file
+#
+def write_log_file(filename: str, lines: list = LOG_LINES):
+    '''
+    Write lines to the log file
+
+    Args:
+        filename (str): The name of the log file
+        lines (list): The lines to write
+
+    Returns:
+        None
+
+    Raises:
+        None
+    '''
+    with open(filename, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+#
+# count_entries
+#
+def count_entries(columns: dict) -> int:
+    '''
+    Count the entries in a set of columns (used as a map_func)
+
+    Args:
+        columns (dict): The decoded columns
+
+    Returns:
+        int: The number of entries
+
+    Raises:
+        None
+    '''
+    return len(columns["message"])
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Parallel parsing
+#
+class Test_Parallel():
+    '''
+    Test Class - Test parallel parsing of a log file
+
+    Attributes:
+        None
+    '''
+    #
+    # Split file
+    #
+    def test_split_file(self, logfile):
+        '''
+        Test the byte ranges cover the file and are aligned to lines
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        write_log_file(logfile)
+
+        with open(logfile, "rb") as f:
+            _data = f.read()
+
+        _ranges = split_file(logfile, chunk_size=1000)
+
+        assert len(_ranges) > 1
+        assert _ranges[0][0] == 0
+        assert _ranges[-1][1] == len(_data)
+
+        for (_, _end), (_start, _) in zip(_ranges[:-1], _ranges[1:]):
+            assert _end == _start
+            assert _data[_start - 1:_start] == b"\n"
+
+
+    #
+    # Ordered results
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    def test_iter_chunks_parallel(self, workers, logfile):
+        '''
+        Test chunks are decoded and returned in order
+
+        Args:
+            workers (int): The number of worker processes
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        write_log_file(logfile)
+
+        _messages = []
+        for _columns in iter_chunks_parallel(
+                logfile,
+                columns=[ "severity", "message" ],
+                workers=workers,
+                chunk_size=1000
+        ):
+            assert set(_columns["severity"]) == { DEFAULT_LOG_SEVERITY }
+            _messages.extend(_columns["message"])
+
+        assert _messages == [
+            f"{DEFAULT_LOG_STRING} {_count}" for _count in range(500)
+        ]
+
+
+    #
+    # Unordered reduction
+    #
+    def test_reduce_parallel(self, logfile):
+        '''
+        Test results from the workers are reduced
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        write_log_file(logfile)
+
+        _count = reduce_parallel(
+            logfile,
+            map_func=count_entries,
+            reduce_func=operator.add,
+            initial=0,
+            workers=2,
+            chunk_size=1000
+        )
+
+        assert _count == len(LOG_LINES)
+
+
+    #
+    # Entries spanning multiple lines
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    def test_iter_chunks_parallel_multiline(self, workers, logfile):
+        '''
+        Test entries spanning multiple lines are not split between ranges
+
+        Args:
+            workers (int): The number of worker processes
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _traceback = [ "Traceback (most recent call last):" ]
+        _traceback.extend([ f"  Frame {_count}" for _count in range(50) ])
+
+        _lines = []
+        for _line in LOG_LINES:
+            _lines.append(_line)
+            _lines.extend(_traceback)
+
+        write_log_file(logfile, lines=_lines)
+
+        _messages = []
+        for _columns in iter_chunks_parallel(
+                logfile,
+                columns=[ "message" ],
+                workers=workers,
+                chunk_size=1000
+        ):
+            _messages.extend(_columns["message"])
+
+        assert len(_messages) == len(LOG_LINES)
+        for _message in _messages:
+            assert _message.endswith("  Frame 49")
+
+
+#
+# Time range
+#
+class Test_TimeRange():
+    '''
+    Test Class - Test reading the entries in a time range
+
+    Attributes:
+        None
+    '''
+    #
+    # Entries between times
+    #
+    @pytest.mark.parametrize("start, end, expected", [
+        ( "2025-01-01 10:01:40,000", "2025-01-01 10:01:45,000", (100, 105) ),
+        ( None, "2025-01-01 10:00:03,000", (0, 3) ),
+        ( "2025-01-01 10:08:15,500", None, (496, 500) ),
+        ( "2025-01-01 09:00:00,000", "2025-01-01 10:00:01,000", (0, 1) ),
+        ( "2025-01-01 11:00:00,000", None, (0, 0) )
+    ])
+    def test_iter_entries_between(self, start, end, expected, logfile):
+        '''
+        Test the entries in a time range are returned
+
+        Args:
+            start (str): The start of the range
+            end (str): The end of the range
+            expected (tuple): The range of entries expected
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        # One entry per second, each followed by a traceback
+        _lines = []
+        for _line in LOG_LINES:
+            _lines.append(_line)
+            _lines.extend([ "Traceback:", "  Line 1", "  Line 2" ])
+
+        write_log_file(logfile, lines=_lines)
+
+        _entries = list(iter_entries_between(logfile, start=start, end=end))
+
+        assert [ _e.message.split("\n")[0] for _e in _entries ] == [
+            f"{DEFAULT_LOG_STRING} {_count}" for _count in range(*expected)
+        ]
+
+
+    #
+    # Time values
+    #
+    def test_find_time_offset(self, logfile):
+        '''
+        Test times can be timestamps, datetimes or strings
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        write_log_file(logfile)
+        _start = datetime.datetime(2025, 1, 1, 10, 0, 30)
+
+        with open(logfile, "rb") as f:
+            _offset = find_time_offset(f, start=_start)
+
+            assert _offset == find_time_offset(f, start=_start.timestamp())
+            assert _offset == find_time_offset(
+                f,
+                start="2025-01-01 10:00:30,000"
+            )
+
+            f.seek(_offset)
+            assert f.readline().startswith(b"2025-01-01 10:00:30,000")
+
+            with pytest.raises(ValueError):
+                find_time_offset(f, start="Not a time")
+
+
+#
+# Rotation sets
+#
+class Test_RotationSet():
+    '''
+    Test Class - Test reading the files in a rotation set
+
+    Attributes:
+        None
+    '''
+    #
+    # Find the rotated files
+    #
+    def test_rotation_files(self, tmp_path):
+        '''
+        Test the rotated files are found, oldest first
+
+        Args:
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log")
+        for _name in [
+                "app.log.2026-10-11", "app.log.2026-10-04", "app.log",
+                "app.log.old", "app.log.idx", "other.log.2026-10-04"
+        ]:
+            (tmp_path / _name).write_text("")
+
+        assert rotation_files(_filename) == [
+            f"{_filename}.2026-10-04",
+            f"{_filename}.2026-10-11",
+            _filename
+        ]
+
+        (tmp_path / "app.log").unlink()
+        assert rotation_files(_filename)[-1] == f"{_filename}.2026-10-11"
+
+
+    #
+    # Merge files in time order
+    #
+    @pytest.mark.parametrize("lazy", [ True, False ])
+    def test_merge_entries(self, lazy, tmp_path):
+        '''
+        Test entries from a number of files are merged in time order
+
+        Args:
+            lazy (bool): Decode the entries when first accessed
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        # A rotation set, and a file from another service overlapping it
+        _filename = str(tmp_path / "app.log")
+        write_log_file(f"{_filename}.2026-10-04", LOG_LINES[:100])
+        write_log_file(_filename, LOG_LINES[100:200:2])
+        write_log_file(
+            str(tmp_path / "other.log"),
+            LOG_LINES[101:300:2] + [ "Traceback:", "  Line 1" ]
+        )
+
+        _files = rotation_files(_filename) + [ str(tmp_path / "other.log") ]
+        _entries = list(merge_entries(_files, lazy=lazy))
+
+        _numbers = [
+            int(_e.message.split("\n")[0].split()[-1]) for _e in _entries
+        ]
+        assert _numbers == list(range(200)) + list(range(201, 300, 2))
+        assert _entries[-1].message.endswith("Traceback:\n  Line 1")
+
+        _timestamps = [ _e.timestamp for _e in _entries ]
+        assert _timestamps == sorted(_timestamps)
+
+        assert not list(merge_entries([]))
+
+
+#
+# Compressed log files
+#
+class Test_Compressed():
+    '''
+    Test Class - Test compressing rotated log files and reading them
+
+    Attributes:
+        None
+    '''
+    #
+    # Compress on rotation
+    #
+    def test_compress_rotated(self, tmp_path):
+        '''
+        Test the rotated files are compressed, and found in the rotation set
+
+        Args:
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log")
+        _handler = handler_to_timed_rotating_file(
+            filename=_filename,
+            compress=True
+        )
+        _log = logging.getLogger(f"{LOGGER_NAME}.compress")
+        _log.propagate = False
+        _log.setLevel(level="DEBUG")
+        _log.addHandler(_handler)
+
+        try:
+            _log.info("1")
+            _handler.doRollover()
+            _log.info("2")
+            _handler.rotator.wait()
+
+        finally:
+            _log.removeHandler(_handler)
+            _handler.close()
+
+        _files = rotation_files(_filename)
+        assert len(_files) == 2
+        assert _files[0].endswith(".gz")
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            os.path.basename(_f) for _f in _files
+        )
+
+        with gzip.open(_files[0], "rt") as f:
+            assert f.read().endswith("1\n")
+
+        assert [ _e.message for _e in merge_entries(_files) ] == [ "1", "2" ]
+
+
+    #
+    # Backups kept while compressing
+    #
+    @pytest.mark.parametrize("copies", [ 1, 3 ])
+    def test_compress_backup_count(self, copies, tmp_path):
+        '''
+        Test the number of backups kept when rolling over repeatedly,
+        without waiting for compression
+
+        Args:
+            copies (int): The number of backups to keep
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log")
+        _handler = handler_to_timed_rotating_file(
+            filename=_filename,
+            copies=copies,
+            compress=True
+        )
+        _log = logging.getLogger(f"{LOGGER_NAME}.compress")
+        _log.propagate = False
+        _log.setLevel(level="DEBUG")
+        _log.addHandler(_handler)
+
+        try:
+            # Each rollover is named for the day before the next one.  The
+            # files are large enough to still be compressing when the next
+            # rollover happens
+            _start = _handler.rolloverAt
+            _padding = os.urandom(1024 * 1024).hex()
+            for _day in range(8):
+                _log.info(str(_day))
+                _log.debug(_padding)
+                _handler.rolloverAt = _start + (_day + 1) * 86400
+                _handler.doRollover()
+
+            _log.info("8")
+            _handler.rotator.wait()
+
+        finally:
+            _log.removeHandler(_handler)
+            _handler.close()
+
+        _files = rotation_files(_filename)
+        assert len(_files) == copies + 1
+        assert all(_f.endswith(".gz") for _f in _files[:-1])
+        assert len(os.listdir(tmp_path)) == copies + 1
+
+        # The newest backups are kept
+        _messages = [
+            _e.message for _e in merge_entries(_files)
+            if _e.message != _padding
+        ]
+        assert _messages == [ str(_i) for _i in range(8 - copies, 9) ]
+
+
+    #
+    # Read compressed files
+    #
+    @pytest.mark.parametrize("workers", [ 1, 2 ])
+    def test_read_compressed(self, workers, tmp_path):
+        '''
+        Test the readers decompress log files
+
+        Args:
+            workers (int): The number of worker processes
+            tmp_path (pathlib.Path): Fixture providing a temporary directory
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _filename = str(tmp_path / "app.log.gz")
+        _lines = []
+        for _line in LOG_LINES:
+            _lines.append(_line)
+            if _line.endswith("3"): _lines.extend([ "Traceback:", "  Line 1" ])
+
+        with gzip.open(_filename, "wt") as f:
+            f.write("\n".join(_lines) + "\n")
+
+        assert len(list(iter_entries(_filename))) == len(LOG_LINES)
+
+        _entries = list(scan_entries(_filename, search=rb"(?m) 49\d$"))
+        assert [ _e.message.split()[-1] for _e in _entries ] == [
+            str(_count) for _count in range(490, 500)
+        ]
+
+        _entries = list(iter_entries_between(
+            _filename,
+            start="2025-01-01 10:01:00,000",
+            end="2025-01-01 10:02:00,000"
+        ))
+        assert len(_entries) == 60
+        assert _entries[0].message.endswith(" 60")
+
+        _counts = list(iter_chunks_parallel(
+            _filename,
+            columns=[ "message" ],
+            workers=workers,
+            chunk_size=4096,
+            map_func=count_entries
+        ))
+        assert len(_counts) > 1
+        assert sum(_counts) == len(LOG_LINES)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of message template mining
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+
+# Local app modules
+from applogging.entry import iter_entries
+from applogging.templates import WILDCARD, TemplateMiner, iter_templates
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+MESSAGES = [
+    "Connected to 10.0.0.1 port 22",
+    "Disk /dev/sda1 is 91% full",
+    "Connected to 10.0.0.2 port 22",
+    "Disk /dev/sdb1 is 95% full",
+    "Connected to db-host port 5432",
+    "Cache cleared"
+]
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Template mining
+#
+class Test_Templates():
+    '''
+    Test Class - Test mining message templates
+
+    Attributes:
+        None
+    '''
+    #
+    # Add messages
+    #
+    def test_template_miner(self):
+        '''
+        Test messages are clustered into templates with parameters
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _miner = TemplateMiner()
+
+        _results = [ _miner.add(_message) for _message in MESSAGES ]
+
+        assert _results == [
+            ( 1, () ),
+            ( 2, () ),
+            ( 1, ( "10.0.0.2", ) ),
+            ( 2, ( "/dev/sdb1", "95%" ) ),
+            ( 1, ( "db-host", "5432" ) ),
+            ( 3, () )
+        ]
+
+        assert len(_miner) == 3
+        assert _miner.template(1) == (
+            f"Connected to {WILDCARD} port {WILDCARD}"
+        )
+        assert _miner.template(2) == f"Disk {WILDCARD} is {WILDCARD} full"
+        assert _miner.template(3) == "Cache cleared"
+        assert _miner.template(4) is None
+        assert _miner.counts == { 1: 3, 2: 2, 3: 1 }
+
+        # The least recently used first
+        assert list(_miner.templates) == [ 2, 1, 3 ]
+
+        # Messages with a different number of tokens are not clustered
+        assert _miner.add("Connected to 10.0.0.3 port 22 again")[0] == 4
+        assert _miner.add("")[0] == 5
+        assert _miner.add("  ") == ( 5, () )
+
+
+    #
+    # Match messages
+    #
+    def test_template_match(self):
+        '''
+        Test messages are matched without changing the templates
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _miner = TemplateMiner()
+        for _message in MESSAGES: _miner.add(_message)
+
+        _templates = _miner.templates
+        _counts = _miner.counts
+
+        assert _miner.match("Connected to 10.1.1.1 port 443") == (
+            1, ( "10.1.1.1", "443" )
+        )
+        assert _miner.match("Cache cleared") == ( 3, () )
+        assert _miner.match("Cache not cleared") is None
+        assert _miner.match("Disk /dev/sda1 was 91% full") is None
+        assert _miner.match("Unknown message") is None
+
+        assert _miner.templates == _templates
+        assert _miner.counts == _counts
+
+
+    #
+    # Limits
+    #
+    def test_template_limits(self):
+        '''
+        Test the number of templates, and children of a node, are limited
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _miner = TemplateMiner(max_templates=2)
+
+        _miner.add("Job started")
+        _miner.add("Cache cleared")
+        _miner.add("Job started")
+        assert _miner.add("Service stopped") == ( 3, () )
+
+        # The least recently used template is discarded
+        assert list(_miner.templates) == [ 1, 3 ]
+        assert _miner.match("Cache cleared") is None
+        assert _miner.add("Cache cleared") == ( 4, () )
+
+        # The nodes of discarded templates are removed from the tree
+        _miner = TemplateMiner(max_templates=1)
+        for _count in range(1, 10):
+            _miner.add(f"Job {'x' * _count} started")
+
+        _children = _miner._root.children
+        assert list(_children) == [ 3 ]
+        assert list(_children[3].children) == [ "Job" ]
+        assert list(_children[3].children["Job"].children) == [ "x" * 9 ]
+
+        _miner.add("Cache cleared")
+        assert list(_miner._root.children) == [ 2 ]
+        assert _miner.add("Job started") == ( 11, () )
+
+        # Once a node is full, new tokens are routed to the wildcard and
+        # can be clustered
+        _miner = TemplateMiner(max_children=2, max_templates=None)
+        assert _miner.add("alpha request done")[0] == 1
+        assert _miner.add("beta request done")[0] == 2
+        assert _miner.add("gamma request done") == ( 2, ( "gamma", ) )
+        assert _miner.template(2) == f"{WILDCARD} request done"
+
+        for _args in [
+                { "depth": 2 },
+                { "similarity": 1.5 },
+                { "max_children": 1 },
+                { "max_templates": 0 }
+        ]:
+            with pytest.raises(AssertionError):
+                TemplateMiner(**_args)
+
+
+    #
+    # Log entries
+    #
+    def test_iter_templates(self, logfile):
+        '''
+        Test the messages of log entries are mined as they are read
+
+        Args:
+            logfile (str): Fixture managing the log file used during testing
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        with open(logfile, "w") as f:
+            for _count, _message in enumerate(MESSAGES):
+                f.write(
+                    f"2025-01-01 10:00:{_count:02d},000: [{LOGGER_NAME}] "
+                    f"[{DEFAULT_LOG_SEVERITY}] {_message}\n"
+                )
+
+        _miner = TemplateMiner()
+        _results = list(iter_templates(iter_entries(logfile), miner=_miner))
+
+        assert [ _entry.message for _entry, _, _ in _results ] == MESSAGES
+        assert [ _id for _, _id, _ in _results ] == [ 1, 2, 1, 2, 1, 3 ]
+        assert _results[4][2] == ( "db-host", "5432" )
+        assert len(_miner) == 3
+
+        # A new miner is used if none is given
+        assert len(list(iter_templates(iter_entries(logfile)))) == 6
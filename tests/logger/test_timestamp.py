@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+'''
+PyTest - Test of timestamp decoding
+
+Copyright (C) 2025 Jason Piszcyk
+Email: Jason.Piszcyk@gmail.com
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (See file: COPYING). If not, see
+<https://www.gnu.org/licenses/>.
+'''
+###########################################################################
+#
+# Imports
+#
+###########################################################################
+# Shared variables, constants, etc
+from tests.constants import *
+
+# System Modules
+import pytest
+import datetime
+
+# Local app modules
+from applogging.timestamp import AsctimeDecoder
+
+# Imports for python variable type hints
+
+
+###########################################################################
+#
+# Module Specific Items
+#
+###########################################################################
+#
+# Types
+#
+
+#
+# Constants
+#
+ASCTIME_FORMAT = "%Y-%m-%d %H:%M:%S,%f"
+
+#
+# Global Variables
+#
+
+
+###########################################################################
+#
+# The tests...
+#
+###########################################################################
+#
+# Decode asctime
+#
+class Test_AsctimeDecoder():
+    '''
+    Test Class - Test decoding asctime strings
+
+    Attributes:
+        None
+    '''
+    #
+    # Valid times
+    #
+    @pytest.mark.parametrize("asctime", [
+        "2025-01-01 10:00:00,000",
+        "2025-01-01 10:00:00,123",
+        "2025-01-01 10:00:00,999",
+        "2025-06-30 23:59:59,500",
+        "2024-02-29 00:00:00,001"
+    ])
+    def test_decode(self, asctime):
+        '''
+        Test times are decoded the same as datetime.strptime
+
+        Args:
+            asctime (str): The time string to decode
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _decoder = AsctimeDecoder()
+        _expected = datetime.datetime.strptime(asctime, ASCTIME_FORMAT)
+
+        # Decode twice - The second time uses the cached second
+        assert _decoder.decode(asctime) == pytest.approx(_expected.timestamp())
+        assert _decoder.decode(asctime) == pytest.approx(_expected.timestamp())
+
+        # UTC
+        _decoder = AsctimeDecoder(utc=True)
+        _expected = _expected.replace(tzinfo=datetime.timezone.utc)
+        assert _decoder.decode(asctime) == pytest.approx(_expected.timestamp())
+
+
+    #
+    # Same second
+    #
+    def test_decode_same_second(self):
+        '''
+        Test only the milliseconds change within the same second
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _decoder = AsctimeDecoder()
+
+        _first = _decoder.decode("2025-01-01 10:00:00,000")
+        _second = _decoder.decode("2025-01-01 10:00:00,250")
+        _third = _decoder.decode("2025-01-01 10:00:01")
+
+        assert _second - _first == pytest.approx(0.25)
+        assert _third - _first == pytest.approx(1.0)
+
+
+    #
+    # Invalid times
+    #
+    @pytest.mark.parametrize("asctime", [
+        "",
+        "Not a time",
+        "2025-01-01T10:00:00,000",
+        "2025-13-01 10:00:00,000",
+        "2025-01-01 10:00:00,12",
+        "2025-01-01 10:00:00,abc",
+        "2025-01-01 10:00:00;000"
+    ])
+    def test_decode_invalid(self, asctime):
+        '''
+        Test invalid times are not decoded
+
+        Args:
+            asctime (str): The time string to decode
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError:
+                when test fails
+        '''
+        _decoder = AsctimeDecoder()
+
+        # Make sure the cache doesn't allow invalid times through
+        _decoder.decode("2025-01-01 10:00:00,000")
+
+        assert _decoder.decode(asctime) is None